@@ -0,0 +1,44 @@
+"""Benchmark the amplitude moment aggregations against ``scipy.stats``.
+
+Run it with ``python benchmarks/statistical.py`` or ``make benchmark``.
+"""
+
+import timeit
+
+import numpy as np
+import scipy.stats
+
+from sigpro.aggregations.amplitude.statistical import kurtosis, skew
+
+WINDOW_SIZES = (64, 256, 1024)
+REPEAT = 5
+NUMBER = 2000
+
+
+def _time_per_call(function, values):
+    """Return the best time per call in microseconds."""
+    timer = timeit.Timer(lambda: function(values))
+    return min(timer.repeat(repeat=REPEAT, number=NUMBER)) / NUMBER * 1e6
+
+
+def run_benchmark():
+    """Print the time per call of the SigPro and SciPy implementations."""
+    rng = np.random.default_rng(0)
+    functions = [
+        ('skew', skew, scipy.stats.skew),
+        ('kurtosis', kurtosis, scipy.stats.kurtosis),
+    ]
+
+    print(f'{"function":<10}{"size":>6}{"sigpro (us)":>14}{"scipy (us)":>14}{"speedup":>10}')
+    for name, function, scipy_function in functions:
+        for window_size in WINDOW_SIZES:
+            values = rng.normal(size=window_size)
+            sigpro_time = _time_per_call(function, values)
+            scipy_time = _time_per_call(scipy_function, values)
+            speedup = scipy_time / sigpro_time
+            print(f'{name:<10}{window_size:>6}{sigpro_time:>14.2f}{scipy_time:>14.2f}'
+                  f'{speedup:>9.1f}x')
+
+
+if __name__ == '__main__':
+    run_benchmark()
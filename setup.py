@@ -18,6 +18,10 @@ install_requires = [
     'scipy>=1.11.3',
 ]
 
+parquet_requires = [
+    'pyarrow>=14.0.1',
+]
+
 setup_requires = [
     'pytest-runner>=2.11.1',
 ]
@@ -27,7 +31,7 @@ tests_require = [
     'pytest-cov>=4.1.0',
     'jupyter>=1.0.0,<2',
     'rundoc>=0.4.3,<0.5',
-]
+] + parquet_requires
 
 development_requires = [
     # general
@@ -97,6 +101,7 @@ setup(
         ],
     },
     extras_require={
+        'parquet': parquet_requires,
         'test': tests_require,
         'dev': development_requires + tests_require,
     },
@@ -0,0 +1,197 @@
+"""Amplitude online aggregations module."""
+
+import numpy as np
+
+
+class MomentAccumulator:
+    """Accumulate the statistical moments of a signal incrementally.
+
+    The signal is consumed in chunks with ``update``, keeping only the number of
+    values, their mean, the sums of the 2nd, 3rd and 4th powers of their deviations
+    from the mean and their maximum absolute value. Accumulators built over different
+    parts of a signal can be combined exactly with ``merge``, following the pairwise
+    update formulas of Chan et al. and Terriberry, so very long windows can be split
+    across chunks or parallel shards without keeping them in memory.
+
+    The moments are computed along the last axis, so chunks shaped ``(..., n)`` are
+    accumulated independently for each one of the leading positions. The values are
+    expected to be real.
+
+    Attributes:
+        count (int):
+            Number of accumulated values.
+        mean_value (float or numpy.ndarray):
+            Mean of the accumulated values.
+        moment2, moment3, moment4 (float or numpy.ndarray):
+            Sums of the 2nd, 3rd and 4th powers of the deviations from the mean.
+        max_abs (float or numpy.ndarray):
+            Maximum absolute value of the accumulated values.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean_value = 0.0
+        self.moment2 = 0.0
+        self.moment3 = 0.0
+        self.moment4 = 0.0
+        self.max_abs = 0.0
+
+    @classmethod
+    def from_values(cls, amplitude_values):
+        """Create an accumulator with the moments of the given values."""
+        accumulator = cls()
+        accumulator.update(amplitude_values)
+        return accumulator
+
+    def update(self, amplitude_values):
+        """Add a chunk of values to the accumulator.
+
+        Args:
+            amplitude_values (numpy.ndarray):
+                Array of floats representing a chunk of the signal values.
+
+        Returns:
+            MomentAccumulator:
+                The accumulator itself.
+        """
+        amplitude_values = np.asarray(amplitude_values, dtype=np.float64)
+        if not amplitude_values.shape[-1]:
+            return self
+
+        chunk = MomentAccumulator()
+        chunk.count = amplitude_values.shape[-1]
+        chunk.mean_value = np.mean(amplitude_values, axis=-1)
+        deviations = amplitude_values - chunk.mean_value[..., np.newaxis]
+        squared = deviations * deviations
+        chunk.moment2 = np.sum(squared, axis=-1)
+        chunk.moment3 = np.sum(squared * deviations, axis=-1)
+        chunk.moment4 = np.sum(squared * squared, axis=-1)
+        chunk.max_abs = np.max(np.abs(amplitude_values), axis=-1)
+
+        return self.merge(chunk)
+
+    def merge(self, other):
+        """Combine the moments of another accumulator into this one.
+
+        Args:
+            other (MomentAccumulator):
+                Accumulator built over another part of the signal.
+
+        Returns:
+            MomentAccumulator:
+                The accumulator itself.
+        """
+        if not other.count:
+            return self
+
+        if not self.count:
+            self.__dict__.update(other.__dict__)
+            return self
+
+        count_a, count_b = self.count, other.count
+        count = count_a + count_b
+        delta = other.mean_value - self.mean_value
+        delta_n = delta / count
+        delta_n2 = delta_n * delta_n
+        term = delta * delta_n * count_a * count_b
+
+        moment4 = self.moment4 + other.moment4
+        moment4 += term * delta_n2 * (count_a * count_a - count_a * count_b + count_b * count_b)
+        moment4 += 6 * delta_n2 * (
+            count_a * count_a * other.moment2 + count_b * count_b * self.moment2)
+        moment4 += 4 * delta_n * (count_a * other.moment3 - count_b * self.moment3)
+
+        moment3 = self.moment3 + other.moment3
+        moment3 += term * delta_n * (count_a - count_b)
+        moment3 += 3 * delta_n * (count_a * other.moment2 - count_b * self.moment2)
+
+        self.moment4 = moment4
+        self.moment3 = moment3
+        self.moment2 = self.moment2 + other.moment2 + term
+        self.mean_value = self.mean_value + delta_n * count_b
+        self.max_abs = np.maximum(self.max_abs, other.max_abs)
+        self.count = count
+
+        return self
+
+    def _check_count(self):
+        if not self.count:
+            raise ValueError('No values have been accumulated')
+
+    def mean(self):
+        """Return the mean value of the accumulated values."""
+        self._check_count()
+        return self.mean_value
+
+    def var(self):
+        """Return the variance of the accumulated values."""
+        self._check_count()
+        return self.moment2 / self.count
+
+    def std(self):
+        """Return the standard deviation of the accumulated values."""
+        return np.sqrt(self.var())
+
+    def rms(self):
+        """Return the RMS (Root Mean Square) of the accumulated values."""
+        return np.sqrt(self.var() + self.mean_value * self.mean_value)
+
+    def crest_factor(self):
+        """Return the ratio of the peak to the RMS of the accumulated values."""
+        return self.max_abs / self.rms()
+
+    def skew(self):
+        """Return the sample skewness of the accumulated values.
+
+        If all values are equal, return ``0``.
+        """
+        self._check_count()
+        constant = self.moment2 == 0
+        moment2 = np.where(constant, 1.0, self.moment2)
+        return np.where(constant, 0.0, np.sqrt(self.count) * self.moment3 / moment2 ** 1.5)[()]
+
+    def kurtosis(self, fisher=True, bias=True):
+        """Return the kurtosis, Fisher or Pearson, of the accumulated values.
+
+        Args:
+            fisher (bool):
+                If ``True``, Fisher’s definition is used (normal ==> 0.0). If ``False``,
+                Pearson’s definition is used (normal ==> 3.0). Defaults to ``True``.
+            bias (bool):
+                If ``False``, then the calculations are corrected for statistical bias.
+                Defaults to ``True``.
+
+        Returns:
+            float or numpy.ndarray:
+                The kurtosis value of the accumulated values. If all values are equal,
+                return `-3` for Fisher's definition and `0` for Pearson's definition.
+        """
+        self._check_count()
+        count = self.count
+        constant = self.moment2 == 0
+        moment2 = np.where(constant, 1.0, self.moment2)
+        kurtosis = count * self.moment4 / (moment2 * moment2)
+        if not bias and count > 3:
+            kurtosis = (count * count - 1) * kurtosis - 3 * (count - 1) ** 2
+            kurtosis = kurtosis / ((count - 2) * (count - 3)) + 3
+
+        kurtosis = np.where(constant, 0.0, kurtosis)
+        return np.asarray(kurtosis - 3 if fisher else kurtosis)[()]
+
+    def finalize(self):
+        """Compute the amplitude statistics of the accumulated values.
+
+        Returns:
+            dict:
+                A dict with the ``mean``, ``var``, ``std``, ``rms``, ``crest_factor``,
+                ``skew`` and ``kurtosis`` values.
+        """
+        return {
+            'mean': self.mean(),
+            'var': self.var(),
+            'std': self.std(),
+            'rms': self.rms(),
+            'crest_factor': self.crest_factor(),
+            'skew': self.skew(),
+            'kurtosis': self.kurtosis(),
+        }
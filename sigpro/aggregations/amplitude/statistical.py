@@ -1,7 +1,8 @@
 """Amplitude statistical module."""
 
 import numpy as np
-import scipy.stats
+
+from sigpro.dtypes import get_accumulator_dtype
 
 
 def mean(amplitude_values):
@@ -15,7 +16,7 @@ def mean(amplitude_values):
        float:
            `mean` value of the input array.
     """
-    return np.mean(amplitude_values)
+    return np.mean(amplitude_values, axis=-1, dtype=get_accumulator_dtype(amplitude_values))
 
 
 def std(amplitude_values):
@@ -29,7 +30,7 @@ def std(amplitude_values):
        float:
            `std` value of the input array.
     """
-    return np.std(amplitude_values)
+    return np.std(amplitude_values, axis=-1, dtype=get_accumulator_dtype(amplitude_values))
 
 
 def var(amplitude_values):
@@ -43,7 +44,7 @@ def var(amplitude_values):
        float:
            `std` value of the input array.
     """
-    return np.var(amplitude_values)
+    return np.var(amplitude_values, axis=-1, dtype=get_accumulator_dtype(amplitude_values))
 
 
 def rms(amplitude_values):
@@ -57,7 +58,9 @@ def rms(amplitude_values):
        float:
            RMS of the input array.
     """
-    return np.sqrt((np.array(amplitude_values) ** 2).mean())
+    amplitude_values = np.asarray(amplitude_values)
+    dtype = get_accumulator_dtype(amplitude_values)
+    return np.sqrt(np.mean(amplitude_values ** 2, axis=-1, dtype=dtype))
 
 
 def crest_factor(amplitude_values):
@@ -73,27 +76,73 @@ def crest_factor(amplitude_values):
         float:
             The crest factor of the inputted values.
     """
-    peak = max(np.abs(amplitude_values))
+    peak = np.max(np.abs(amplitude_values), axis=-1)
     return peak / rms(amplitude_values)
 
 
-def skew(amplitude_values):
+def _get_central_moments(amplitude_values, order):
+    """Compute the 2nd and a higher order central moment along the last axis.
+
+    The moments are accumulated in double precision and the complex values are not
+    conjugated, so the 2nd moment is the mean of the squared deviations and not of
+    their squared magnitudes.
+
+    Returns:
+        tuple:
+            * `moment2 (float or numpy.ndarray)`
+            * `moment (float or numpy.ndarray)`
+            * `constant (bool or numpy.ndarray)`: whether the deviations of the signal
+              are within the floating point resolution.
+    """
+    amplitude_values = np.asarray(amplitude_values)
+    dtype = get_accumulator_dtype(amplitude_values)
+    mean_value = np.mean(amplitude_values, axis=-1, keepdims=True, dtype=dtype)
+    deviations = amplitude_values - mean_value
+    squared = deviations * deviations
+    moment2 = np.mean(squared, axis=-1)
+    power = squared * deviations if order == 3 else squared * squared
+    moment = np.mean(power, axis=-1)
+
+    resolution = np.finfo(dtype).resolution
+    constant = np.abs(moment2) <= (resolution * np.abs(mean_value[..., 0])) ** 2
+
+    return moment2, moment, constant
+
+
+def skew(amplitude_values, bias=True):
     """Compute the sample skewness of an array of values.
 
+    The skewness is computed along the last axis, so a 2D array with one signal per row
+    is processed at once.
+
     Args:
         amplitude_values (numpy.ndarray):
             Array of floats representing signal values.
+        bias (bool):
+            If ``False``, then the calculations are corrected for statistical bias.
+            Defaults to ``True``.
 
     Returns:
        float:
-           The skewness value of the input array.
+           The skewness value of the input array. If all values are equal, return `0`.
     """
-    return scipy.stats.skew(amplitude_values)
+    moment2, moment3, constant = _get_central_moments(amplitude_values, 3)
+    moment2 = np.where(constant, 1, moment2)
+    skew_value = moment3 / moment2 ** 1.5
+
+    count = np.shape(amplitude_values)[-1]
+    if not bias and count > 2:
+        skew_value = skew_value * np.sqrt((count - 1) * count) / (count - 2)
+
+    return np.where(constant, 0, skew_value)[()]
 
 
 def kurtosis(amplitude_values, fisher=True, bias=True):
     """Compute the kurtosis ,Fisher or Pearson, of an array of values.
 
+    The kurtosis is computed along the last axis, so a 2D array with one signal per row
+    is processed at once.
+
     Args:
         amplitude_values (numpy.ndarray):
             Array of floats representing signal values.
@@ -109,4 +158,15 @@ def kurtosis(amplitude_values, fisher=True, bias=True):
            The kurtosis value of the input array. If all values are equal, return
            `-3` for Fisher's definition and `0` for Pearson's definition.
     """
-    return scipy.stats.kurtosis(amplitude_values, fisher=fisher, bias=bias)
+    moment2, moment4, constant = _get_central_moments(amplitude_values, 4)
+    moment2 = np.where(constant, 1, moment2)
+    kurtosis_value = moment4 / moment2 ** 2.0
+
+    count = np.shape(amplitude_values)[-1]
+    if not bias and count > 3:
+        correction = 1.0 / (count - 2) / (count - 3)
+        kurtosis_value = (count ** 2 - 1.0) * kurtosis_value - 3 * (count - 1) ** 2.0
+        kurtosis_value = correction * kurtosis_value + 3
+
+    kurtosis_value = np.where(constant, 0, kurtosis_value)
+    return np.asarray(kurtosis_value - 3 if fisher else kurtosis_value)[()]
@@ -0,0 +1 @@
+"""SigPro Aggregations Comparative module."""
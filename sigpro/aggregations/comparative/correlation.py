@@ -0,0 +1,61 @@
+"""SigPro Aggregations Comparative Correlation module."""
+
+import numpy as np
+import scipy.fft
+
+from sigpro.channels import get_channel_pairs
+
+
+def cross_correlation(amplitude_values, sampling_frequency):
+    """Find the lag with the highest cross-correlation of each pair of channels.
+
+    The cross-correlation of every lag is computed through the FFT of each channel,
+    which is computed once and zero padded to avoid the circular wrap around, so its
+    cost is ``O(n log n)`` instead of ``O(n²)``. The mean of each channel is removed
+    first and the cross-correlation is normalized by the energy of both channels.
+
+    The channels are expected along the second to last axis, so an array with
+    shape ``(..., channels, samples)`` returns arrays with shape ``(..., pairs)``.
+    A positive lag means that the second channel of the pair is delayed with
+    respect to the first one.
+
+    Args:
+        amplitude_values (np.ndarray):
+            A numpy array with the signal values of each channel.
+        sampling_frequency (int or float):
+            Sampling frequency value passed in Hz.
+
+    Returns:
+        tuple:
+            * `lag_value (numpy.ndarray)`: lag, in seconds, of the highest absolute
+              cross-correlation of each pair of channels.
+            * `correlation_value (numpy.ndarray)`: normalized cross-correlation, between
+              -1 and 1, at that lag.
+    """
+    amplitude_values = np.asarray(amplitude_values, dtype=np.float64)
+    if amplitude_values.ndim < 2:
+        raise ValueError('Comparative primitives need a 2D array with one channel per row')
+
+    length = amplitude_values.shape[-1]
+    deviations = amplitude_values - np.mean(amplitude_values, axis=-1, keepdims=True)
+    size = scipy.fft.next_fast_len(2 * length - 1, real=True)
+    spectra = np.fft.rfft(deviations, n=size, axis=-1)
+
+    first, second = get_channel_pairs(amplitude_values.shape[-2])
+    correlation = np.fft.irfft(
+        np.conj(spectra[..., first, :]) * spectra[..., second, :], n=size, axis=-1)
+
+    # Keep the positive lags, at the start, and the negative lags, at the end.
+    correlation = np.concatenate(
+        [correlation[..., :length], correlation[..., size - length + 1:]], axis=-1)
+    lags = np.concatenate([np.arange(length), np.arange(1 - length, 0)])
+
+    peak = np.argmax(np.abs(correlation), axis=-1)
+    peak_correlation = np.take_along_axis(correlation, peak[..., np.newaxis], axis=-1)[..., 0]
+
+    energy = np.sum(deviations * deviations, axis=-1)
+    norm = np.sqrt(energy[..., first] * energy[..., second])
+    correlation_value = np.divide(peak_correlation, norm, out=np.zeros_like(norm),
+                                  where=norm > 0)
+
+    return lags[peak] / sampling_frequency, correlation_value
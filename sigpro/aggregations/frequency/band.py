@@ -2,6 +2,8 @@
 
 import numpy as np
 
+from sigpro.dtypes import get_accumulator_dtype
+
 
 def band_mean(amplitude_values, frequency_values, min_frequency, max_frequency):
     """Compute the mean values for a specific band.
@@ -22,12 +24,13 @@ def band_mean(amplitude_values, frequency_values, min_frequency, max_frequency):
         float:
             Mean value for the given band.
     """
+    frequency_values = np.asarray(frequency_values)
     lower_frequency_than = frequency_values <= max_frequency
     higher_frequency_than = frequency_values >= min_frequency
-    selected_idx = np.where(higher_frequency_than & lower_frequency_than)
-    selected_values = amplitude_values[selected_idx]
+    selected_idx = np.ravel(np.where(higher_frequency_than & lower_frequency_than))
+    selected_values = np.asarray(amplitude_values)[..., selected_idx]
 
-    return np.mean(selected_values)
+    return np.mean(selected_values, axis=-1, dtype=get_accumulator_dtype(selected_values))
 
 
 def band_rms(amplitude_values, frequency_values, min_frequency, max_frequency):
@@ -51,10 +54,12 @@ def band_rms(amplitude_values, frequency_values, min_frequency, max_frequency):
         float:
             rms value for the given band.
     """
+    frequency_values = np.asarray(frequency_values)
     lower_frequency_than = frequency_values <= max_frequency
     higher_frequency_than = frequency_values >= min_frequency
 
     selected_idx = np.ravel(np.where(higher_frequency_than & lower_frequency_than))
-    selected_values = amplitude_values[selected_idx]
+    selected_values = np.asarray(amplitude_values)[..., selected_idx]
 
-    return np.sqrt(np.mean(np.square(selected_values)))
+    dtype = get_accumulator_dtype(selected_values)
+    return np.sqrt(np.mean(np.square(selected_values), axis=-1, dtype=dtype))
@@ -0,0 +1,89 @@
+"""Aggregations Frequency Time Band module."""
+
+# The time values are part of the frequency_time interface even if they are not used.
+# pylint: disable=unused-argument
+
+import numpy as np
+
+from sigpro.dtypes import get_accumulator_dtype
+
+
+def _band_energy_over_time(amplitude_values, frequency_values, min_frequency, max_frequency):
+    """Compute the energy of a band for each time segment of a spectrogram.
+
+    The spectrogram is expected to have the frequencies on the second to last axis and the
+    time segments on the last axis, so that batches of spectrograms are reduced at once.
+    """
+    amplitude_values = np.asarray(amplitude_values)
+    frequency_values = np.asarray(frequency_values)
+    mask = (frequency_values >= min_frequency) & (frequency_values <= max_frequency)
+
+    power = np.square(np.abs(amplitude_values[..., mask, :]))
+    return np.sum(power, axis=-2, dtype=get_accumulator_dtype(power))
+
+
+def band_energy(amplitude_values, frequency_values, time_values, min_frequency, max_frequency):
+    """Compute the average energy of a specific band over time.
+
+    Filter the spectrogram between a low and high band (inclusive), add up the squared
+    magnitudes of the selected frequencies for each time segment and average them over time.
+
+    Args:
+        amplitude_values (np.ndarray):
+            A numpy array with the spectrogram values, shaped ``(..., frequencies, times)``.
+        frequency_values (np.ndarray):
+            A numpy array with the frequency values.
+        time_values (np.ndarray):
+            A numpy array with the time values.
+        min_frequency (int or float):
+            Band minimum.
+        max_frequency (int or float):
+            Band maximum.
+
+    Returns:
+        float or np.ndarray:
+            Average band energy, or an array with one value per spectrogram if a batch
+            of spectrograms is given.
+    """
+    energy = _band_energy_over_time(
+        amplitude_values, frequency_values, min_frequency, max_frequency)
+
+    return np.mean(energy, axis=-1)
+
+
+def band_statistics(amplitude_values, frequency_values, time_values,
+                    min_frequency, max_frequency):
+    """Compute temporal statistics of the energy of a specific band.
+
+    Filter the spectrogram between a low and high band (inclusive), compute the energy
+    of the band for each time segment and return its mean, standard deviation, minimum
+    and maximum over time.
+
+    Args:
+        amplitude_values (np.ndarray):
+            A numpy array with the spectrogram values, shaped ``(..., frequencies, times)``.
+        frequency_values (np.ndarray):
+            A numpy array with the frequency values.
+        time_values (np.ndarray):
+            A numpy array with the time values.
+        min_frequency (int or float):
+            Band minimum.
+        max_frequency (int or float):
+            Band maximum.
+
+    Returns:
+        tuple:
+            * `mean_value (float or np.ndarray)`
+            * `std_value (float or np.ndarray)`
+            * `min_value (float or np.ndarray)`
+            * `max_value (float or np.ndarray)`
+    """
+    energy = _band_energy_over_time(
+        amplitude_values, frequency_values, min_frequency, max_frequency)
+
+    return (
+        np.mean(energy, axis=-1),
+        np.std(energy, axis=-1),
+        np.min(energy, axis=-1),
+        np.max(energy, axis=-1),
+    )
@@ -0,0 +1,54 @@
+"""Aggregations Frequency Time Spectrum module."""
+
+# The frequency and time values are part of the frequency_time interface.
+# pylint: disable=unused-argument
+
+import numpy as np
+
+from sigpro.dtypes import get_accumulator_dtype
+
+
+def mean_spectrum(amplitude_values, frequency_values, time_values):
+    """Compute the time averaged magnitude spectrum of a spectrogram.
+
+    Args:
+        amplitude_values (np.ndarray):
+            A numpy array with the spectrogram values, shaped ``(..., frequencies, times)``.
+        frequency_values (np.ndarray):
+            A numpy array with the frequency values.
+        time_values (np.ndarray):
+            A numpy array with the time values.
+
+    Returns:
+        np.ndarray:
+            Average magnitude of each frequency over time, shaped ``(..., frequencies)``.
+    """
+    magnitude = np.abs(np.asarray(amplitude_values))
+    return np.mean(magnitude, axis=-1, dtype=get_accumulator_dtype(magnitude))
+
+
+def spectral_flux(amplitude_values, frequency_values, time_values):
+    """Compute the average spectral flux of a spectrogram.
+
+    The spectral flux measures how quickly the spectrum changes. It is computed as the
+    euclidean distance between the magnitude spectra of consecutive time segments,
+    averaged over time.
+
+    Args:
+        amplitude_values (np.ndarray):
+            A numpy array with the spectrogram values, shaped ``(..., frequencies, times)``.
+        frequency_values (np.ndarray):
+            A numpy array with the frequency values.
+        time_values (np.ndarray):
+            A numpy array with the time values.
+
+    Returns:
+        float or np.ndarray:
+            Average spectral flux, or an array with one value per spectrogram if a batch
+            of spectrograms is given.
+    """
+    magnitude = np.abs(np.asarray(amplitude_values))
+    difference = np.diff(magnitude, axis=-1)
+    squared = np.sum(np.square(difference), axis=-2, dtype=get_accumulator_dtype(difference))
+
+    return np.mean(np.sqrt(squared), axis=-1)
@@ -22,6 +22,98 @@ class PowerSpectrum(primitive.AmplitudeTransformation):
         self.set_primitive_outputs(primitive_spec['output'])
 
 
+class IIRFilter(primitive.AmplitudeTransformation):
+    """
+    IIRFilter primitive class.
+
+    Filter the amplitude values with an IIR filter designed as second-order sections.
+
+    Args:
+        low (float or None):
+            Lower cutoff frequency in Hz. Defaults to ``None``.
+        high (float or None):
+            Higher cutoff frequency in Hz. Defaults to ``None``.
+        order (int):
+            Order of the filter. Defaults to 4.
+        ftype (str):
+            Type of IIR filter. Defaults to ``butter``.
+        max_ripple (float or None):
+            Maximum ripple in the passband in dB. Defaults to ``None``.
+        min_attenuation (float or None):
+            Minimum attenuation in the stopband in dB. Defaults to ``None``.
+        zero_phase (bool):
+            Whether to filter the values forward and backward. Defaults to ``False``.
+    """
+
+    def __init__(self, low=None, high=None, order=4, ftype='butter', max_ripple=None,
+                 min_attenuation=None, zero_phase=False):
+        super().__init__('sigpro.transformations.amplitude.filter.iir_filter', init_params={
+            'low': low, 'high': high, 'order': order, 'ftype': ftype, 'max_ripple': max_ripple,
+            'min_attenuation': min_attenuation, 'zero_phase': zero_phase})
+        self.set_primitive_inputs([{'name': 'amplitude_values', 'type': 'numpy.ndarray'},
+                                   {'name': 'sampling_frequency', 'type': 'float'}])
+        self.set_fixed_hyperparameters({'low': {'type': 'float', 'default': None},
+                                        'high': {'type': 'float', 'default': None},
+                                        'order': {'type': 'int', 'default': 4},
+                                        'ftype': {'type': 'str', 'default': 'butter'},
+                                        'max_ripple': {'type': 'float', 'default': None},
+                                        'min_attenuation': {'type': 'float', 'default': None},
+                                        'zero_phase': {'type': 'bool', 'default': False}})
+
+
+class FIRFilter(primitive.AmplitudeTransformation):
+    """
+    FIRFilter primitive class.
+
+    Filter the amplitude values with a FIR filter designed with the window method.
+
+    Args:
+        low (float or None):
+            Lower cutoff frequency in Hz. Defaults to ``None``.
+        high (float or None):
+            Higher cutoff frequency in Hz. Defaults to ``None``.
+        numtaps (int):
+            Length of the filter. Defaults to 101.
+        window (str):
+            Window function used to design the filter. Defaults to ``hamming``.
+        zero_phase (bool):
+            Whether to filter the values forward and backward. Defaults to ``False``.
+    """
+
+    def __init__(self, low=None, high=None, numtaps=101, window='hamming', zero_phase=False):
+        super().__init__('sigpro.transformations.amplitude.filter.fir_filter', init_params={
+            'low': low, 'high': high, 'numtaps': numtaps, 'window': window,
+            'zero_phase': zero_phase})
+        self.set_primitive_inputs([{'name': 'amplitude_values', 'type': 'numpy.ndarray'},
+                                   {'name': 'sampling_frequency', 'type': 'float'}])
+        self.set_fixed_hyperparameters({'low': {'type': 'float', 'default': None},
+                                        'high': {'type': 'float', 'default': None},
+                                        'numtaps': {'type': 'int', 'default': 101},
+                                        'window': {'type': 'str', 'default': 'hamming'},
+                                        'zero_phase': {'type': 'bool', 'default': False}})
+
+
+class Decimate(primitive.AmplitudeTransformation):
+    """
+    Decimate primitive class.
+
+    Reduce the sampling frequency of the amplitude values with a polyphase filter.
+
+    Args:
+        factor (int):
+            Decimation factor.
+    """
+
+    def __init__(self, factor):
+        super().__init__('sigpro.transformations.amplitude.filter.decimate',
+                         init_params={'factor': factor})
+        self.set_primitive_inputs([{'name': 'amplitude_values', 'type': 'numpy.ndarray'},
+                                   {'name': 'sampling_frequency', 'type': 'float'}])
+        self.set_primitive_outputs([{'name': 'amplitude_values', 'type': 'numpy.ndarray'},
+                                    {'name': 'sampling_frequency', 'type': 'float'}])
+        self.set_fixed_hyperparameters({'factor': {'type': 'int'}})
+
+
 class FFT(primitive.FrequencyTransformation):
     """FFT primitive class."""
 
@@ -65,6 +157,33 @@ class FrequencyBand(primitive.FrequencyTransformation):
         self.set_fixed_hyperparameters({'low': {'type': 'int'}, 'high': {'type': 'int'}})
 
 
+class Welch(primitive.FrequencyTransformation):
+    """
+    Welch primitive class.
+
+    Estimate the power spectral density by averaging the periodograms of
+    overlapping segments of the signal.
+
+    Args:
+        nperseg (int or None):
+            Length of each segment. Defaults to ``None``.
+        noverlap (int or None):
+            Number of samples to overlap between segments. Defaults to ``None``.
+        window (str):
+            Window function applied to each segment. Defaults to ``hann``.
+        average (str):
+            Method used to average the periodograms. Defaults to ``mean``.
+    """
+
+    def __init__(self, nperseg=None, noverlap=None, window='hann', average='mean'):
+        super().__init__('sigpro.transformations.frequency.welch.welch', init_params={
+            'nperseg': nperseg, 'noverlap': noverlap, 'window': window, 'average': average})
+        self.set_fixed_hyperparameters({'nperseg': {'type': 'int', 'default': None},
+                                        'noverlap': {'type': 'int', 'default': None},
+                                        'window': {'type': 'str', 'default': 'hann'},
+                                        'average': {'type': 'str', 'default': 'mean'}})
+
+
 class STFT(primitive.FrequencyTimeTransformation):
     """STFT primitive class."""
 
@@ -84,6 +203,52 @@ class STFTReal(primitive.FrequencyTimeTransformation):
                                     {"name": "frequency_values", "type": "numpy.ndarray"},
                                     {"name": "time_values", "type": "numpy.ndarray"}])
 
+
+class CSD(primitive.ComparativeTransformation):
+    """
+    CSD primitive class.
+
+    Estimate the cross power spectral density of each pair of channels with Welch's method.
+
+    Args:
+        nperseg (int or None):
+            Length of each segment. Defaults to ``None``.
+        noverlap (int or None):
+            Number of samples to overlap between segments. Defaults to ``None``.
+        window (str):
+            Window function applied to each segment. Defaults to ``hann``.
+    """
+
+    def __init__(self, nperseg=None, noverlap=None, window='hann'):
+        super().__init__('sigpro.transformations.comparative.spectral.csd', init_params={
+            'nperseg': nperseg, 'noverlap': noverlap, 'window': window})
+        self.set_fixed_hyperparameters({'nperseg': {'type': 'int', 'default': None},
+                                        'noverlap': {'type': 'int', 'default': None},
+                                        'window': {'type': 'str', 'default': 'hann'}})
+
+
+class Coherence(primitive.ComparativeTransformation):
+    """
+    Coherence primitive class.
+
+    Estimate the magnitude squared coherence of each pair of channels with Welch's method.
+
+    Args:
+        nperseg (int or None):
+            Length of each segment. Defaults to ``None``.
+        noverlap (int or None):
+            Number of samples to overlap between segments. Defaults to ``None``.
+        window (str):
+            Window function applied to each segment. Defaults to ``hann``.
+    """
+
+    def __init__(self, nperseg=None, noverlap=None, window='hann'):
+        super().__init__('sigpro.transformations.comparative.spectral.coherence', init_params={
+            'nperseg': nperseg, 'noverlap': noverlap, 'window': window})
+        self.set_fixed_hyperparameters({'nperseg': {'type': 'int', 'default': None},
+                                        'noverlap': {'type': 'int', 'default': None},
+                                        'window': {'type': 'str', 'default': 'hann'}})
+
 # Aggregations
 
 
@@ -136,11 +301,22 @@ class RMS(primitive.AmplitudeAggregation):
 
 
 class Skew(primitive.AmplitudeAggregation):
-    """Skew primitive class."""
+    """
+    Skew primitive class.
 
-    def __init__(self):
-        super().__init__('sigpro.aggregations.amplitude.statistical.skew')
+    Computes the skewness value of the input array. If all values are equal, return `0`.
+
+    Args:
+        bias (bool):
+            If ``False``, then the calculations are corrected for statistical bias.
+            Defaults to ``True``.
+    """
+
+    def __init__(self, bias=True):
+        super().__init__('sigpro.aggregations.amplitude.statistical.skew',
+                         init_params={'bias': bias})
         self.set_primitive_outputs([{'name': 'skew_value', 'type': "float"}])
+        self.set_fixed_hyperparameters({'bias': {'type': 'bool', 'default': True}})
 
 
 class Std(primitive.AmplitudeAggregation):
@@ -198,3 +374,79 @@ class BandRMS(primitive.FrequencyAggregation):
             'min_frequency': min_frequency, 'max_frequency': max_frequency})
         self.set_fixed_hyperparameters({'min_frequency': {'type': 'float'},
                                         'max_frequency': {'type': 'float'}})
+
+
+class BandEnergy(primitive.FrequencyTimeAggregation):
+    """
+    BandEnergy primitive class.
+
+    Filter a spectrogram between a high and low band (inclusive) and compute the
+    average energy of this specific band over time.
+
+    Args:
+        min_frequency (int or float):
+            Band minimum.
+        max_frequency (int or float):
+            Band maximum.
+    """
+
+    def __init__(self, min_frequency, max_frequency):
+        super().__init__('sigpro.aggregations.frequency_time.band.band_energy', init_params={
+            'min_frequency': min_frequency, 'max_frequency': max_frequency})
+        self.set_fixed_hyperparameters({'min_frequency': {'type': 'float'},
+                                        'max_frequency': {'type': 'float'}})
+
+
+class BandStatistics(primitive.FrequencyTimeAggregation):
+    """
+    BandStatistics primitive class.
+
+    Filter a spectrogram between a high and low band (inclusive) and compute the mean,
+    standard deviation, minimum and maximum of the energy of this band over time.
+
+    Args:
+        min_frequency (int or float):
+            Band minimum.
+        max_frequency (int or float):
+            Band maximum.
+    """
+
+    def __init__(self, min_frequency, max_frequency):
+        super().__init__('sigpro.aggregations.frequency_time.band.band_statistics',
+                         init_params={'min_frequency': min_frequency,
+                                      'max_frequency': max_frequency})
+        self.set_primitive_outputs([{'name': 'mean_value', 'type': 'float'},
+                                    {'name': 'std_value', 'type': 'float'},
+                                    {'name': 'min_value', 'type': 'float'},
+                                    {'name': 'max_value', 'type': 'float'}])
+        self.set_fixed_hyperparameters({'min_frequency': {'type': 'float'},
+                                        'max_frequency': {'type': 'float'}})
+
+
+class MeanSpectrum(primitive.FrequencyTimeAggregation):
+    """MeanSpectrum primitive class."""
+
+    def __init__(self):
+        super().__init__('sigpro.aggregations.frequency_time.spectrum.mean_spectrum')
+        self.set_primitive_outputs([{'name': 'mean_spectrum_value', 'type': 'numpy.ndarray'}])
+
+
+class SpectralFlux(primitive.FrequencyTimeAggregation):
+    """SpectralFlux primitive class."""
+
+    def __init__(self):
+        super().__init__('sigpro.aggregations.frequency_time.spectrum.spectral_flux')
+        self.set_primitive_outputs([{'name': 'spectral_flux_value', 'type': 'float'}])
+
+
+class CrossCorrelation(primitive.ComparativeAggregation):
+    """
+    CrossCorrelation primitive class.
+
+    Find the lag, in seconds, with the highest cross-correlation of each pair of channels.
+    """
+
+    def __init__(self):
+        super().__init__('sigpro.aggregations.comparative.correlation.cross_correlation')
+        self.set_primitive_outputs([{'name': 'lag_value', 'type': 'float'},
+                                    {'name': 'correlation_value', 'type': 'float'}])
@@ -0,0 +1,66 @@
+"""SigPro row bucketing functionality."""
+
+import numpy as np
+
+
+def _get_bucket_key(values, context):
+    """Get a hashable key for the rows with the shape of the given values and context."""
+    try:
+        key = (np.shape(values), tuple(context.items()))
+        hash(key)
+    except (TypeError, ValueError):
+        return None
+
+    return key
+
+
+def get_buckets(data, values_column_name, context_columns=None):
+    """Group the rows of a dataframe that can be processed together.
+
+    The rows are grouped by the shape of their signal, such as ``(samples, )`` or
+    ``(channels, samples)``, and the values of their context columns, such as the
+    ``sampling_frequency``, so the signals of each bucket can be stacked in a single
+    array and processed with a single pipeline call. Rows with context values that
+    cannot be compared, such as arrays, or with ragged signals are put in a bucket of
+    their own.
+
+    Args:
+        data (pandas.DataFrame):
+            Dataframe with one signal per row.
+        values_column_name (str):
+            Column in ``data`` that represents the signal values.
+        context_columns (list or None):
+            Columns passed to the pipeline along with the signal values, such as the
+            ``sampling_frequency``. The other columns, such as timestamps or ids, are
+            ignored. If ``None``, all the columns but ``values_column_name`` are used.
+
+    Returns:
+        list[tuple]:
+            One tuple per bucket, in order of first appearance, with:
+
+            * `positions (list[int])`: positions of the rows of the bucket in ``data``.
+            * `signals (list)`: signal values of each row of the bucket.
+            * `context (dict)`: values of the context columns, shared by all the rows.
+    """
+    columns = [
+        column for column in data.columns
+        if column != values_column_name and (context_columns is None or column in context_columns)
+    ]
+    buckets = {}
+    unhashable = []
+    rows = zip(data[values_column_name], *(data[column] for column in columns))
+    for position, (values, *row) in enumerate(rows):
+        context = dict(zip(columns, row))
+        key = _get_bucket_key(values, context)
+        if key is None:
+            unhashable.append(([position], [values], context))
+            continue
+
+        bucket = buckets.get(key)
+        if bucket is None:
+            buckets[key] = ([position], [values], context)
+        else:
+            bucket[0].append(position)
+            bucket[1].append(values)
+
+    return sorted(list(buckets.values()) + unhashable, key=lambda bucket: bucket[0][0])
@@ -0,0 +1,216 @@
+"""SigPro preallocated output buffers.
+
+The primitives whose ``vectorization`` annotation declares an ``out_param`` can write
+their ``amplitude_values`` output into an array given by the caller. The pipelines
+wrap those primitives with a ``BufferedPrimitive``, which computes the shape and the
+dtype of the output from the ``outputs`` entry of the annotation and takes the array
+from the ``BufferPool`` of the current thread, so the same array is reused for every
+row, bucket or frame of the same shape instead of being allocated on each call.
+
+The buffers are only reused by the primitive that owns them, and each thread has its
+own pool, so the outputs of a primitive stay valid until the same primitive is called
+again in the same thread. The pipelines only wrap transformations, whose outputs are
+consumed by the following primitives within the same call.
+"""
+
+import threading
+import weakref
+
+import numpy as np
+
+from sigpro.cost import KEPT_AXES, evaluate_cost, get_shape_variables
+
+# Number of output shapes kept by each ``BufferedPrimitive`` before evaluating them again.
+MAX_OUTPUTS = 64
+
+_LOCAL = threading.local()
+
+
+class BufferPool:
+    """Pool of output buffers reused across the calls of the primitives.
+
+    The pool keeps one buffer per primitive, which is only allocated again when the
+    shape or the dtype of its output changes. The buffers are released along with the
+    primitives that own them.
+
+    Attributes:
+        allocations (int):
+            Number of buffers allocated.
+        requests (int):
+            Number of buffers requested.
+    """
+
+    def __init__(self):
+        self.buffers = weakref.WeakKeyDictionary()
+        self.allocations = 0
+        self.requests = 0
+
+    def get(self, owner, shape, dtype):
+        """Get the buffer of ``owner`` with the given shape and dtype.
+
+        Args:
+            owner (object):
+                Object that owns the buffer, such as a ``BufferedPrimitive``.
+            shape (tuple):
+                Shape of the buffer.
+            dtype (numpy.dtype):
+                Type of the buffer.
+
+        Returns:
+            numpy.ndarray:
+                The buffer, whose values are not initialized.
+        """
+        self.requests += 1
+        buffer = self.buffers.get(owner)
+        if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+            buffer = np.empty(shape, dtype=dtype)
+            self.buffers[owner] = buffer
+            self.allocations += 1
+
+        return buffer
+
+    def get_stats(self):
+        """Get the number of ``allocations`` and ``requests`` and the ``nbytes`` in use."""
+        return {
+            'allocations': self.allocations,
+            'requests': self.requests,
+            'nbytes': sum(buffer.nbytes for buffer in self.buffers.values()),
+        }
+
+    def clear(self):
+        """Release the buffers and reset the counters."""
+        self.buffers.clear()
+        self.allocations = 0
+        self.requests = 0
+
+
+def get_buffer_pool():
+    """Get the ``BufferPool`` of the current thread."""
+    pool = getattr(_LOCAL, 'pool', None)
+    if pool is None:
+        pool = _LOCAL.pool = BufferPool()
+
+    return pool
+
+
+def get_output_dtype(dtype, values):
+    """Resolve the dtype of an output spec for the given input values."""
+    if dtype not in ('same', 'complex'):
+        return np.dtype(dtype)
+
+    float_dtype = np.float64
+    if np.issubdtype(values.dtype, np.inexact):
+        float_dtype = np.finfo(values.dtype).dtype
+
+    return np.dtype(float_dtype) if dtype == 'same' else np.result_type(float_dtype, np.complex64)
+
+
+def get_output_shape(shape, values, axis, variables):
+    """Evaluate the shape of an output spec for the given input values.
+
+    Args:
+        shape (list):
+            Length of each axis of the output, as ints or expressions. The ``...`` axis
+            stands for the axes of the input values in front of ``axis``.
+        values (numpy.ndarray):
+            Input values.
+        axis (int):
+            First axis of the signal values, counted from the end.
+        variables (dict):
+            Values of the hyperparameters that the expressions can use.
+
+    Returns:
+        tuple:
+            The shape of the output.
+    """
+    variables = dict(variables)
+    variables.update(get_shape_variables(values.shape, variables.get('sampling_frequency')))
+    output_shape = []
+    for length in shape:
+        if length == KEPT_AXES:
+            output_shape.extend(values.shape[:max(values.ndim + axis, 0)])
+        else:
+            output_shape.append(int(evaluate_cost(length, variables)))
+
+    return tuple(output_shape)
+
+
+class BufferedPrimitive:  # pylint: disable=too-few-public-methods
+    """Call a primitive function with a preallocated buffer for its output.
+
+    Args:
+        function (callable):
+            Primitive function.
+        out_param (str):
+            Argument of the function that takes the buffer.
+        output_spec (dict):
+            ``shape`` and ``dtype`` of the ``amplitude_values`` output.
+        axis (int):
+            First axis of the signal values, counted from the end. Defaults to -1.
+    """
+
+    def __init__(self, function, out_param, output_spec, axis=-1):
+        self.function = function
+        self.out_param = out_param
+        self.output_spec = output_spec
+        self.axis = axis
+        self._outputs = {}
+
+    def _get_output(self, values, variables):
+        """Get the shape and dtype of the output, evaluated once per input shape."""
+        key = (values.shape, values.dtype, tuple(variables.items()))
+        output = self._outputs.get(key)
+        if output is None:
+            if len(self._outputs) >= MAX_OUTPUTS:
+                self._outputs.clear()
+
+            output = self._outputs[key] = (
+                get_output_shape(self.output_spec['shape'], values, self.axis, variables),
+                get_output_dtype(self.output_spec.get('dtype', 'same'), values),
+            )
+
+        return output
+
+    def __call__(self, **kwargs):
+        """Call the function with the buffer of the current thread."""
+        values = np.asarray(kwargs['amplitude_values'])
+        variables = {name: value for name, value in kwargs.items() if np.isscalar(value)}
+        shape, dtype = self._get_output(values, variables)
+        kwargs['amplitude_values'] = values
+        kwargs[self.out_param] = get_buffer_pool().get(self, shape, dtype)
+        return self.function(**kwargs)
+
+
+def set_output_buffers(mlpipeline, primitives):
+    """Wrap the transformations that declare an ``out_param`` with a ``BufferedPrimitive``.
+
+    A primitive is only wrapped if all the instances of it in the pipeline declare an
+    ``out_param`` and the ``shape`` of their ``amplitude_values`` output.
+
+    Args:
+        mlpipeline (mlblocks.MLPipeline):
+            Pipeline whose blocks are wrapped.
+        primitives (list):
+            The ``sigpro.primitive.Primitive`` objects of the pipeline.
+    """
+    vectorizations = {}
+    for primitive in primitives:
+        vectorization = primitive.get_vectorization()
+        output_spec = vectorization.get('outputs', {}).get('amplitude_values', {})
+        is_transformation = primitive.get_type_subtype()[0] == 'transformation'
+        if not (is_transformation and vectorization.get('out_param') and 'shape' in output_spec):
+            vectorization = None
+
+        vectorizations.setdefault(primitive.get_name(), vectorization)
+        if vectorization is None:
+            vectorizations[primitive.get_name()] = None
+
+    for block_name, block in mlpipeline.blocks.items():
+        vectorization = vectorizations.get(block_name.rsplit('#', 1)[0])
+        if vectorization is not None and not isinstance(block.primitive, BufferedPrimitive):
+            block.primitive = BufferedPrimitive(
+                block.primitive,
+                vectorization['out_param'],
+                vectorization['outputs']['amplitude_values'],
+                vectorization.get('axis', -1)
+            )
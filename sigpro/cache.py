@@ -0,0 +1,157 @@
+"""SigPro persistent feature cache."""
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_SIZE = 2 ** 30  # 1 GiB
+CACHE_EXTENSION = '.pkl'
+
+
+class FeatureCache:
+    """Content addressed on-disk cache of the features computed for each signal.
+
+    Each entry is stored in its own file inside ``path`` under a key computed from
+    the pipeline fingerprint, the bytes of the signal values and the context values.
+    When the total size of the entries exceeds ``max_size`` the least recently used
+    entries are evicted.
+
+    The entries are stored with ``pickle``, so the cache folder must only be shared
+    with trusted processes. The index of the entries is guarded by a lock, so the same
+    cache can be used from several threads, such as by ``Pipeline.aprocess_signal``.
+
+    Args:
+        path (str):
+            Folder where the cache entries are stored. It is created if it does not exist.
+        max_size (int):
+            Maximum size of the cache in bytes. Defaults to 1 GiB.
+    """
+
+    def __init__(self, path, max_size=DEFAULT_MAX_SIZE):
+        self.path = os.path.abspath(path)
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.path, exist_ok=True)
+        self._lock = threading.Lock()
+        self._entries = self._load_entries()
+        self._size = sum(self._entries.values())
+
+    def _load_entries(self):
+        """Index the existing entries from the least to the most recently used."""
+        entries = []
+        for file_name in os.listdir(self.path):
+            if file_name.endswith(CACHE_EXTENSION):
+                stat = os.stat(os.path.join(self.path, file_name))
+                key = file_name[:-len(CACHE_EXTENSION)]
+                entries.append((stat.st_mtime, key, stat.st_size))
+
+        return OrderedDict((key, size) for _, key, size in sorted(entries))
+
+    def _get_entry_path(self, key):
+        return os.path.join(self.path, key + CACHE_EXTENSION)
+
+    @staticmethod
+    def get_key(fingerprint, amplitude_values, context=None):
+        """Compute the cache key of a signal.
+
+        Args:
+            fingerprint (str):
+                Fingerprint of the pipeline that computes the features.
+            amplitude_values (numpy.ndarray or list):
+                Signal values.
+            context (dict or None):
+                Context values passed along with the signal, such as the
+                ``sampling_frequency``.
+
+        Returns:
+            str:
+                Hexadecimal digest that identifies the signal features.
+        """
+        amplitude_values = np.ascontiguousarray(amplitude_values)
+        digest = hashlib.sha256(fingerprint.encode())
+        digest.update(str((amplitude_values.dtype.str, amplitude_values.shape)).encode())
+        digest.update(amplitude_values.tobytes())
+        if context:
+            digest.update(repr(sorted(context.items(), key=lambda item: item[0])).encode())
+
+        return digest.hexdigest()
+
+    def get(self, key):
+        """Return the features stored under the given key or ``None`` if missing."""
+        entry_path = self._get_entry_path(key)
+        try:
+            with open(entry_path, 'rb') as entry_file:
+                value = pickle.load(entry_file)
+
+        except (OSError, EOFError, pickle.UnpicklingError):
+            value = None
+
+        with self._lock:
+            if value is not None:
+                try:
+                    os.utime(entry_path)
+                except FileNotFoundError:
+                    # The entry was evicted by another thread after being read.
+                    value = None
+
+            if value is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            if key in self._entries:
+                self._entries.move_to_end(key)
+
+        return value
+
+    def set(self, key, value):
+        """Store the features under the given key and evict the oldest entries if needed."""
+        file_descriptor, tmp_path = tempfile.mkstemp(dir=self.path, suffix='.tmp')
+        with os.fdopen(file_descriptor, 'wb') as tmp_file:
+            pickle.dump(value, tmp_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        size = os.path.getsize(tmp_path)
+        with self._lock:
+            os.replace(tmp_path, self._get_entry_path(key))
+            self._size += size - self._entries.pop(key, 0)
+            self._entries[key] = size
+            self._evict()
+
+    def _evict(self):
+        """Remove the least recently used entries, with the lock already held."""
+        while self._size > self.max_size and self._entries:
+            key, size = self._entries.popitem(last=False)
+            self._size -= size
+            try:
+                os.remove(self._get_entry_path(key))
+            except FileNotFoundError:
+                LOGGER.debug('Cache entry %s already removed', key)
+
+    def clear(self):
+        """Remove all the entries of the cache."""
+        with self._lock:
+            for key in list(self._entries):
+                try:
+                    os.remove(self._get_entry_path(key))
+                except FileNotFoundError:
+                    LOGGER.debug('Cache entry %s already removed', key)
+
+            self._entries.clear()
+            self._size = 0
+
+    def get_size(self):
+        """Return the total size in bytes of the cache entries."""
+        return self._size
+
+    def __len__(self):
+        """Return the number of entries in the cache."""
+        return len(self._entries)
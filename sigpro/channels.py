@@ -0,0 +1,81 @@
+"""SigPro multi-channel signals functionality."""
+
+import numpy as np
+import pandas as pd
+
+
+def get_channel_pairs(num_channels):
+    """Get the indices of the first and second channel of each pair of channels.
+
+    The pairs are sorted as ``(0, 1), (0, 2), ..., (1, 2), ...``, which is the order
+    in which the comparative primitives return their values.
+
+    Args:
+        num_channels (int):
+            Number of channels of the signal.
+
+    Returns:
+        tuple:
+            Two `numpy.ndarray` with the indices of the first and second channel of
+            each pair.
+    """
+    return np.triu_indices(num_channels, 1)
+
+
+def get_num_channels(signals):
+    """Get the number of channels of the signals.
+
+    Args:
+        signals (pandas.Series):
+            Signal values of each row.
+
+    Raises:
+        ValueError:
+            If the signals are not 2D arrays with the same number of channels.
+
+    Returns:
+        int or None:
+            The number of channels, or ``None`` if the signals are 1D.
+    """
+    if signals.empty or np.ndim(signals.iloc[0]) < 2:
+        return None
+
+    shapes = {np.shape(signal)[:-1] for signal in signals}
+    if len(shapes) > 1 or len(next(iter(shapes))) != 1:
+        raise ValueError('All the signals must be 2D arrays with the same number of channels')
+
+    return next(iter(shapes))[0]
+
+
+def split_channels(features, num_channels, comparative_features=()):
+    """Split each feature in one column per channel or pair of channels.
+
+    The columns get a ``.ch<i>`` suffix, or a ``.ch<i>_ch<j>`` suffix for the
+    features computed by comparative primitives over each pair of channels.
+
+    Args:
+        features (pandas.DataFrame):
+            Features with one array of values per channel, or pair of channels, per row.
+        num_channels (int):
+            Number of channels of the signals.
+        comparative_features (Collection[str]):
+            Names of the features computed over pairs of channels.
+
+    Returns:
+        pandas.DataFrame:
+            A data frame with one column per feature and channel.
+    """
+    channels = [f'ch{channel}' for channel in range(num_channels)]
+    pairs = [f'ch{first}_ch{second}' for first, second in zip(*get_channel_pairs(num_channels))]
+    columns = {}
+    for name, column in features.items():
+        values = np.stack(column.to_numpy())
+        suffixes = pairs if name in comparative_features else channels
+        for position, suffix in enumerate(suffixes):
+            channel_values = values[:, position]
+            if channel_values.ndim > 1:
+                channel_values = list(channel_values)
+
+            columns[f'{name}.{suffix}'] = channel_values
+
+    return pd.DataFrame(columns, index=features.index)
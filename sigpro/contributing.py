@@ -3,11 +3,18 @@ import importlib
 import inspect
 import json
 import os
+import time
+import tracemalloc
+from functools import lru_cache
 
+import numpy as np
 from mlblocks import MLBlock
 from mlblocks.discovery import load_primitive
+from mlblocks.mlblock import import_object
 
-from sigpro.demo import get_amplitude_demo, get_frequency_demo, get_frequency_time_demo
+from sigpro.demo import (
+    get_amplitude_demo, get_comparative_demo, get_frequency_demo, get_frequency_time_demo,
+    get_num_demo_signals)
 
 DEMO_FUNCTIONS = {
     'aggregation': {
@@ -15,14 +22,26 @@ DEMO_FUNCTIONS = {
         'frequency': (get_frequency_demo, 'amplitude_values', 'frequency_values'),
         'frequency_time': (
             get_frequency_time_demo, 'amplitude_values', 'frequency_values', 'time_values'),
+        'comparative': (get_comparative_demo, 'amplitude_values', 'sampling_frequency'),
     },
     'transformation': {
         'amplitude': (get_amplitude_demo, 'amplitude_values', 'sampling_frequency'),
         'frequency': (get_amplitude_demo, 'amplitude_values', 'sampling_frequency'),
         'frequency_time': (get_amplitude_demo, 'amplitude_values', 'sampling_frequency'),
+        'comparative': (get_comparative_demo, 'amplitude_values', 'sampling_frequency'),
     }
 }
 
+DEFAULT_NUM_SIGNALS = 100
+BENCHMARK_PERCENTILES = (50, 90, 99)
+
+# Entries of the ``vectorization`` annotation of a primitive.
+VECTORIZATION_FLAGS = ('batched', 'pure')
+VECTORIZATION_KEYS = VECTORIZATION_FLAGS + ('axis', 'out_param', 'outputs')
+OUTPUT_SPEC_KEYS = ('shape', 'dtype')
+# Output dtypes relative to the input values, besides the numpy dtype names.
+RELATIVE_DTYPES = ('same', 'complex')
+
 PRIMITIVE_INPUTS = {
     'transformation': {
         'amplitude': {
@@ -88,6 +107,28 @@ PRIMITIVE_INPUTS = {
                 },
             )
         },
+        'comparative': {
+            'args': (
+                {
+                    'name': 'amplitude_values',
+                    'type': 'numpy.ndarray',
+                },
+                {
+                    'name': 'sampling_frequency',
+                    'type': 'float',
+                }
+            ),
+            'output': (
+                {
+                    'name': 'amplitude_values',
+                    'type': 'numpy.ndarray',
+                },
+                {
+                    'name': 'frequency_values',
+                    'type': 'numpy.ndarray',
+                },
+            )
+        },
     },
     'aggregation': {
         'amplitude': {
@@ -149,6 +190,24 @@ PRIMITIVE_INPUTS = {
                 },
             )
         },
+        'comparative': {
+            'args': (
+                {
+                    'name': 'amplitude_values',
+                    'type': 'numpy.ndarray',
+                },
+                {
+                    'name': 'sampling_frequency',
+                    'type': 'float',
+                }
+            ),
+            'output': (
+                {
+                    'name': 'value',
+                    'type': 'float',
+                },
+            )
+        },
     }
 }
 
@@ -177,8 +236,9 @@ def _get_primitive_instance(primitive, kwargs):
     return MLBlock(primitive, **given_args)
 
 
+@lru_cache(maxsize=None)
 def _import_object(object_name):
-    """Import an object from its Fully Qualified Name."""
+    """Import an object from its Fully Qualified Name, once per name in each process."""
     try:
         package, name = object_name.rsplit('.', 1)
         return getattr(importlib.import_module(package), name)
@@ -186,6 +246,29 @@ def _import_object(object_name):
         raise ImportError(f'Cannot import {object_name}') from None
 
 
+# Resolve the primitive functions like the ``MLBlock`` that runs them, which also accepts
+# attributes of classes, once per path in each process.
+_import_primitive = lru_cache(maxsize=None)(import_object)
+
+
+@lru_cache(maxsize=None)
+def _get_function_args(primitive_function):
+    """Get the names of the arguments of a function, inspected once per function."""
+    return tuple(inspect.getfullargspec(primitive_function).args)
+
+
+def clear_primitive_cache():
+    """Clear the memo of imported primitive functions and their arguments.
+
+    The functions and their arguments are memoized by ``make_primitive`` and the
+    ``Primitive`` objects, so this must be called after reloading the module of a
+    primitive whose signature changed.
+    """
+    _import_object.cache_clear()
+    _import_primitive.cache_clear()
+    _get_function_args.cache_clear()
+
+
 def _validate_subtype_inputs(function_args, primitive_inputs):
     for primitive_input in primitive_inputs:
         arg_name = primitive_input['name']
@@ -224,16 +307,60 @@ def _validate_hyperparameters(function_args, hyperparameters):
         function_args.remove(name)
 
 
+def _validate_output_spec(name, output_spec):
+    if not isinstance(output_spec, dict) or set(output_spec) - set(OUTPUT_SPEC_KEYS):
+        raise ValueError(f'Output `{name}` must be a dict with keys {OUTPUT_SPEC_KEYS}')
+
+    shape = output_spec.get('shape', [])
+    if not isinstance(shape, list) or not all(isinstance(axis, (int, str)) for axis in shape):
+        raise ValueError(f'Output `{name}` shape must be a list of ints or expressions')
+
+    dtype = output_spec.get('dtype', 'same')
+    if dtype not in RELATIVE_DTYPES:
+        try:
+            np.dtype(dtype)
+        except TypeError:
+            raise ValueError(f'Output `{name}` has an invalid dtype: {dtype}') from None
+
+
+def _validate_vectorization(function_args, vectorization):
+    if not isinstance(vectorization, dict):
+        raise ValueError('vectorization must be a dict')
+
+    unknown_keys = sorted(set(vectorization) - set(VECTORIZATION_KEYS))
+    if unknown_keys:
+        raise ValueError(f'Unknown vectorization keys: {unknown_keys}')
+
+    for flag in VECTORIZATION_FLAGS:
+        if not isinstance(vectorization.get(flag, False), bool):
+            raise ValueError(f'Vectorization `{flag}` must be a bool')
+
+    axis = vectorization.get('axis', -1)
+    if not isinstance(axis, int) or isinstance(axis, bool) or axis >= 0:
+        raise ValueError('Vectorization `axis` must be a negative int')
+
+    out_param = vectorization.get('out_param')
+    if out_param is not None:
+        if out_param not in function_args:
+            raise ValueError(f'Primitive does not have `{out_param}` argument (out_param)')
+
+        function_args.remove(out_param)
+
+    for name, output_spec in vectorization.get('outputs', {}).items():
+        _validate_output_spec(name, output_spec)
+
+
 def _get_primitive_args(primitive_function, primitive_inputs, context_arguments,
-                        fixed_hyperparameters, tunable_hyperparameters):
-    argspec = inspect.getfullargspec(primitive_function)
-    function_args = argspec.args.copy()
+                        fixed_hyperparameters, tunable_hyperparameters, vectorization=None):
+    function_args = list(_get_function_args(primitive_function))
     primitive_args = []
 
     primitive_args.extend(_validate_subtype_inputs(function_args, primitive_inputs))
     primitive_args.extend(_validate_context_arguments(function_args, context_arguments))
     _validate_hyperparameters(function_args, fixed_hyperparameters)
     _validate_hyperparameters(function_args, tunable_hyperparameters)
+    if vectorization is not None:
+        _validate_vectorization(function_args, vectorization)
 
     if function_args:
         raise ValueError(f'Unexpected additional arguments found: {function_args}')
@@ -241,6 +368,14 @@ def _get_primitive_args(primitive_function, primitive_inputs, context_arguments,
     return primitive_args
 
 
+def _load_annotation(primitive, key):
+    """Load an entry of the JSON annotation of a primitive, or ``{}`` if it is missing."""
+    try:
+        return load_primitive(primitive).get(key, {})
+    except ValueError:
+        return {}
+
+
 def _get_primitive_spec(primitive_type, primitive_subtype):
 
     subtypes = PRIMITIVE_INPUTS.get(primitive_type)
@@ -277,10 +412,11 @@ def _write_primitive(primitive_dict, primitive_name, primitives_path, primitives
     return primitive_path
 
 
-def _make_primitive_dict(primitive, primitive_type, primitive_subtype,
-                         context_arguments=None, fixed_hyperparameters=None,
-                         tunable_hyperparameters=None, primitive_inputs=None,
-                         primitive_outputs=None):
+def _make_primitive_dict(primitive,  # pylint: disable=too-many-arguments, too-many-locals
+                         primitive_type, primitive_subtype, context_arguments=None,
+                         fixed_hyperparameters=None, tunable_hyperparameters=None,
+                         primitive_inputs=None, primitive_outputs=None, cost=None,
+                         vectorization=None):
     """Create a primitive dict.
 
     Args:
@@ -307,6 +443,11 @@ def _make_primitive_dict(primitive, primitive_type, primitive_subtype,
         primitive_outputs (list or None):
             A list with dictionaries containing the name and type of the output values. If
             ``None`` default values for those will be used.
+        cost (dict or None):
+            The cost annotation of the primitive, as described in ``sigpro.cost``.
+        vectorization (dict or None):
+            The vectorization capabilities of the primitive, as described in
+            ``make_primitive``.
 
     Raises:
         ValueError:
@@ -330,9 +471,15 @@ def _make_primitive_dict(primitive, primitive_type, primitive_subtype,
         primitive_inputs,
         context_arguments,
         fixed_hyperparameters,
-        tunable_hyperparameters
+        tunable_hyperparameters,
+        vectorization
     )
 
+    output_names = [primitive_output['name'] for primitive_output in primitive_outputs]
+    for name in (vectorization or {}).get('outputs', {}):
+        if name not in output_names:
+            raise ValueError(f'Primitive does not have `{name}` output (vectorization)')
+
     primitive_dict = {
         'name': primitive,
         'primitive': primitive,
@@ -355,6 +502,11 @@ def _make_primitive_dict(primitive, primitive_type, primitive_subtype,
             'tunable': tunable_hyperparameters
         }
     }
+    if cost:
+        primitive_dict['cost'] = cost
+
+    if vectorization:
+        primitive_dict['vectorization'] = vectorization
 
     return primitive_dict
 
@@ -365,7 +517,7 @@ def make_primitive(primitive, primitive_type, primitive_subtype,
                    context_arguments=None, fixed_hyperparameters=None,
                    tunable_hyperparameters=None, primitive_inputs=None,
                    primitive_outputs=None, primitives_path='sigpro/primitives',
-                   primitives_subfolders=True):
+                   primitives_subfolders=True, cost=None, vectorization=None):
     """Create a primitive JSON.
 
     During the JSON creation the primitive function signature is validated to
@@ -405,6 +557,28 @@ def make_primitive(primitive, primitive_type, primitive_subtype,
         primitives_subfolders (bool):
             Whether to store the primitive JSON in a subfolder tree (``True``) or to use a flat
             primitive name (``False``). Defaults to ``True``.
+        cost (dict or None):
+            The cost annotation of the primitive, as described in ``sigpro.cost``, used
+            by ``Pipeline.explain`` to estimate the cost of the pipelines that use it.
+        vectorization (dict or None):
+            The vectorization capabilities of the primitive, which pipelines use to pick
+            their fast paths. A dict with the following optional keys:
+
+            * `batched (bool)`: whether the primitive accepts a batch of signals stacked
+              in front of the ``axis`` of the signal values and returns one output per
+              signal.
+            * `axis (int)`: first axis of the signal values, counted from the end, such
+              as -1 for signals and -2 for spectrograms. Defaults to -1.
+            * `out_param (str)`: name of the argument that takes a preallocated array in
+              which the ``amplitude_values`` output is written.
+            * `pure (bool)`: whether the outputs only depend on the inputs, so they can
+              be cached.
+            * `outputs (dict)`: ``shape`` and ``dtype`` of each output. The shape is a
+              list of ints or expressions as described in ``sigpro.cost``, and the dtype
+              is a numpy dtype name, ``same`` for the real floating point type of the
+              input values, or ``complex`` for the complex type of the same precision.
+              The pipelines use the ``amplitude_values`` entry to allocate the arrays
+              passed to the ``out_param``.
 
     Raises:
         ValueError:
@@ -417,7 +591,7 @@ def make_primitive(primitive, primitive_type, primitive_subtype,
     primitive_dict = _make_primitive_dict(primitive, primitive_type, primitive_subtype,
                                           context_arguments, fixed_hyperparameters,
                                           tunable_hyperparameters, primitive_inputs,
-                                          primitive_outputs)
+                                          primitive_outputs, cost, vectorization)
 
     return _write_primitive(primitive_dict, primitive, primitives_path, primitives_subfolders)
 
@@ -490,3 +664,181 @@ def run_primitive(primitive, primitive_type=None, primitive_subtype=None,
 
     kwargs.update(data)
     return primitive.produce(**kwargs)
+
+
+def _get_benchmark_inputs(primitive_type, primitive_subtype, signal_length, num_signals):
+    """Get the inputs of each call, from the demo signals or from synthetic ones."""
+    get_demo_data_function, *arg_names = DEMO_FUNCTIONS[primitive_type][primitive_subtype]
+    if num_signals is None:
+        num_signals = get_num_demo_signals() if signal_length is None else DEFAULT_NUM_SIGNALS
+
+    return [
+        dict(zip(arg_names, get_demo_data_function(index=index, signal_length=signal_length)))
+        for index in range(num_signals)
+    ]
+
+
+def _as_tuple(output):
+    return output if isinstance(output, tuple) else (output, )
+
+
+def _time_calls(primitive, inputs):
+    """Run the primitive on each input and return the latency of each call and its output."""
+    latencies = []
+    outputs = []
+    for data in inputs:
+        start = time.perf_counter()
+        outputs.append(primitive.produce(**data))
+        latencies.append(time.perf_counter() - start)
+
+    return np.array(latencies), outputs
+
+
+def _get_peak_bytes(primitive, inputs):
+    """Get the highest memory allocated by a single call, traced with ``tracemalloc``."""
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+
+    peak_bytes = 0
+    try:
+        for data in inputs:
+            tracemalloc.reset_peak()
+            current_bytes, _ = tracemalloc.get_traced_memory()
+            primitive.produce(**data)
+            peak_bytes = max(peak_bytes, tracemalloc.get_traced_memory()[1] - current_bytes)
+
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    return peak_bytes
+
+
+def _run_batched(primitive, inputs, outputs):
+    """Run the primitive on the stacked signals of each shape and compare it to each call.
+
+    Returns whether the outputs of the batched calls match the outputs of the calls made
+    with one signal and the seconds spent in the batched calls.
+    """
+    shapes = {}
+    for position, data in enumerate(inputs):
+        shapes.setdefault(np.shape(data['amplitude_values']), []).append(position)
+
+    matches = True
+    elapsed = 0.0
+    for positions in shapes.values():
+        data = dict(inputs[positions[0]])
+        data['amplitude_values'] = np.stack(
+            [inputs[position]['amplitude_values'] for position in positions])
+
+        start = time.perf_counter()
+        batched_outputs = _as_tuple(primitive.produce(**data))
+        elapsed += time.perf_counter() - start
+
+        for index, batched_output in enumerate(batched_outputs):
+            row_outputs = np.stack(
+                [_as_tuple(outputs[position])[index] for position in positions])
+            try:
+                batched_output = np.broadcast_to(batched_output, row_outputs.shape)
+            except ValueError:
+                return False, elapsed
+
+            matches = matches and np.allclose(batched_output, row_outputs, equal_nan=True)
+
+    return bool(matches), elapsed
+
+
+def benchmark_primitive(primitive,  # pylint: disable=too-many-locals
+                        primitive_type=None, primitive_subtype=None, signal_length=None,
+                        num_signals=None, batched=None, **kwargs):
+    """Measure the performance of a given `primitive` with the specified configuration.
+
+    The primitive is run once on each demo signal, or on synthetic random signals of the
+    given length, to measure the latency of each call, and then once more on each signal
+    to measure the memory allocated by each call with ``tracemalloc``, which only traces
+    the allocations made through Python and NumPy.
+
+    If the primitive is ``batched``, it is also run once on the signals of each shape
+    stacked in a single array, with one signal per row, and its outputs are compared to
+    the outputs of the calls made with one signal.
+
+    Args:
+        primitive (str):
+            Path or name of the primitive to be used.
+        primitive_type (str):
+            Type to which the primitive belongs to. If ``None``, it is taken from the
+            metadata of the primitive.
+        primitive_subtype (str):
+            Subtype to which the primitive belongs to. If ``None``, it is taken from the
+            metadata of the primitive.
+        signal_length (int or None):
+            If `int`, run the primitive on synthetic random signals with this number of
+            values instead of the demo signals. Defaults to ``None``.
+        num_signals (int or None):
+            Number of signals. If ``None``, all the demo signals or 100 synthetic signals
+            are used. Defaults to ``None``.
+        batched (bool or None):
+            Whether the primitive accepts a batch of signals with one signal per row. If
+            ``None``, it is taken from the ``vectorization`` annotation of the primitive.
+            Defaults to ``None``.
+        context (optional):
+            Additional context arguments required to run the primitive.
+        hyperparameters (optional):
+            Additional hyperparameters or tunable hyperparameters arguments.
+
+    Returns:
+        dict:
+            * `calls (int)`: number of calls made with one signal.
+            * `latency_p50`, `latency_p90`, `latency_p99` and `latency_max` (float):
+              percentiles and maximum of the seconds spent in each call.
+            * `calls_per_second (float)`: number of signals processed per second.
+            * `bytes_per_second (float)`: bytes of amplitude values processed per second.
+            * `peak_bytes (int)`: highest memory allocated by a single call.
+            * `batched_calls_per_second (float or None)`: number of signals processed per
+              second in the batched calls, or ``None`` if the primitive is not batched.
+            * `batched_matches (bool or None)`: whether the outputs of the batched calls
+              match the outputs of the calls made with one signal, or ``None`` if the
+              primitive is not batched.
+    """
+    if primitive_type is None:
+        metadata = load_primitive(primitive)
+        primitive_type = metadata['classifiers']['type']
+        primitive_subtype = metadata['classifiers']['subtype']
+
+    _check_primitive_type_and_subtype(primitive_type, primitive_subtype)
+    if batched is None:
+        batched = _load_annotation(primitive, 'vectorization').get('batched', False)
+
+    block = _get_primitive_instance(primitive, kwargs)
+    # Like in ``run_primitive``, the values of the signals take precedence over ``kwargs``.
+    inputs = [
+        {**kwargs, **data}
+        for data in _get_benchmark_inputs(primitive_type, primitive_subtype, signal_length,
+                                          num_signals)
+    ]
+
+    latencies, outputs = _time_calls(block, inputs)
+    elapsed = float(latencies.sum())
+    nbytes = sum(np.asarray(data['amplitude_values']).nbytes for data in inputs)
+    report = {'calls': len(latencies)}
+    for percentile, latency in zip(BENCHMARK_PERCENTILES,
+                                   np.percentile(latencies, BENCHMARK_PERCENTILES)):
+        report[f'latency_p{percentile}'] = float(latency)
+
+    report.update({
+        'latency_max': float(latencies.max()),
+        'calls_per_second': len(latencies) / elapsed if elapsed > 0 else float('inf'),
+        'bytes_per_second': nbytes / elapsed if elapsed > 0 else float('inf'),
+        'peak_bytes': _get_peak_bytes(block, inputs),
+        'batched_calls_per_second': None,
+        'batched_matches': None,
+    })
+
+    if batched:
+        matches, batched_elapsed = _run_batched(block, inputs, outputs)
+        report['batched_matches'] = matches
+        report['batched_calls_per_second'] = (
+            len(inputs) / batched_elapsed if batched_elapsed > 0 else float('inf'))
+
+    return report
@@ -0,0 +1,360 @@
+"""SigPro static cost model.
+
+The cost of each primitive is declared in the ``cost`` entry of its JSON annotation
+as expressions that are evaluated with the shape of its input values. For example,
+the annotation of ``fft`` is::
+
+    "cost": {
+        "flops": "5 * m * n * log2(n)",
+        "output_shape": ["...", "n"],
+        "complex": true
+    }
+
+The expressions can use the following variables:
+
+    * ``n``: length of the last axis of the input values.
+    * ``k``: length of the second to last axis of the input values, or 1.
+    * ``m``: product of the lengths of all the axes of the input values but the last one.
+    * ``fs``: sampling frequency of the input values.
+    * The values of the hyperparameters of the primitive, by name.
+    * The entries of the ``variables`` dict of the annotation, which are evaluated in
+      order, so each one can use the previous ones.
+
+Along with numbers, the usual arithmetic and comparison operators, ``if``/``else``
+expressions and the ``ceil``, ``floor``, ``log2``, ``max``, ``min`` and ``sqrt``
+functions.
+
+The annotation contains the following entries, all of them optional:
+
+    * ``flops``: number of floating point operations.
+    * ``output_shape``: list with the length of each axis of the output values. The
+      ``...`` axis stands for the axes of the input values that are kept, which are
+      all of them but the last ``axes``.
+    * ``axes``: number of trailing axes of the input values that the primitive works
+      on. Defaults to 1.
+    * ``workspace``: number of elements of the temporary arrays allocated by the
+      primitive, at the precision of the input values.
+    * ``complex``: whether the output values are complex.
+    * ``sampling_frequency``: sampling frequency of the output values.
+    * ``variables``: dict of intermediate variables.
+"""
+
+import ast
+import logging
+import math
+import operator
+
+import numpy as np
+import pandas as pd
+
+LOGGER = logging.getLogger(__name__)
+
+COST_FUNCTIONS = {
+    'ceil': math.ceil,
+    'floor': math.floor,
+    'log2': math.log2,
+    'max': max,
+    'min': min,
+    'sqrt': math.sqrt,
+}
+
+_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+    ast.Not: operator.not_,
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.Is: operator.is_,
+    ast.IsNot: operator.is_not,
+}
+
+KEPT_AXES = '...'
+
+
+def _get_operator(node):
+    function = _OPERATORS.get(type(node))
+    if function is None:
+        raise ValueError(f'Unsupported operator in cost expression: {type(node).__name__}')
+
+    return function
+
+
+def _evaluate(node, variables):  # pylint: disable=too-many-return-statements
+    """Evaluate the node of a cost expression without running arbitrary code."""
+    if isinstance(node, ast.Constant):
+        return node.value
+
+    if isinstance(node, ast.Name):
+        if node.id not in variables:
+            raise ValueError(f'Unknown variable in cost expression: {node.id}')
+
+        return variables[node.id]
+
+    if isinstance(node, ast.BinOp):
+        left = _evaluate(node.left, variables)
+        return _get_operator(node.op)(left, _evaluate(node.right, variables))
+
+    if isinstance(node, ast.UnaryOp):
+        return _get_operator(node.op)(_evaluate(node.operand, variables))
+
+    if isinstance(node, ast.Compare):
+        left = _evaluate(node.left, variables)
+        for comparison, comparator in zip(node.ops, node.comparators):
+            right = _evaluate(comparator, variables)
+            if not _get_operator(comparison)(left, right):
+                return False
+
+            left = right
+
+        return True
+
+    if isinstance(node, ast.BoolOp):
+        values = (_evaluate(value, variables) for value in node.values)
+        return all(values) if isinstance(node.op, ast.And) else any(values)
+
+    if isinstance(node, ast.IfExp):
+        branch = node.body if _evaluate(node.test, variables) else node.orelse
+        return _evaluate(branch, variables)
+
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and not node.keywords:
+        function = COST_FUNCTIONS.get(node.func.id)
+        if function is None:
+            raise ValueError(f'Unknown function in cost expression: {node.func.id}')
+
+        return function(*(_evaluate(arg, variables) for arg in node.args))
+
+    raise ValueError(f'Unsupported cost expression: {ast.dump(node)}')
+
+
+def evaluate_cost(expression, variables):
+    """Evaluate a cost expression.
+
+    Args:
+        expression (str, int or float):
+            Expression to evaluate. Numbers are returned as they are.
+        variables (dict):
+            Values of the variables that the expression can use.
+
+    Raises:
+        ValueError:
+            If the expression is not valid or uses unknown variables or functions.
+
+    Returns:
+        int, float or bool:
+            The value of the expression.
+    """
+    if not isinstance(expression, str):
+        return expression
+
+    try:
+        tree = ast.parse(expression, mode='eval')
+    except SyntaxError:
+        raise ValueError(f'Invalid cost expression: {expression}') from None
+
+    return _evaluate(tree.body, variables)
+
+
+def get_shape_variables(shape, sampling_frequency):
+    """Get the variables that describe the input values in the cost expressions.
+
+    Args:
+        shape (tuple):
+            Shape of the input values.
+        sampling_frequency (float or None):
+            Sampling frequency of the input values.
+
+    Returns:
+        dict:
+            The values of ``n``, ``k``, ``m`` and ``fs``.
+    """
+    return {
+        'n': shape[-1] if shape else 1,
+        'k': shape[-2] if len(shape) > 1 else 1,
+        'm': math.prod(shape[:-1]),
+        'fs': sampling_frequency,
+    }
+
+
+def _get_variables(primitive, shape, sampling_frequency):
+    """Get the variables that the cost expressions of a primitive can use."""
+    variables = {
+        name: spec.get('default')
+        for name, spec in primitive.fixed_hyperparameters.items()
+    }
+    variables.update(primitive.hyperparameter_values)
+    variables.update(get_shape_variables(shape, sampling_frequency))
+    return variables
+
+
+def estimate_primitive_cost(primitive, shape,  # pylint: disable=too-many-locals
+                            sampling_frequency, itemsize):
+    """Estimate the cost of applying a primitive to one signal.
+
+    If the primitive does not declare its cost, its ``flops`` are unknown and its
+    output values are assumed to have the same shape as its input values, or to
+    reduce their last axis if it is an aggregation.
+
+    Args:
+        primitive (sigpro.primitive.Primitive):
+            Primitive to apply.
+        shape (tuple):
+            Shape of the input values.
+        sampling_frequency (float):
+            Sampling frequency of the input values.
+        itemsize (int):
+            Number of bytes of each input value.
+
+    Raises:
+        ValueError:
+            If the cost annotation of the primitive is not valid.
+
+    Returns:
+        dict:
+            The estimated ``flops``, ``output_shape``, ``output_bytes``,
+            ``workspace_bytes``, ``output_itemsize`` and ``sampling_frequency`` of the
+            output values. The ``output_bytes`` add up all the outputs of aggregations.
+    """
+    cost = primitive.get_cost()
+    if not cost:
+        LOGGER.warning('Primitive %s does not declare its cost', primitive.get_name())
+
+    try:
+        variables = _get_variables(primitive, shape, sampling_frequency)
+        for name, expression in cost.get('variables', {}).items():
+            variables[name] = evaluate_cost(expression, variables)
+
+        kept_shape = shape[:len(shape) - cost.get('axes', 1)]
+        output_shape = []
+        is_aggregation = primitive.get_type_subtype()[0] == 'aggregation'
+        default_shape = [KEPT_AXES] if is_aggregation else [KEPT_AXES, 'n']
+        for axis in cost.get('output_shape', default_shape):
+            if axis == KEPT_AXES:
+                output_shape.extend(kept_shape)
+            else:
+                output_shape.append(int(evaluate_cost(axis, variables)))
+
+        flops = float(evaluate_cost(cost.get('flops', np.nan), variables))
+        workspace = evaluate_cost(cost.get('workspace', 0), variables)
+        output_frequency = evaluate_cost(cost.get('sampling_frequency', 'fs'), variables)
+
+    except (ArithmeticError, TypeError) as error:
+        raise ValueError(f'Invalid cost of primitive {primitive.get_name()}: {error}') from None
+
+    output_itemsize = itemsize * 2 if cost.get('complex') else itemsize
+    num_outputs = len(primitive.get_outputs()) if is_aggregation else 1
+
+    return {
+        'flops': flops,
+        'output_shape': tuple(output_shape),
+        'output_bytes': math.prod(output_shape) * output_itemsize * num_outputs,
+        'workspace_bytes': int(workspace * itemsize),
+        'output_itemsize': output_itemsize,
+        'sampling_frequency': output_frequency,
+    }
+
+
+def explain_pipeline(pipeline, signal_length,  # pylint: disable=too-many-locals
+                     sampling_frequency, n_rows=1, num_channels=None):
+    """Estimate the cost of processing signals with a pipeline without running it.
+
+    The prefixes shared by several features, which the pipeline computes once, are
+    only estimated once. The memory estimates assume that the outputs of all the
+    primitives are kept until the features of the signal are computed, like the
+    ``MLPipeline`` does.
+
+    Args:
+        pipeline (sigpro.pipeline.Pipeline):
+            Pipeline to explain.
+        signal_length (int):
+            Number of values of each signal.
+        sampling_frequency (float):
+            Sampling frequency of the signals in Hz.
+        n_rows (int):
+            Number of signals. Defaults to 1.
+        num_channels (int or None):
+            Number of channels of each signal, or ``None`` for single channel signals.
+
+    Raises:
+        ValueError:
+            If the cost annotation of a primitive is not valid.
+
+    Returns:
+        dict:
+            * `primitives (pandas.DataFrame)`: one row per primitive applied, with
+              its ``flops``, ``output_shape``, ``output_bytes``, ``workspace_bytes``
+              and ``peak_bytes`` for a single signal.
+            * `features (pandas.DataFrame)`: one row per feature, with the ``flops``,
+              ``output_bytes`` and ``peak_bytes`` of computing it on its own for a
+              single signal.
+            * `flops (float)`: floating point operations for all the signals.
+            * `row_peak_bytes (int)`: peak memory used to process a single signal.
+            * `peak_bytes (int)`: peak memory used to process all the signals at once,
+              as in a single batch.
+            * `output_bytes (int)`: size of the features of all the signals.
+    """
+    itemsize = np.dtype(pipeline.dtype or np.float64).itemsize
+    shape = (signal_length, ) if num_channels is None else (num_channels, signal_length)
+    signal = {'output_shape': shape, 'output_bytes': math.prod(shape) * itemsize,
+              'workspace_bytes': 0, 'output_itemsize': itemsize,
+              'sampling_frequency': sampling_frequency, 'flops': 0.0}
+
+    estimates = {}
+    features = []
+    for combination in pipeline.get_output_combinations():
+        combination = tuple(combination)
+        previous = signal
+        for layer, primitive in enumerate(combination, start=1):
+            prefix = combination[:layer]
+            if prefix not in estimates:
+                estimate = estimate_primitive_cost(
+                    primitive, previous['output_shape'], previous['sampling_frequency'],
+                    previous['output_itemsize'])
+                estimate['peak_bytes'] = previous['output_bytes'] + estimate['output_bytes']
+                estimate['peak_bytes'] += estimate['workspace_bytes']
+                estimates[prefix] = estimate
+
+            previous = estimates[prefix]
+
+        chain = [estimates[combination[:layer]] for layer in range(1, len(combination) + 1)]
+        peak_bytes = signal['output_bytes'] + sum(step['output_bytes'] for step in chain)
+        peak_bytes += max(step['workspace_bytes'] for step in chain)
+        flops = sum(step['flops'] for step in chain)
+        tags = '.'.join(primitive.get_tag() for primitive in combination)
+        outputs = combination[-1].get_outputs()
+        for output in outputs:
+            features.append({
+                'feature': f"{tags}.{output['name']}",
+                'flops': flops,
+                'output_bytes': previous['output_bytes'] // len(outputs),
+                'peak_bytes': peak_bytes,
+            })
+
+    primitives = pd.DataFrame([
+        dict({'primitive': '.'.join(primitive.get_tag() for primitive in prefix)}, **estimate)
+        for prefix, estimate in estimates.items()
+    ], columns=['primitive', 'flops', 'output_shape', 'output_bytes', 'workspace_bytes',
+                'peak_bytes'])
+    features = pd.DataFrame(features, columns=['feature', 'flops', 'output_bytes',
+                                               'peak_bytes'])
+
+    row_peak_bytes = signal['output_bytes'] + int(primitives['output_bytes'].sum())
+    row_peak_bytes += int(primitives['workspace_bytes'].max()) if len(primitives) else 0
+    return {
+        'primitives': primitives,
+        'features': features,
+        'flops': float(primitives['flops'].sum(skipna=False)) * n_rows,
+        'row_peak_bytes': row_peak_bytes,
+        'peak_bytes': row_peak_bytes * n_rows,
+        'output_bytes': int(features['output_bytes'].sum()) * n_rows,
+    }
@@ -3,14 +3,18 @@
 import json
 import os
 import random
+from functools import lru_cache
 
 import numpy as np
 import pandas as pd
 from scipy.signal import stft
 
 DEMO_PATH = os.path.join(os.path.dirname(__file__), 'data')
+DEMO_SAMPLING_FREQUENCY = 10000
 
 
+# The demo file is read once, so the callers must not modify the returned dataframe.
+@lru_cache(maxsize=2)
 def _load_demo(nrows=None):
     demo_path = os.path.join(DEMO_PATH, 'demo_timeseries.csv')
     df = pd.read_csv(demo_path, parse_dates=['timestamp'], nrows=nrows)
@@ -65,7 +69,20 @@ def get_demo_primitives():
     return transformations, aggregations
 
 
-def get_amplitude_demo(index=None):
+def get_num_demo_signals():
+    """Get the number of signals in the demo data."""
+    return len(_load_demo())
+
+
+def _get_synthetic_signal(index, signal_length):
+    """Get a random signal that is always the same for the same index."""
+    if index is None:
+        index = random.randint(0, 2 ** 32 - 1)
+
+    return np.random.default_rng(index).normal(size=signal_length)
+
+
+def get_amplitude_demo(index=None, signal_length=None):
     """Get amplitude values and sampling frequency used.
 
     The amplitude demo data is meant to be used for the any ``transformation`` functions
@@ -79,20 +96,72 @@ def get_amplitude_demo(index=None):
     Args:
         index (int or None):
             If `int`, return the value at that index if `None` return a random index.
+        signal_length (int or None):
+            If `int`, return a synthetic random signal with this number of values, which
+            is the same for the same index, instead of a demo signal.
 
     Returns:
         tuple:
             A tuple with a `np.array` containing amplitude values and as second element the
             sampling frequency used.
     """
+    if signal_length is not None:
+        return _get_synthetic_signal(index, signal_length), DEMO_SAMPLING_FREQUENCY
+
+    df = _load_demo()
+    if index is None:
+        index = random.randint(0, len(df) - 1)
+
+    return np.array(df.iloc[index]['values']), DEMO_SAMPLING_FREQUENCY
+
+
+def get_comparative_demo(index=None, signal_length=None):
+    """Get the amplitude values of two channels and the sampling frequency used.
+
+    The comparative demo data is meant to be used for the ``comparative`` functions
+    that recieve as an input ``amplitude_values`` with one channel per row and
+    ``sampling_frequency``.
+
+    The two channels are the demo signal at the given index and the following one.
+    You can specify the desired index in order to retrive the same signals over and
+    over, otherwise it will return random signals.
+
+    Args:
+        index (int or None):
+            If `int`, return the value at that index if `None` return a random index.
+        signal_length (int or None):
+            If `int`, return synthetic random signals with this number of values instead
+            of demo signals.
+
+    Returns:
+        tuple:
+            A tuple with a 2D `np.array` containing the amplitude values of each channel
+            and as second element the sampling frequency used.
+    """
+    if signal_length is not None:
+        if index is None:
+            index = random.randint(0, 2 ** 32 - 2)
+
+        amplitude_values = np.stack([
+            _get_synthetic_signal(index, signal_length),
+            _get_synthetic_signal(index + 1, signal_length)
+        ])
+        return amplitude_values, DEMO_SAMPLING_FREQUENCY
+
     df = _load_demo()
     if index is None:
         index = random.randint(0, len(df) - 1)
 
-    return np.array(df.iloc[index]['values']), 10000
+    second_index = (index + 1) % len(df)
+    amplitude_values = np.stack([
+        np.array(df.iloc[index]['values']),
+        np.array(df.iloc[second_index]['values'])
+    ])
+
+    return amplitude_values, DEMO_SAMPLING_FREQUENCY
 
 
-def get_frequency_demo(index=None, real=True):
+def get_frequency_demo(index=None, real=True, signal_length=None):
     """Get amplitude values and the corresponding frequency values.
 
     The frequency demo data is meant to be used for the ``frequency aggregations``
@@ -109,12 +178,15 @@ def get_frequency_demo(index=None, real=True):
         real (bool):
             If ``True``, return the real values for the computed ``fft`` transformations,
             if it's set to ``False`` it will return a complex ndarray. Defaults to ``True``.
+        signal_length (int or None):
+            If `int`, transform a synthetic random signal with this number of values
+            instead of a demo signal.
 
     Returns:
         tuple:
             A tuple two `np.array` containing amplitude values and frequency values.
     """
-    amplitude_values, sampling_frequency = get_amplitude_demo(index)
+    amplitude_values, sampling_frequency = get_amplitude_demo(index, signal_length)
     fft_values = np.fft.fft(amplitude_values)
     length = len(fft_values)
     frequencies = np.fft.fftfreq(len(fft_values), 1 / sampling_frequency)
@@ -124,7 +196,7 @@ def get_frequency_demo(index=None, real=True):
     return fft_values[0:length // 2], frequencies[0:length // 2]
 
 
-def get_frequency_time_demo(index=None, real=True):
+def get_frequency_time_demo(index=None, real=True, signal_length=None):
     """Get amplitude values, frequency values and time values.
 
     The frequency time demo data is meant to be used for the ``frequency time aggregations``
@@ -142,12 +214,15 @@ def get_frequency_time_demo(index=None, real=True):
         real (bool):
             If ``True``, return the real values for the computed ``stft`` transformations,
             if it's set to ``False`` it will return a complex ndarray. Defaults to ``True``.
+        signal_length (int or None):
+            If `int`, transform a synthetic random signal with this number of values
+            instead of a demo signal.
 
     Returns:
         tuple:
             A tuple two `np.array` containing amplitude values and frequency values.
     """
-    amplitude_values, sampling_frequency = get_amplitude_demo(index)
+    amplitude_values, sampling_frequency = get_amplitude_demo(index, signal_length)
     sample_frequencies, time_values, amplitude_values = stft(
         amplitude_values,
         fs=sampling_frequency
@@ -0,0 +1,65 @@
+"""SigPro floating point precision helpers."""
+
+import numpy as np
+
+FLOAT_DTYPES = ('float32', 'float64')
+
+
+def validate_dtype(dtype):
+    """Validate a pipeline level ``dtype`` policy.
+
+    Args:
+        dtype (str, numpy.dtype or None):
+            Floating point type in which the signal values are processed.
+
+    Raises:
+        ValueError:
+            If the given ``dtype`` is not one of the supported floating point types.
+
+    Returns:
+        numpy.dtype or None:
+            The validated ``numpy.dtype`` or ``None`` if no policy was given.
+    """
+    if dtype is None:
+        return None
+
+    try:
+        dtype = np.dtype(dtype)
+    except TypeError:
+        raise ValueError(f'Invalid dtype: {dtype}') from None
+
+    if dtype.name not in FLOAT_DTYPES:
+        raise ValueError(f'dtype must be one of {FLOAT_DTYPES}, got {dtype.name}')
+
+    return dtype
+
+
+def as_float_array(values):
+    """Convert the values to an array preserving its floating point precision.
+
+    Inexact arrays (``float32``, ``complex64``...) are returned as they are, any other
+    input, such as lists or integer arrays, is promoted to ``float64``.
+    """
+    values = np.asarray(values)
+    if not np.issubdtype(values.dtype, np.inexact):
+        values = values.astype(np.float64)
+
+    return values
+
+
+def get_complex_dtype(values):
+    """Return the complex type that matches the precision of the given values."""
+    return np.result_type(values.dtype, np.complex64)
+
+
+def get_accumulator_dtype(values):
+    """Return the type in which reductions over the given values must be accumulated.
+
+    Sums of moments are always accumulated in double precision, even when the
+    values themselves are stored in single precision.
+    """
+    values = np.asarray(values)
+    if np.issubdtype(values.dtype, np.complexfloating):
+        return np.complex128
+
+    return np.float64
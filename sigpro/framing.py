@@ -0,0 +1,94 @@
+"""SigPro sample count framing functionality."""
+
+import numpy as np
+
+
+def _validate_frame_args(frame_size, frame_hop):
+    if frame_size <= 0 or (frame_hop is not None and frame_hop <= 0):
+        raise ValueError('frame_size and frame_hop must be positive integers')
+
+
+def get_frames(values, frame_size, frame_hop=None):
+    """Split a signal in frames of a fixed number of samples.
+
+    The frames are a strided view of the signal, so the samples are not copied even if
+    the frames overlap. The last samples that do not fill a whole frame are dropped.
+
+    Args:
+        values (numpy.ndarray):
+            1D array with the signal values.
+        frame_size (int):
+            Number of samples of each frame.
+        frame_hop (int or None):
+            Number of samples between the start of consecutive frames. If ``None``,
+            the frames do not overlap. Defaults to ``None``.
+
+    Returns:
+        numpy.ndarray:
+            2D array with one frame per row. It is empty if the signal is shorter
+            than a frame.
+    """
+    _validate_frame_args(frame_size, frame_hop)
+    values = np.asarray(values)
+    if len(values) < frame_size:
+        return np.empty((0, frame_size), dtype=values.dtype)
+
+    frames = np.lib.stride_tricks.sliding_window_view(values, frame_size)
+    return frames[::frame_hop or frame_size]
+
+
+def iter_group_frames(data, values_column_name, frame_size, frame_hop=None, time_index=None,
+                      groupby_index=None):
+    """Split the samples of each group of a dataframe in frames.
+
+    Each row of ``data`` holds one sample of the signal. The rows are sorted by the
+    ``time_index``, if given, and grouped by the ``groupby_index``.
+
+    Args:
+        data (pandas.DataFrame):
+            Dataframe with one sample per row.
+        values_column_name (str):
+            Column in ``data`` that represents the signal values.
+        frame_size (int):
+            Number of samples of each frame.
+        frame_hop (int or None):
+            Number of samples between the start of consecutive frames. If ``None``,
+            the frames do not overlap. Defaults to ``None``.
+        time_index (str or None):
+            Column in ``data`` that represents the time index.
+        groupby_index (str or list[str] or None):
+            Column(s) that identify each signal. If ``None``, all the rows belong to
+            the same signal.
+
+    Yields:
+        tuple:
+            * `group (dict)`: values of the ``groupby_index`` columns.
+            * `frames (numpy.ndarray)`: 2D array with one frame per row.
+            * `frame_index (numpy.ndarray or None)`: ``time_index`` of the first sample of
+              each frame.
+            * `context (dict)`: values of the other columns in the first row of the group.
+    """
+    _validate_frame_args(frame_size, frame_hop)
+    frame_hop = frame_hop or frame_size
+    if time_index is not None:
+        data = data.sort_values(time_index, kind='stable')
+
+    if groupby_index is None:
+        columns = []
+        groups = [((), data)]
+    else:
+        columns = [groupby_index] if isinstance(groupby_index, str) else list(groupby_index)
+        groups = data.groupby(columns, sort=True)
+
+    excluded = [values_column_name, time_index] + columns
+    for key, group in groups:
+        frames = get_frames(group[values_column_name].to_numpy(), frame_size, frame_hop)
+        if not frames.shape[0]:
+            continue
+
+        frame_index = None
+        if time_index is not None:
+            frame_index = group[time_index].to_numpy()[::frame_hop][:len(frames)]
+
+        context = {k: v for k, v in group.iloc[0].to_dict().items() if k not in excluded}
+        yield dict(zip(columns, key)), frames, frame_index, context
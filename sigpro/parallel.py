@@ -0,0 +1,203 @@
+"""SigPro shared memory parallel processing."""
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import pandas as pd
+
+from sigpro.writer import NUMERIC_KINDS
+
+# Number of chunks of rows sent to each worker, to balance the load between them.
+CHUNKS_PER_WORKER = 4
+
+# State of each worker process, set once by ``_init_worker``.
+_WORKER = {}
+
+
+def _create_shared_array(shape, dtype):
+    """Allocate a shared memory block and return it with an array that uses it."""
+    dtype = np.dtype(dtype)
+    memory = SharedMemory(create=True, size=max(math.prod(shape) * dtype.itemsize, 1))
+    return memory, np.ndarray(shape, dtype=dtype, buffer=memory.buf)
+
+
+def _get_layout(output):
+    """Get the position of each feature in a row of the output buffer and its dtype."""
+    layout = []
+    start = 0
+    for value in output:
+        shape = np.shape(value)
+        layout.append((start, start + math.prod(shape), shape))
+        start += math.prod(shape)
+
+    dtypes = {np.asarray(value).dtype for value in output}
+    if any(dtype.kind not in NUMERIC_KINDS for dtype in dtypes):
+        raise ValueError('Only numeric features can be computed with max_workers')
+
+    return layout, np.result_type(*dtypes)
+
+
+def _write_features(row, output, layout):
+    """Write the features of a signal into its row of the output buffer."""
+    output = output if isinstance(output, tuple) else (output, )
+    for value, (start, stop, shape) in zip(output, layout):
+        if np.shape(value) != shape:
+            raise ValueError(f'Features must have the same shape for all the signals, '
+                             f'got {np.shape(value)} instead of {shape}')
+
+        row[start:stop] = np.ravel(value)
+
+
+def _init_worker(pipeline, signals, features, layout):
+    """Attach the worker process to the shared memory blocks."""
+    signals_name, signals_size, signals_dtype = signals
+    features_name, features_shape, features_dtype = features
+    signals_memory = SharedMemory(name=signals_name)
+    features_memory = SharedMemory(name=features_name)
+    _WORKER.update({
+        'mlpipeline': pipeline.get_pipeline(),
+        'memory': (signals_memory, features_memory),
+        'signals': np.ndarray((signals_size, ), dtype=signals_dtype,
+                              buffer=signals_memory.buf),
+        'features': np.ndarray(features_shape, dtype=features_dtype,
+                               buffer=features_memory.buf),
+        'layout': layout,
+    })
+
+
+def _process_rows(rows):
+    """Compute the features of the signals described by ``(row, offset, shape, context)``."""
+    signals = _WORKER['signals']
+    features = _WORKER['features']
+    for row, offset, shape, context in rows:
+        amplitude_values = signals[offset:offset + math.prod(shape)].reshape(shape)
+        output = _WORKER['mlpipeline'].predict(amplitude_values=amplitude_values, **context)
+        _write_features(features[row], output, _WORKER['layout'])
+
+    return len(rows)
+
+
+def _run_workers(pipeline, rows, signals, features, layout, max_workers, chunk_size,
+                 progress):
+    """Send the rows to a pool of workers attached to the shared memory blocks."""
+    max_workers = max_workers or os.cpu_count()
+    chunk_size = chunk_size or math.ceil(len(rows) / (max_workers * CHUNKS_PER_WORKER))
+    initargs = (pipeline, signals, features, layout)
+    with ProcessPoolExecutor(max_workers, initializer=_init_worker,
+                             initargs=initargs) as executor:
+        chunks = [rows[start:start + chunk_size] for start in range(0, len(rows), chunk_size)]
+        itemsize = np.dtype(signals[2]).itemsize
+        for chunk, count in zip(chunks, executor.map(_process_rows, chunks)):
+            if progress is not None:
+                progress.update(count, sum(math.prod(row[2]) for row in chunk) * itemsize)
+
+
+def _read_features(shared_features, output_names, layout):
+    """Copy the features out of the shared output buffer, one column per feature."""
+    features = {}
+    for name, (start, stop, shape) in zip(output_names, layout):
+        values = np.array(shared_features[:, start:stop])
+        if shape:
+            features[name] = list(values.reshape((len(values), ) + shape))
+        else:
+            features[name] = values[:, 0]
+
+    return features
+
+
+def apply_pipeline_shared(pipeline, data,  # pylint: disable=too-many-locals
+                          values_column_name, max_workers=None, dtype=None, chunk_size=None,
+                          progress=None):
+    """Apply a pipeline to each row of a dataframe in a pool of worker processes.
+
+    The signals of all the rows are copied once into a single shared memory block, so
+    each worker only receives the ``(offset, shape)`` of the signals that it must
+    process, along with their context values, instead of the pickled signals. The
+    workers write the features into a shared output buffer, whose layout and dtype are
+    taken from the features of the first row, which are computed in this process.
+    The cost of sending the work to the workers does not depend on the signal length.
+
+    All the features must be numeric and have the same shape for all the rows.
+
+    Args:
+        pipeline (sigpro.pipeline.Pipeline):
+            Pipeline used to compute the features. It is pickled once per worker.
+        data (pandas.DataFrame):
+            Dataframe with one signal per row.
+        values_column_name (str):
+            Column in ``data`` that represents the signal values.
+        max_workers (int or None):
+            Number of worker processes. If ``None``, the number of CPUs is used.
+        dtype (str or numpy.dtype or None):
+            Type in which the signal values are stored and processed. If ``None``, the
+            common type of the signals is used.
+        chunk_size (int or None):
+            Number of rows sent to a worker at a time. If ``None``, the rows are split
+            in 4 chunks per worker.
+        progress (sigpro.telemetry.ProgressTracker or None):
+            Tracker updated after processing each chunk of rows.
+
+    Raises:
+        ValueError:
+            If the features are not numeric or their shape changes between rows.
+
+    Returns:
+        pandas.DataFrame:
+            A data frame with one column per feature and the index of ``data``.
+    """
+    output_names = pipeline.get_pipeline().get_output_names()
+    if data.empty:
+        return pd.DataFrame(columns=output_names, index=data.index)
+
+    signals = [np.asarray(signal) for signal in data[values_column_name]]
+    if dtype is None:
+        dtype = np.result_type(*{signal.dtype for signal in signals})
+
+    columns = [column for column in data.columns if column != values_column_name]
+    contexts = [dict(zip(columns, row)) for row in zip(*(data[column] for column in columns))]
+    contexts = contexts or [{} for _ in signals]
+
+    offsets = np.cumsum([0] + [signal.size for signal in signals])
+    signals_memory, shared_signals = _create_shared_array((int(offsets[-1]), ), dtype)
+    features_memory = shared_features = None
+    try:
+        for signal, offset in zip(signals, offsets):
+            shared_signals[offset:offset + signal.size] = signal.ravel()
+
+        first_output = pipeline.get_pipeline().predict(
+            amplitude_values=shared_signals[:signals[0].size].reshape(signals[0].shape),
+            **contexts[0]
+        )
+        first_output = first_output if isinstance(first_output, tuple) else (first_output, )
+        layout, features_dtype = _get_layout(first_output)
+
+        features_shape = (len(signals), layout[-1][1] if layout else 0)
+        features_memory, shared_features = _create_shared_array(features_shape, features_dtype)
+        _write_features(shared_features[0], first_output, layout)
+        if progress is not None:
+            progress.update(1, signals[0].size * shared_signals.itemsize)
+
+        rows = [
+            (row, int(offsets[row]), signals[row].shape, contexts[row])
+            for row in range(1, len(signals))
+        ]
+        if rows:
+            _run_workers(pipeline, rows,
+                         (signals_memory.name, len(shared_signals), shared_signals.dtype),
+                         (features_memory.name, features_shape, features_dtype),
+                         layout, max_workers, chunk_size, progress)
+
+        features = _read_features(shared_features, output_names, layout)
+
+    finally:
+        # The arrays must be released before closing the shared memory blocks.
+        shared_signals = shared_features = None
+        for memory in (signals_memory, features_memory):
+            if memory is not None:
+                memory.close()
+                memory.unlink()
+
+    return pd.DataFrame(features, index=data.index, columns=output_names)
@@ -0,0 +1,139 @@
+"""SigPro Parquet input and output functionality."""
+
+import logging
+import os
+import uuid
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow  # pylint: disable=import-outside-toplevel
+        import pyarrow.dataset  # pylint: disable=import-outside-toplevel
+        import pyarrow.parquet  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        raise ImportError(
+            'pyarrow is required to process Parquet datasets. '
+            'Please install it with `pip install sigpro[parquet]`.'
+        ) from None
+
+    return pyarrow
+
+
+def _get_input_columns(pipeline, schema_names, values_column_name, keep_columns,
+                       feature_columns):
+    """Get the columns that must be read from the input dataset."""
+    columns = [values_column_name]
+    for predict_arg in pipeline.get_pipeline().get_predict_args():
+        name = predict_arg['name']
+        if name in schema_names and name not in columns:
+            columns.append(name)
+
+    for column in (keep_columns or []) + (feature_columns or []):
+        if column not in schema_names:
+            raise ValueError(f'Column `{column}` not found in the input dataset')
+
+        if column not in columns:
+            columns.append(column)
+
+    return columns
+
+
+def process_parquet(pipeline, input_path, output_path,  # pylint: disable=too-many-locals
+                    values_column_name='values', keep_columns=None, feature_columns=None,
+                    partition_cols=None, batch_size=DEFAULT_BATCH_SIZE, partitioning='hive',
+                    **kwargs):
+    """Apply a pipeline to a Parquet dataset and write the features to another one.
+
+    The input dataset is read lazily, one batch of at most ``batch_size`` rows at a
+    time, and only the columns required by the pipeline are read: the signal values,
+    the context arguments expected by the primitives and the ``keep_columns`` and
+    ``feature_columns``. Each batch is processed with ``Pipeline.process_signal`` and
+    written to the output dataset as soon as it is ready, so the memory usage is bound
+    by the batch size instead of the dataset size.
+
+    Each row is processed independently, so the ``window`` and ``groupby_index``
+    arguments of ``process_signal`` are not supported.
+
+    Args:
+        pipeline (sigpro.pipeline.Pipeline):
+            Pipeline used to compute the features.
+        input_path (str or list):
+            Path to the input Parquet file or dataset folder, or list of files.
+        output_path (str):
+            Folder of the output Parquet dataset. Files are added to it for each batch,
+            named after a token that is unique to each run, so running again into the
+            same folder adds the new rows to the dataset without overwriting or removing
+            the files of the previous runs. Use a new or empty folder to replace it.
+        values_column_name (str):
+            Column in the input dataset that contains the signal values.
+            Defaults to ``values``.
+        keep_columns (list or None):
+            Columns from the input dataset to keep in the output dataset, such as
+            its partition columns.
+        feature_columns (list or None):
+            Columns from the input dataset that must be considered as features.
+        partition_cols (list or None):
+            Columns used to partition the output dataset. They must be part of the
+            ``keep_columns``. If ``None``, the output dataset is not partitioned.
+        batch_size (int):
+            Maximum number of rows processed at a time. Defaults to 1000.
+        partitioning (str):
+            Partitioning scheme of the input dataset. Defaults to ``hive``.
+        **kwargs:
+            Additional arguments passed to ``Pipeline.process_signal``, such as
+            ``dtype`` or ``cache``.
+
+    Raises:
+        ImportError:
+            If ``pyarrow`` is not installed.
+        ValueError:
+            If the requested columns are not found in the input dataset.
+
+    Returns:
+        list:
+            A list with the feature names written to the output dataset.
+    """
+    pyarrow = _import_pyarrow()
+    if 'window' in kwargs or 'groupby_index' in kwargs:
+        raise ValueError('Windowed processing is not supported for Parquet datasets')
+
+    keep_columns = list(keep_columns or [])
+    for column in partition_cols or []:
+        if column not in keep_columns:
+            raise ValueError(f'Partition column `{column}` must be in keep_columns')
+
+    dataset = pyarrow.dataset.dataset(input_path, format='parquet', partitioning=partitioning)
+    columns = _get_input_columns(pipeline, dataset.schema.names, values_column_name,
+                                 keep_columns, feature_columns)
+
+    os.makedirs(output_path, exist_ok=True)
+    run_token = uuid.uuid4().hex
+    output_features = []
+    for batch_number, batch in enumerate(dataset.to_batches(columns=columns,
+                                                            batch_size=batch_size)):
+        if not batch.num_rows:
+            continue
+
+        data = batch.to_pandas()
+        features, output_features = pipeline.process_signal(
+            data,
+            values_column_name=values_column_name,
+            feature_columns=list(feature_columns) if feature_columns else None,
+            keep_columns=keep_columns,
+            **kwargs
+        )
+
+        table = pyarrow.Table.from_pandas(features, preserve_index=False)
+        pyarrow.parquet.write_to_dataset(
+            table,
+            output_path,
+            partition_cols=partition_cols,
+            basename_template=f'part-{run_token}-{batch_number}-{{i}}.parquet',
+        )
+        LOGGER.debug('Processed batch %s with %s rows', batch_number, batch.num_rows)
+
+    return output_features
@@ -1,19 +1,37 @@
 # -*- coding: utf-8 -*-
 """Pipeline signal processing functionality."""
 
+import asyncio
+import hashlib
+import json
 import logging
 from abc import ABC
 from collections import Counter
 from copy import copy, deepcopy
+from functools import partial
 from itertools import product
 
+import numpy as np
 import pandas as pd
 from mlblocks import MLPipeline
 
+from sigpro.buckets import get_buckets
+from sigpro.buffers import set_output_buffers
+from sigpro.channels import get_num_channels, split_channels
+from sigpro.contributing import _check_primitive_type_and_subtype
+from sigpro.cost import explain_pipeline
+from sigpro.dtypes import validate_dtype
+from sigpro.framing import iter_group_frames
+from sigpro.parallel import apply_pipeline_shared
+from sigpro.parquet import process_parquet
 from sigpro.primitive import Primitive
+from sigpro.telemetry import get_nbytes
+from sigpro.watermarks import DEFAULT_ORIGIN
+from sigpro.writer import FeatureWriter
 
 # Temporary refactor from core, ignore duplicate code.
 # pylint: disable = duplicate-code, too-many-statements, too-many-nested-blocks
+# pylint: disable = too-many-arguments, too-many-locals, too-many-lines, too-many-branches
 DEFAULT_INPUT = [
     {
         'name': 'readings',
@@ -39,6 +57,12 @@ DEFAULT_OUTPUT = [
 ]
 LOGGER = logging.getLogger(__name__)
 
+DEFAULT_QUEUE_SIZE = 8
+_END_OF_STREAM = object()
+
+# Fingerprints of the pipelines whose primitives have already been validated in this process.
+TRUSTED_FINGERPRINTS = set()
+
 
 def _get_primitive_metadata(primitive_object):
     """
@@ -52,12 +76,42 @@ def _get_primitive_metadata(primitive_object):
             hyperparam_dict.get('init_params'))
 
 
+def _get_fingerprint(pipeline_dict):
+    """Return the hexadecimal digest of a pipeline dict."""
+    serialized = json.dumps(pipeline_dict, sort_keys=True, default=repr)
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
+def _select_columns(data, columns):
+    """Select columns of a data frame without copying their values."""
+    return pd.DataFrame({column: data[column] for column in columns}, index=data.index,
+                        copy=False)
+
+
+def _join_columns(*frames):
+    """Join the columns of data frames with the same index without copying their values."""
+    columns = {}
+    for frame in frames:
+        columns.update(frame.items())
+
+    return pd.DataFrame(columns, index=frames[0].index, copy=False)
+
+
+def _rebuild_pipeline(pipeline_dict, trusted_fingerprints):
+    """Rebuild a pickled pipeline."""
+    return Pipeline.from_dict(pipeline_dict, trusted_fingerprints=trusted_fingerprints)
+
+
 class Pipeline(ABC):
     """Abstract Pipeline class to apply multiple transformation and aggregation primitives."""
 
     def __init__(self):
         self.values_column_name = 'values'
         self.input_is_dataframe = True
+        self.dtype = None
+        self.cache = None
+        self._fingerprint = None
+        self._validated = True
         self.pipeline = None
 
     def get_pipeline(self):
@@ -70,7 +124,69 @@ class Pipeline(ABC):
     def _accept_dataframe_input(self, input_is_dataframe):
         self.input_is_dataframe = input_is_dataframe
 
-    def _apply_pipeline(self, window, is_series=False):
+    def _set_dtype(self, dtype):
+        self.dtype = validate_dtype(dtype)
+
+    def _set_cache(self, cache):
+        self.cache = cache
+        self._fingerprint = self.fingerprint() if cache is not None else None
+
+    def _get_cache_key(self, amplitude_values, context):
+        """Get the cache key of a signal from the context values used by the pipeline."""
+        arg_names = set(self._get_predict_arg_names())
+        key_context = {name: value for name, value in context.items() if name in arg_names}
+        return self.cache.get_key(self._fingerprint, amplitude_values, key_context)
+
+    def _predict(self, amplitude_values, context):
+        """Run the ``MLPipeline`` on a signal and return its outputs as a tuple.
+
+        If a ``FeatureCache`` is set, the outputs are looked up in it first and
+        stored in it after being computed. The cache key only depends on the context
+        values that the pipeline takes as arguments, so signals that only differ in
+        other columns, such as timestamps, share the same entry.
+        """
+        key = None
+        if self.cache is not None:
+            key = self._get_cache_key(amplitude_values, context)
+            output = self.cache.get(key)
+            if output is not None:
+                return output
+
+        output = self.pipeline.predict(
+            amplitude_values=amplitude_values,
+            **context,
+        )
+
+        # ensure that we can iterate over output
+        output = output if isinstance(output, tuple) else (output, )
+
+        if key is not None:
+            self.cache.set(key, output)
+
+        return output
+
+    def _get_predict_arg_names(self):
+        """Get the names of the arguments that the ``MLPipeline`` takes from each row."""
+        return [arg['name'] for arg in self.pipeline.get_predict_args()]
+
+    def _get_required_columns(self, data, time_index, groupby_index, feature_columns,
+                              keep_columns):
+        """Get the columns of ``data`` that are needed to process the signal."""
+        if keep_columns is True:
+            return list(data.columns)
+
+        groupby_columns = [groupby_index] if isinstance(groupby_index, str) else \
+            list(groupby_index or [])
+        predict_args = self._get_predict_arg_names()
+        columns = [self.values_column_name]
+        for column in predict_args + [time_index] + groupby_columns + \
+                list(keep_columns or []) + list(feature_columns or []):
+            if column in data.columns and column not in columns:
+                columns.append(column)
+
+        return columns
+
+    def _apply_pipeline(self, window, is_series=False, progress=None):
         """Apply a ``mlblocks.MLPipeline`` to a row.
 
         Apply a ``MLPipeline`` to a window of a ``pd.DataFrame``, this function can
@@ -82,6 +198,8 @@ class Pipeline(ABC):
                 Row or multiple rows (window) used to apply the pipeline to.
             is_series (bool):
                 Indicator whether window is formated as a series or dataframe.
+            progress (sigpro.telemetry.ProgressTracker or None):
+                Tracker updated after processing the window.
         """
         if is_series:
             context = window.to_dict()
@@ -91,18 +209,190 @@ class Pipeline(ABC):
                 k: v for k, v in window.iloc[0].to_dict().items() if k != self.values_column_name
             }
             amplitude_values = list(window[self.values_column_name])
+            if amplitude_values and np.ndim(amplitude_values[0]) > 0:
+                # The samples of the rows of a window form a single signal.
+                amplitude_values = np.concatenate(amplitude_values)
 
-        output = self.pipeline.predict(
-            amplitude_values=amplitude_values,
-            **context,
-        )
-        output_names = self.pipeline.get_output_names()
+        if self.dtype is not None:
+            amplitude_values = np.asarray(amplitude_values, dtype=self.dtype)
 
-        # ensure that we can iterate over output
-        output = output if isinstance(output, tuple) else (output, )
+        output = self._predict(amplitude_values, context)
+        output_names = self.pipeline.get_output_names()
+        if progress is not None:
+            progress.update(1, get_nbytes(amplitude_values))
 
         return pd.Series(dict(zip(output_names, output)))
 
+    def _apply_pipeline_to_rows(self, data, progress=None):
+        """Apply the ``mlblocks.MLPipeline`` to each row of a ``pd.DataFrame``.
+
+        The features are written into preallocated typed columns with a ``FeatureWriter``
+        and the output data frame is only built once, after processing all the rows. The
+        scalar features are cast to their common type, as the ``pandas.Series`` built for
+        each row by ``_apply_pipeline`` would be.
+        """
+        columns = list(data.columns)
+        writer = FeatureWriter(self.pipeline.get_output_names(), len(data))
+        for row_number, row in enumerate(zip(*(data[column] for column in columns))):
+            context = dict(zip(columns, row))
+            amplitude_values = context.pop(self.values_column_name)
+            if self.dtype is not None:
+                amplitude_values = np.asarray(amplitude_values, dtype=self.dtype)
+
+            writer.write(row_number, self._predict(amplitude_values, context))
+            if progress is not None:
+                progress.update(1, get_nbytes(amplitude_values))
+
+        return writer.to_frame(index=data.index, common_dtype=True)
+
+    def _apply_pipeline_to_buckets(self, data, progress=None):
+        """Apply the ``mlblocks.MLPipeline`` to the rows of each bucket at once.
+
+        The rows with the same number of values and the same values of the arguments
+        of the pipeline, such as the ``sampling_frequency``, are stacked in a 2D array
+        and processed with a single call, and the features of each row are written back
+        in the original order of the rows. The other columns, such as timestamps or
+        ids, do not split the buckets.
+        """
+        output_names = self.pipeline.get_output_names()
+        writer = FeatureWriter(output_names, len(data))
+        buckets = get_buckets(data, self.values_column_name, self._get_predict_arg_names())
+        for positions, signals, context in buckets:
+            amplitude_values = np.stack([np.asarray(signal) for signal in signals])
+            if self.dtype is not None:
+                amplitude_values = amplitude_values.astype(self.dtype, copy=False)
+
+            output = self._predict(amplitude_values, context)
+            for name, value in zip(output_names, output):
+                if np.ndim(value) == 0 or len(value) != len(positions):
+                    raise ValueError(f'Output `{name}` does not have one value per row, '
+                                     'its primitives do not support 2D inputs.')
+
+            for index, position in enumerate(positions):
+                writer.write(position, tuple(value[index] for value in output))
+
+            if progress is not None:
+                progress.update(len(positions), amplitude_values.nbytes)
+
+        return writer.to_frame(index=data.index, common_dtype=True)
+
+    def _apply_pipeline_to_frames(self, data, frame_size, frame_hop, time_index,
+                                  groupby_index, progress=None):
+        """Apply the ``mlblocks.MLPipeline`` to all the frames of each group at once."""
+        features = []
+        output_names = self.pipeline.get_output_names()
+        groups = iter_group_frames(data, self.values_column_name, frame_size, frame_hop,
+                                   time_index, groupby_index)
+        for group, frames, frame_index, context in groups:
+            if self.dtype is not None:
+                frames = frames.astype(self.dtype, copy=False)
+
+            group_features = dict(group)
+            if time_index is not None:
+                group_features[time_index] = frame_index
+
+            for name, value in zip(output_names, self._predict(frames, context)):
+                if np.ndim(value) == 0 or len(value) != len(frames):
+                    raise ValueError(f'Output `{name}` does not have one value per frame, '
+                                     'its primitives do not support 2D inputs.')
+
+                group_features[name] = list(value) if np.ndim(value) > 1 else value
+
+            features.append(pd.DataFrame(group_features))
+            if progress is not None:
+                progress.update(len(frames), frames.nbytes)
+
+        if not features:
+            return pd.DataFrame(columns=output_names)
+
+        return pd.concat(features, ignore_index=True)
+
+    def to_dict(self):
+        """Return the specification of the pipeline as a JSON serializable dict."""
+        raise NotImplementedError
+
+    def fingerprint(self):
+        """Return a stable fingerprint of the pipeline.
+
+        The fingerprint is a digest of ``to_dict``, so two pipelines built from the same
+        primitives, hyperparameters and output features have the same fingerprint even if
+        they are different objects.
+
+        Returns:
+            str:
+                Hexadecimal digest that identifies the pipeline.
+        """
+        return _get_fingerprint(self.to_dict())
+
+    def _trust_fingerprint(self):
+        """Trust the fingerprint of a validated pipeline, so ``from_dict`` skips validating it."""
+        if self._validated:
+            TRUSTED_FINGERPRINTS.add(self.fingerprint())
+
+    @staticmethod
+    def from_dict(pipeline_dict, trusted_fingerprints=None):
+        """Build a pipeline from the dict returned by ``to_dict``.
+
+        If the fingerprint of the dict belongs to a pipeline that has already been
+        validated in this process, or to ``trusted_fingerprints``, the primitives are
+        rebuilt without importing their functions and validating their specification.
+
+        Args:
+            pipeline_dict (dict):
+                Dictionary with the specification of the pipeline.
+            trusted_fingerprints (set or None):
+                Additional fingerprints of pipelines that can skip the validation.
+
+        Raises:
+            ValueError:
+                If the pipeline type is unknown or the specification is not valid.
+
+        Returns:
+            sigpro.pipeline.Pipeline:
+                The rebuilt ``LinearPipeline`` or ``LayerPipeline``.
+        """
+        fingerprint = _get_fingerprint(pipeline_dict)
+        validate = fingerprint not in TRUSTED_FINGERPRINTS and \
+            fingerprint not in (trusted_fingerprints or ())
+
+        def build_primitives(primitive_dicts):
+            # The specification of the primitives is validated once by the pipeline.
+            primitives = []
+            for primitive_dict in primitive_dicts:
+                primitive = Primitive.from_dict(primitive_dict, validate=False)
+                if validate:
+                    _check_primitive_type_and_subtype(*primitive.get_type_subtype())
+
+                primitives.append(primitive)
+
+            return primitives
+
+        pipeline_type = pipeline_dict.get('type')
+        if pipeline_type == 'linear':
+            pipeline = LinearPipeline(build_primitives(pipeline_dict['transformations']),
+                                      build_primitives(pipeline_dict['aggregations']),
+                                      validate=validate)
+        elif pipeline_type == 'layer':
+            pipeline = LayerPipeline(build_primitives(pipeline_dict['primitives']),
+                                     pipeline_dict['primitive_combinations'],
+                                     features_as_strings=True, validate=validate)
+        else:
+            raise ValueError(f'Unknown pipeline type: {pipeline_type}')
+
+        TRUSTED_FINGERPRINTS.add(fingerprint)
+        return pipeline
+
+    def __copy__(self):
+        """Return a shallow copy that shares the underlying ``MLPipeline``."""
+        pipeline = self.__class__.__new__(self.__class__)
+        pipeline.__dict__.update(self.__dict__)
+        return pipeline
+
+    def __reduce__(self):
+        """Pickle the pipeline as its dict specification."""
+        trusted_fingerprints = {self.fingerprint()} if self._validated else None
+        return _rebuild_pipeline, (self.to_dict(), trusted_fingerprints)
+
     def get_primitive_names(self):
         """Get a list of names of primitives in the pipeline."""
         return self.pipeline.primitives
@@ -115,6 +405,24 @@ class Pipeline(ABC):
         """Get a list of output feature tuples produced by the pipeline."""
         raise NotImplementedError
 
+    def _get_vectorization_flag(self, flag, default):
+        """Whether all the primitives declare a flag of their ``vectorization`` annotation."""
+        return all(
+            primitive.get_vectorization().get(flag, default)
+            for primitive in self.get_primitives()
+        )
+
+    def _get_comparative_features(self):
+        """Get the output features computed over pairs of channels."""
+        comparative_features = set()
+        for combination in self.get_output_combinations():
+            if any(prim.get_type_subtype()[1] == 'comparative' for prim in combination):
+                tags = '.'.join(prim.get_tag() for prim in combination)
+                for output_dict in combination[-1].get_outputs():
+                    comparative_features.add(tags + '.' + output_dict['name'])
+
+        return comparative_features
+
     def get_output_features(self):
         """Get a list of output feature strings produced by the pipeline."""
         combinations = self.get_output_combinations()
@@ -128,9 +436,48 @@ class Pipeline(ABC):
 
         return output_features
 
+    def explain(self, signal_length, sampling_frequency, n_rows=1, num_channels=None):
+        """Estimate the cost of processing signals with this pipeline without running it.
+
+        The FLOPs, intermediate array sizes and peak memory of each primitive and each
+        feature are estimated from the ``cost`` annotations of the primitive JSONs,
+        which are described in ``sigpro.cost``. Primitives without a ``cost``
+        annotation have unknown (``NaN``) FLOPs.
+
+        Args:
+            signal_length (int):
+                Number of values of each signal.
+            sampling_frequency (float):
+                Sampling frequency of the signals in Hz.
+            n_rows (int):
+                Number of signals to process. Defaults to 1.
+            num_channels (int or None):
+                Number of channels of each signal, or ``None`` for single channel
+                signals. Defaults to ``None``.
+
+        Raises:
+            ValueError:
+                If the cost annotation of a primitive is not valid.
+
+        Returns:
+            dict:
+                * `primitives (pandas.DataFrame)`: FLOPs, output shape and bytes,
+                  workspace bytes and peak bytes of each primitive for one signal.
+                * `features (pandas.DataFrame)`: FLOPs, output bytes and peak bytes of
+                  each feature, computed on its own, for one signal.
+                * `flops (float)`: FLOPs to process all the signals.
+                * `row_peak_bytes (int)`: peak memory to process one signal.
+                * `peak_bytes (int)`: peak memory to process all the signals at once.
+                * `output_bytes (int)`: size of the features of all the signals.
+        """
+        return explain_pipeline(self, signal_length, sampling_frequency, n_rows, num_channels)
+
     def process_signal(self, data=None, window=None, values_column_name='values',
                        time_index=None, groupby_index=None, feature_columns=None,
-                       keep_columns=False, input_is_dataframe=True, **kwargs):
+                       keep_columns=False, input_is_dataframe=True, dtype=None, cache=None,
+                       watermarks=None, frame_size=None, frame_hop=None,
+                       copy=True,  # pylint: disable=redefined-outer-name
+                       batch=None, max_workers=None, progress=None, **kwargs):
         """Apply multiple transformation and aggregation primitives.
 
         The process_signals method is responsible for applying a Pipeline specified by the
@@ -140,9 +487,15 @@ class Pipeline(ABC):
             data (pandas.DataFrame):
                 Dataframe with a column that contains signal values.
             window (str):
-                Duration of window size, e.g. ('1h').
+                Duration of window size, e.g. ('1h'). The values of the rows of each
+                window are processed as a single signal, so if the rows hold arrays
+                their samples are concatenated.
             values_column_name (str):
-                Column in ``data`` that represents the signal values.
+                Column in ``data`` that represents the signal values. The values of each
+                row can also be a 2D array with shape ``(channels, samples)``, in which
+                case the primitives are applied along the samples axis and each feature
+                is returned in one column per channel, with a ``.ch<i>`` suffix. Only
+                used without ``window`` and ``frame_size``.
             time_index (str):
                 Column in ``data`` that represents the time index.
             groupby_index (str or list[str]):
@@ -155,6 +508,63 @@ class Pipeline(ABC):
                 If a list of column names are passed, those columns are kept.
             input_is_dataframe (bool):
                 Whether the input data is a Dataframe. Used for MLBlocks integration.
+            dtype (str or None):
+                Floating point type, ``float32`` or ``float64``, in which the signal values
+                are processed. The transformations preserve this precision while the
+                aggregations accumulate their reductions in ``float64``. If ``None``, the
+                values are processed as they are given. Defaults to ``None``.
+            cache (sigpro.cache.FeatureCache or None):
+                Persistent cache in which the features of each signal are looked up before
+                computing them. It is not used if a primitive declares that it is not
+                ``pure`` in its ``vectorization`` annotation. If ``None``, no cache is used.
+                Defaults to ``None``.
+            watermarks (sigpro.watermarks.Watermarks or None):
+                Watermarks used to process the windows incrementally. Only the rows from
+                the last window of each group onwards are processed, and the watermarks
+                are then advanced to the new last windows. ``data`` must contain at least
+                the readings since the watermarks. The windows are aligned to the
+                ``epoch`` unless another ``origin`` is given. Only used together with
+                ``window`` and ``groupby_index``. If ``None``, all the windows are
+                computed. Defaults to ``None``.
+            frame_size (int or None):
+                Number of samples of each frame. If given, the samples of each group are
+                split in frames of ``frame_size`` samples instead of being resampled by
+                time, and all the frames of a group are passed to the pipeline at once as
+                a 2D array. The timestamp of the first sample of each frame is used as
+                its ``time_index``. Defaults to ``None``.
+            frame_hop (int or None):
+                Number of samples between the start of consecutive frames. If ``None``,
+                the frames do not overlap. Defaults to ``None``.
+            copy (bool):
+                Whether to work on a copy of ``data``. If ``False``, only the columns that
+                are needed, the values, time index, group, context, ``keep_columns`` and
+                ``feature_columns``, are selected without copying them, and the output
+                data frame shares the kept columns with ``data`` instead of copying the
+                signal values again. ``data`` is never modified, so it must not be
+                modified either while the output is in use. Defaults to ``True``.
+            batch (bool or None):
+                Whether to process the rows in buckets. The rows with the same number of
+                values and the same context arguments of the primitives, such as the
+                ``sampling_frequency``, are stacked in a 2D array and passed to the
+                pipeline at once, and the features are returned in the original order of
+                the rows. Other columns, such as timestamps, do not split the buckets.
+                All the primitives must support 2D inputs. If ``None``, the rows are
+                processed in buckets when all the primitives declare that they are
+                ``batched`` in their ``vectorization`` annotation and ``max_workers`` is
+                not given. Only used without ``window`` and ``frame_size``. Defaults to
+                ``None``.
+            max_workers (int or None):
+                Number of worker processes in which the rows are processed. The signals
+                are copied once into shared memory, so the workers only receive their
+                position and write the features into a shared output buffer. All the
+                features must be numeric and have the same shape for all the rows. It
+                can not be combined with ``cache`` or ``batch``. Only used without
+                ``window`` and ``frame_size``. If ``None``, the rows are processed in
+                this process. Defaults to ``None``.
+            progress (sigpro.telemetry.ProgressTracker or None):
+                Tracker that reports the rows, windows or frames processed, their
+                throughput and the estimated time left to its callbacks periodically.
+                If ``None``, the progress is not tracked. Defaults to ``None``.
 
         Returns:
             tuple:
@@ -169,40 +579,199 @@ class Pipeline(ABC):
         # Error messages are hard to interpret.
         self._set_values_column_name(values_column_name)
         self._accept_dataframe_input(input_is_dataframe)
+        self._set_dtype(dtype)
+        if cache is not None and not self._get_vectorization_flag('pure', True):
+            LOGGER.warning('The features are not cached because not all the primitives are pure')
+            cache = None
+
+        self._set_cache(cache)
 
         if data is None:
             window = pd.Series(kwargs)
             values = self._apply_pipeline(window, is_series=True).values
             return values if len(values) > 1 else values[0]
 
-        data = data.copy()
-        if window is not None and groupby_index is not None:
+        if copy:
+            data = data.copy()
+        else:
+            data = _select_columns(data, self._get_required_columns(
+                data, time_index, groupby_index, feature_columns, keep_columns))
+
+        if progress is not None:
+            # Only the number of rows is known in advance, not the number of windows or frames.
+            by_rows = frame_size is None and (window is None or groupby_index is None)
+            progress.start(len(data) if by_rows else None)
+
+        if frame_size is not None:
+            features = self._apply_pipeline_to_frames(
+                data, frame_size, frame_hop, time_index, groupby_index, progress)
+            data = features
+
+        elif window is not None and groupby_index is not None:
+            if watermarks is not None:
+                kwargs.setdefault('origin', DEFAULT_ORIGIN)
+                data = watermarks.filter(data, time_index, groupby_index)
+
             features = data.set_index(time_index).groupby(groupby_index).resample(
                 rule=window, **kwargs).apply(
-                self._apply_pipeline
+                partial(self._apply_pipeline, progress=progress)
             ).reset_index()
             data = features
+            if watermarks is not None:
+                watermarks.update(features, time_index, groupby_index)
 
         else:
-            features = data.apply(
-                self._apply_pipeline,
-                axis=1,
-                is_series=True
-            )
-            data = pd.concat([data, features], axis=1)
+            num_channels = get_num_channels(data[values_column_name])
+            if max_workers is not None:
+                if cache is not None or batch:
+                    raise ValueError('max_workers can not be combined with cache or batch')
+
+                features = apply_pipeline_shared(self, data, values_column_name, max_workers,
+                                                 self.dtype, progress=progress)
+            elif batch or (batch is None and self._get_vectorization_flag('batched', False)):
+                features = self._apply_pipeline_to_buckets(data, progress)
+            else:
+                features = self._apply_pipeline_to_rows(data, progress)
+
+            if num_channels is not None:
+                features = split_channels(features, num_channels,
+                                          self._get_comparative_features())
+
+            if copy:
+                data = pd.concat([data, features], axis=1)
+            else:
+                data = _join_columns(data, features)
 
         if feature_columns:
             feature_columns = feature_columns + list(features.columns)
         else:
             feature_columns = list(features.columns)
 
+        columns = None
         if isinstance(keep_columns, list):
-            data = data[keep_columns + feature_columns]
+            columns = keep_columns + feature_columns
         elif not keep_columns:
-            data = data[feature_columns]
+            columns = feature_columns
+
+        if columns is not None:
+            data = data[columns] if copy else _select_columns(data, columns)
+
+        if progress is not None:
+            progress.finish()
 
         return data, feature_columns
 
+    async def aprocess_signal(self, data=None, executor=None, **kwargs):
+        """Apply the pipeline without blocking the running event loop.
+
+        The numeric work of ``process_signal`` is offloaded to an executor. Each call
+        works on a shallow copy of the pipeline, so concurrent calls with different
+        arguments can share the same underlying ``MLPipeline``.
+
+        Args:
+            data (pandas.DataFrame):
+                Dataframe with a column that contains signal values.
+            executor (concurrent.futures.Executor or None):
+                Executor in which ``process_signal`` runs. If ``None``, the default
+                executor of the event loop is used.
+            **kwargs:
+                Additional arguments passed to ``process_signal``.
+
+        Returns:
+            tuple:
+                The same output as ``process_signal``.
+        """
+        loop = asyncio.get_running_loop()
+        function = partial(copy(self).process_signal, data, **kwargs)
+        return await loop.run_in_executor(executor, function)
+
+    async def aprocess_stream(self, stream, executor=None, max_queue_size=DEFAULT_QUEUE_SIZE,
+                              **kwargs):
+        """Apply the pipeline to each chunk of data of a stream.
+
+        The chunks are read from the stream by a background task into a bounded queue.
+        When the queue is full the reader waits until the pipeline catches up, which
+        applies backpressure to the source. The chunks are processed in order with
+        ``aprocess_signal``. The chunks of a synchronous iterable are pulled in the
+        default executor of the event loop, so a blocking source, such as a file or a
+        socket, does not block the event loop.
+
+        Args:
+            stream (AsyncIterable or Iterable):
+                Source of ``pandas.DataFrame`` chunks with a column that contains signal
+                values.
+            executor (concurrent.futures.Executor or None):
+                Executor in which ``process_signal`` runs. If ``None``, the default
+                executor of the event loop is used.
+            max_queue_size (int):
+                Maximum number of chunks read ahead from the stream. Defaults to 8.
+            **kwargs:
+                Additional arguments passed to ``process_signal``.
+
+        Yields:
+            tuple:
+                The output of ``process_signal`` for each chunk of the stream.
+        """
+        queue = asyncio.Queue(maxsize=max_queue_size)
+
+        async def read_stream():
+            try:
+                if hasattr(stream, '__aiter__'):
+                    async for data in stream:
+                        await queue.put(data)
+                else:
+                    loop = asyncio.get_running_loop()
+                    iterator = iter(stream)
+                    while True:
+                        data = await loop.run_in_executor(
+                            None, next, iterator, _END_OF_STREAM)
+                        if data is _END_OF_STREAM:
+                            break
+
+                        await queue.put(data)
+
+            except Exception:
+                # Let the chunks already read be processed before raising the error.
+                await queue.put(_END_OF_STREAM)
+                raise
+
+            await queue.put(_END_OF_STREAM)
+
+        reader = asyncio.ensure_future(read_stream())
+        try:
+            while True:
+                data = await queue.get()
+                if data is _END_OF_STREAM:
+                    break
+
+                yield await self.aprocess_signal(data, executor=executor, **kwargs)
+
+            await reader
+
+        finally:
+            reader.cancel()
+
+    def process_parquet(self, input_path, output_path, **kwargs):
+        """Apply the pipeline to a Parquet dataset and write the features to another one.
+
+        The input dataset is read lazily in bounded-size batches, projecting only the
+        columns required by the pipeline, and the features of each batch are appended to
+        the output dataset as soon as they are computed. See
+        ``sigpro.parquet.process_parquet`` for the complete list of arguments.
+
+        Args:
+            input_path (str or list):
+                Path to the input Parquet file or dataset folder, or list of files.
+            output_path (str):
+                Folder of the output Parquet dataset. Each run adds its own files to it,
+                without overwriting the files of the previous runs.
+
+        Returns:
+            list:
+                A list with the feature names written to the output dataset.
+        """
+        return process_parquet(self, input_path, output_path, **kwargs)
+
     def get_input_args(self):
         """Return the pipeline input args."""
         if self.input_is_dataframe:
@@ -230,6 +799,8 @@ class LinearPipeline(Pipeline):
             List of transformation primitive objects.
         aggregations (list):
             List of dictionaries containing the aggregation primitives.
+        validate (bool):
+            Whether to validate the specification of the primitives. Defaults to ``True``.
 
     Returns:
         sigpro.pipeline.LinearPipeline:
@@ -238,9 +809,11 @@ class LinearPipeline(Pipeline):
             the input data.
     """
 
-    def __init__(self, transformations, aggregations):  # pylint: disable=too-many-locals
+    def __init__(self, transformations, aggregations,  # pylint: disable=too-many-locals
+                 validate=True):
 
         super().__init__()
+        self._validated = validate
         self.transformations = transformations
         self.aggregations = aggregations
 
@@ -251,7 +824,9 @@ class LinearPipeline(Pipeline):
         counter = Counter()
 
         for transformation in self.transformations:
-            transformation._validate_primitive_spec()
+            if validate:
+                transformation._validate_primitive_spec()
+
             prefix.append(transformation.get_tag())
             primitive = transformation.get_name()
             counter[primitive] += 1
@@ -264,7 +839,9 @@ class LinearPipeline(Pipeline):
         prefix = '.'.join(prefix) if prefix else ''
 
         for aggregation in self.aggregations:
-            aggregation._validate_primitive_spec()
+            if validate:
+                aggregation._validate_primitive_spec()
+
             aggregation_name = f'{prefix}.{aggregation.get_tag()}' if prefix \
                 else aggregation.get_tag()
 
@@ -273,8 +850,10 @@ class LinearPipeline(Pipeline):
             primitive_name = f'{primitive}#{counter[primitive]}'
             primitives.append(primitive)
 
-            primitive_json = aggregation.make_primitive_json()
-            primitive_outputs = primitive_json['produce']['output']
+            if validate:
+                primitive_outputs = aggregation.make_primitive_json()['produce']['output']
+            else:
+                primitive_outputs = aggregation.get_outputs()
 
             params = aggregation.get_hyperparam_dict().get('init_params')
             if params:
@@ -294,11 +873,21 @@ class LinearPipeline(Pipeline):
             primitives,
             init_params=init_params,
             outputs=outputs)
+        set_output_buffers(self.pipeline, self.get_primitives())
+        self._trust_fingerprint()
 
     def get_primitives(self):
         """Get a list of primitives in the pipeline."""
         return copy(self.transformations.copy() + self.aggregations.copy())
 
+    def to_dict(self):
+        """Return the specification of the pipeline as a JSON serializable dict."""
+        return {
+            'type': 'linear',
+            'transformations': [primitive.to_dict() for primitive in self.transformations],
+            'aggregations': [primitive.to_dict() for primitive in self.aggregations],
+        }
+
     def get_output_combinations(self):
         """Get a list of output feature tuples produced by the pipeline."""
         return [tuple(self.transformations.copy() + [aggregation])
@@ -343,6 +932,9 @@ class LayerPipeline(Pipeline):
             True if primitive_combinations is defined w/ string names,
             False if primitive_combinations is defined with primitive objects (default).
 
+        validate (bool):
+            Whether to validate the specification of the primitives. Defaults to ``True``.
+
     Raises:
         ValueError:
             If the pipeline specification is invalid.
@@ -351,12 +943,17 @@ class LayerPipeline(Pipeline):
         LayerPipeline that generates the primitives in primitive_combinations.
     """
 
-    def __init__(self, primitives, primitive_combinations, features_as_strings=False):
+    def __init__(self, primitives, primitive_combinations, features_as_strings=False,
+                 validate=True):
         """Initialize a LayerPipeline."""
         super().__init__()
+        self._validated = validate
 
         primitives_dict = {}
         for primitive in primitives:
+            if validate:
+                primitive._validate_primitive_spec()
+
             if primitive.get_tag() in primitives_dict:
                 error_str = f'Tag {primitive.get_tag()} is duplicated.'
                 error_str += ' All primitives must have distinct tags.'
@@ -400,6 +997,8 @@ class LayerPipeline(Pipeline):
                     raise ValueError(error_str)
 
         self.pipeline = self._build_pipeline()
+        set_output_buffers(self.pipeline, self.get_primitives())
+        self._trust_fingerprint()
 
     def _build_pipeline(self):  # pylint: disable=too-many-locals, too-many-branches
         """
@@ -536,6 +1135,18 @@ class LayerPipeline(Pipeline):
         """Get a list of primitives in the pipeline."""
         return self.primitives.copy()
 
+    def to_dict(self):
+        """Return the specification of the pipeline as a JSON serializable dict."""
+        primitives = sorted(self.primitives, key=lambda primitive: primitive.get_tag())
+        return {
+            'type': 'layer',
+            'primitives': [primitive.to_dict() for primitive in primitives],
+            'primitive_combinations': [
+                [primitive.get_tag() for primitive in combination]
+                for combination in self.primitive_combinations
+            ],
+        }
+
     def get_output_combinations(self):
         """Get a list of output feature tuples produced by the pipeline."""
         return [x[:] for x in self.primitive_combinations]
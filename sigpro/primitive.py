@@ -3,14 +3,12 @@
 
 import copy
 
-from mlblocks.mlblock import import_object
-
 from sigpro.contributing import (
-    _check_primitive_type_and_subtype, _get_primitive_args, _get_primitive_spec,
-    _make_primitive_dict, _write_primitive)
+    _check_primitive_type_and_subtype, _get_primitive_args, _get_primitive_spec, _import_primitive,
+    _load_annotation, _make_primitive_dict, _write_primitive)
 
 
-class Primitive():  # pylint: disable=too-many-instance-attributes
+class Primitive():  # pylint: disable=too-many-instance-attributes, too-many-public-methods
     """
     Represents a SigPro primitive.
 
@@ -40,13 +38,16 @@ class Primitive():  # pylint: disable=too-many-instance-attributes
         self.tunable_hyperparameters = {}
         self.fixed_hyperparameters = {}
         self.context_arguments = []
+        self.cost = None
+        self.vectorization = None
+        self._annotations = {}
         primitive_spec = _get_primitive_spec(primitive_type, primitive_subtype)
         self.primitive_inputs = primitive_spec['args']
         self.primitive_outputs = primitive_spec['output']
 
         _check_primitive_type_and_subtype(primitive_type, primitive_subtype)
 
-        self.primitive_function = import_object(primitive)
+        self.primitive_function = _import_primitive(primitive)
         if init_params is None:
             init_params = {}
         self.hyperparameter_values = init_params
@@ -75,13 +76,38 @@ class Primitive():  # pylint: disable=too-many-instance-attributes
         """Get the context arguments of the primitive."""
         return copy.deepcopy(self.context_arguments)
 
+    def _get_annotation(self, key):
+        """Get an entry of the JSON annotation of the primitive, which is loaded once."""
+        if key not in self._annotations:
+            self._annotations[key] = _load_annotation(self.primitive, key)
+
+        return copy.deepcopy(self._annotations[key])
+
+    def get_cost(self):
+        """Get the cost annotation of the primitive, loaded from its JSON if it is not set."""
+        if self.cost is None:
+            return self._get_annotation('cost')
+
+        return copy.deepcopy(self.cost)
+
+    def get_vectorization(self):
+        """Get the vectorization capabilities of the primitive, loaded from its JSON if not set."""
+        if self.vectorization is None:
+            return self._get_annotation('vectorization')
+
+        return copy.deepcopy(self.vectorization)
+
     def _validate_primitive_spec(self):  # check compatibility of given parameters.
+        if self.primitive_function is None:
+            self.primitive_function = _import_primitive(self.primitive)
+
         _get_primitive_args(
             self.primitive_function,
             self.primitive_inputs,
             self.context_arguments,
             self.fixed_hyperparameters,
-            self.tunable_hyperparameters)
+            self.tunable_hyperparameters,
+            self.get_vectorization())
 
     def get_hyperparam_dict(self):
         """Return the dictionary of fixed hyperparameters for use in Pipelines."""
@@ -111,6 +137,14 @@ class Primitive():  # pylint: disable=too-many-instance-attributes
         """Set context_arguments of a primitive."""
         self.context_arguments = context_arguments
 
+    def set_cost(self, cost):
+        """Set the cost annotation of a primitive, as described in ``sigpro.cost``."""
+        self.cost = cost
+
+    def set_vectorization(self, vectorization):
+        """Set the vectorization capabilities of a primitive, as in ``make_primitive``."""
+        self.vectorization = vectorization
+
     def set_tunable_hyperparameters(self, tunable_hyperparameters):
         """Set tunable hyperparameters of a primitive."""
         self.tunable_hyperparameters = tunable_hyperparameters
@@ -119,6 +153,83 @@ class Primitive():  # pylint: disable=too-many-instance-attributes
         """Set fixed hyperparameters of a primitive."""
         self.fixed_hyperparameters = fixed_hyperparameters
 
+    def to_dict(self):
+        """
+        Return all the details of this Primitive in a JSON serializable dict.
+
+        The ``cost`` and ``vectorization`` are only included if they were set, so the
+        primitives that use the ones from their JSON annotation keep using them.
+
+        Returns:
+            dict:
+                Dictionary containing the specification and hyperparameter values
+                of the primitive.
+        """
+        primitive_dict = {
+            'primitive': self.primitive,
+            'tag': self.tag,
+            'primitive_type': self.primitive_type,
+            'primitive_subtype': self.primitive_subtype,
+            'init_params': copy.deepcopy(self.hyperparameter_values),
+            'primitive_inputs': [dict(input_dict) for input_dict in self.primitive_inputs],
+            'primitive_outputs': [dict(output_dict) for output_dict in self.primitive_outputs],
+            'context_arguments': copy.deepcopy(list(self.context_arguments)),
+            'fixed_hyperparameters': copy.deepcopy(self.fixed_hyperparameters),
+            'tunable_hyperparameters': copy.deepcopy(self.tunable_hyperparameters),
+        }
+        if self.cost is not None:
+            primitive_dict['cost'] = copy.deepcopy(self.cost)
+
+        if self.vectorization is not None:
+            primitive_dict['vectorization'] = copy.deepcopy(self.vectorization)
+
+        return primitive_dict
+
+    @classmethod
+    def from_dict(cls, primitive_dict, validate=True):
+        """
+        Build a Primitive from the dict returned by ``to_dict``.
+
+        Args:
+            primitive_dict (dict):
+                Dictionary with the specification of the primitive.
+            validate (bool):
+                Whether to import the primitive function and validate the primitive
+                specification. If ``False``, the function is only imported when needed.
+                Defaults to ``True``.
+
+        Raises:
+            ValueError:
+                If ``validate`` is ``True`` and the primitive specification is not valid.
+
+        Returns:
+            sigpro.primitive.Primitive:
+                The rebuilt primitive.
+        """
+        primitive = cls.__new__(cls)
+        primitive.primitive = primitive_dict['primitive']
+        primitive.tag = primitive_dict['tag']
+        primitive.primitive_type = primitive_dict['primitive_type']
+        primitive.primitive_subtype = primitive_dict['primitive_subtype']
+        primitive.hyperparameter_values = copy.deepcopy(primitive_dict['init_params'])
+        primitive.primitive_inputs = copy.deepcopy(primitive_dict['primitive_inputs'])
+        primitive.primitive_outputs = copy.deepcopy(primitive_dict['primitive_outputs'])
+        primitive.context_arguments = copy.deepcopy(primitive_dict['context_arguments'])
+        primitive.fixed_hyperparameters = copy.deepcopy(primitive_dict['fixed_hyperparameters'])
+        primitive.tunable_hyperparameters = copy.deepcopy(
+            primitive_dict['tunable_hyperparameters'])
+        primitive.cost = copy.deepcopy(primitive_dict.get('cost'))
+        primitive.vectorization = copy.deepcopy(primitive_dict.get('vectorization'))
+        primitive._annotations = {}
+        primitive.primitive_function = None
+
+        if validate:
+            _check_primitive_type_and_subtype(primitive.primitive_type,
+                                              primitive.primitive_subtype)
+            primitive._validate_primitive_spec()
+
+        return primitive
+
     def make_primitive_json(self):
         """
         View the primitive json produced by a Primitive object.
@@ -135,7 +246,8 @@ class Primitive():  # pylint: disable=too-many-instance-attributes
         return _make_primitive_dict(self.primitive, self.primitive_type,
                                     self.primitive_subtype, self.context_arguments,
                                     self.fixed_hyperparameters, self.tunable_hyperparameters,
-                                    self.primitive_inputs, self.primitive_outputs)
+                                    self.primitive_inputs, self.primitive_outputs,
+                                    self.get_cost(), self.get_vectorization())
 
     def write_primitive_json(self, primitives_path='sigpro/primitives',
                              primitives_subfolders=True):
@@ -194,7 +306,9 @@ class ComparativeTransformation(TransformationPrimitive):
     """Generic comparative transformation primitive."""
 
     def __init__(self, primitive, init_params=None):
-        raise NotImplementedError
+        super().__init__(primitive, 'comparative', init_params=init_params)
+
+
 # Aggregations
 
 
@@ -230,4 +344,4 @@ class ComparativeAggregation(AggregationPrimitive):
     """Generic comparative aggregation primitive."""
 
     def __init__(self, primitive, init_params=None):
-        raise NotImplementedError
+        super().__init__(primitive, 'comparative', init_params=init_params)
@@ -0,0 +1,145 @@
+"""SigPro real-time streaming functionality."""
+
+import numpy as np
+
+
+class RingBuffer:
+    """Preallocated buffer that keeps the last ``size`` samples of a stream.
+
+    Every sample is written twice, at its position and ``size`` positions after it, so
+    the last ``size`` samples are always available as a contiguous view of the buffer
+    and the history never needs to be copied or reallocated.
+
+    Args:
+        size (int):
+            Number of samples to keep.
+        dtype (str or numpy.dtype):
+            Type of the samples. Defaults to ``float64``.
+    """
+
+    def __init__(self, size, dtype='float64'):
+        self.size = size
+        self.count = 0
+        self._data = np.zeros(2 * size, dtype=dtype)
+        self._position = 0
+
+    def extend(self, samples):
+        """Append the given samples to the buffer."""
+        samples = np.asarray(samples)
+        self.count += len(samples)
+        samples = samples[-self.size:]
+
+        start = self._position
+        end = start + len(samples)
+        first = min(end, self.size) - start
+        for offset in (0, self.size):
+            self._data[offset + start:offset + start + first] = samples[:first]
+            self._data[offset:offset + len(samples) - first] = samples[first:]
+
+        self._position = end % self.size
+
+    def view(self):
+        """Return a read-only view of the last ``size`` samples, from oldest to newest."""
+        window = self._data[self._position:self._position + self.size]
+        window.flags.writeable = False
+        return window
+
+
+class StreamProcessor:
+    """Compute the features of a pipeline over sliding windows of live signals.
+
+    The samples of each sensor are pushed as they arrive into a preallocated
+    ``RingBuffer``. Every time a window of ``window_size`` samples completes, which
+    happens every ``hop_size`` samples once the first window is full, the pipeline
+    is applied to a view of the buffer and the features are emitted.
+
+    Args:
+        pipeline (sigpro.pipeline.Pipeline):
+            ``LinearPipeline`` or ``LayerPipeline`` used to compute the features.
+        window_size (int):
+            Number of samples of each window.
+        hop_size (int or None):
+            Number of samples between the start of consecutive windows. If ``None``,
+            the windows do not overlap. Defaults to ``None``.
+        context (dict or None):
+            Context values passed to the pipeline along with each window, such as
+            the ``sampling_frequency``.
+        dtype (str or numpy.dtype):
+            Type of the samples stored in the buffers. Defaults to ``float64``.
+    """
+
+    def __init__(self, pipeline, window_size, hop_size=None, context=None, dtype='float64'):
+        if window_size <= 0:
+            raise ValueError('window_size must be a positive integer')
+
+        hop_size = hop_size or window_size
+        if hop_size <= 0:
+            raise ValueError('hop_size must be a positive integer')
+
+        self.pipeline = pipeline
+        self.window_size = window_size
+        self.hop_size = hop_size
+        self.context = context or {}
+        self.dtype = dtype
+        self._output_names = pipeline.get_pipeline().get_output_names()
+        self._buffers = {}
+
+    def _get_buffer(self, sensor):
+        buffer = self._buffers.get(sensor)
+        if buffer is None:
+            buffer = RingBuffer(self.window_size, self.dtype)
+            self._buffers[sensor] = buffer
+
+        return buffer
+
+    def _get_next_window_end(self, count):
+        """Return the number of samples after which the next window completes."""
+        if count < self.window_size:
+            return self.window_size
+
+        elapsed = (count - self.window_size) % self.hop_size
+        return count + self.hop_size - elapsed
+
+    def _compute_features(self, window):
+        output = self.pipeline.get_pipeline().predict(amplitude_values=window, **self.context)
+        output = output if isinstance(output, tuple) else (output, )
+        return dict(zip(self._output_names, output))
+
+    def push(self, samples, sensor=None):
+        """Push new samples of a sensor and compute the features of the completed windows.
+
+        Args:
+            samples (numpy.ndarray or list):
+                New samples of the sensor, in order.
+            sensor (hashable or None):
+                Identifier of the sensor. Each sensor has its own buffer.
+
+        Returns:
+            list:
+                A list of ``(start, features)`` tuples, one for each window completed by
+                the new samples, where ``start`` is the index of the first sample of the
+                window in the sensor stream and ``features`` is a dict with the output
+                feature names and values.
+        """
+        buffer = self._get_buffer(sensor)
+        samples = np.asarray(samples, dtype=self.dtype)
+        emitted = []
+        while len(samples):
+            next_window_end = self._get_next_window_end(buffer.count)
+            pending = next_window_end - buffer.count
+            buffer.extend(samples[:pending])
+            samples = samples[pending:]
+            if buffer.count == next_window_end:
+                start = buffer.count - self.window_size
+                emitted.append((start, self._compute_features(buffer.view())))
+
+        return emitted
+
+    def get_sample_count(self, sensor=None):
+        """Return the number of samples pushed for a sensor."""
+        buffer = self._buffers.get(sensor)
+        return buffer.count if buffer is not None else 0
+
+    def reset(self, sensor=None):
+        """Discard the samples pushed for a sensor."""
+        self._buffers.pop(sensor, None)
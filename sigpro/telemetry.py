@@ -0,0 +1,214 @@
+"""SigPro throughput telemetry."""
+
+import json
+import logging
+import os
+import time
+
+import numpy as np
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL = 10.0
+
+
+def get_nbytes(values):
+    """Return the number of bytes of the signal values."""
+    nbytes = getattr(values, 'nbytes', None)
+    return nbytes if nbytes is not None else np.asarray(values).nbytes
+
+
+class ProgressTracker:
+    """Track the throughput of ``Pipeline.process_signal`` and report it periodically.
+
+    The tracker counts the processed units, which are rows, windows or frames depending
+    on how the signal is processed, and the bytes of their signal values. Every
+    ``interval`` seconds, and once more when the processing finishes, a report is sent
+    to each callback as a dict with the following keys:
+
+        * ``processed``: number of units processed so far.
+        * ``total``: total number of units, or ``None`` if it is not known in advance.
+        * ``elapsed``: seconds since the processing started.
+        * ``rows_per_second``: units processed per second.
+        * ``bytes_per_second``: bytes of signal values processed per second.
+        * ``eta``: estimated seconds until the processing finishes, or ``None``.
+        * ``slowest_seconds``: longest time spent on a single update since the last
+          report, which points at stragglers.
+        * ``finished``: whether this is the final report.
+
+    Args:
+        callbacks (list[callable]):
+            Functions called with each report, such as a ``LoggingReporter``.
+        interval (float):
+            Minimum number of seconds between reports. Defaults to 10.
+        clock (callable):
+            Function that returns the current time in seconds. Defaults to
+            ``time.perf_counter``.
+    """
+
+    def __init__(self, callbacks, interval=DEFAULT_INTERVAL, clock=time.perf_counter):
+        self.callbacks = list(callbacks)
+        self.interval = interval
+        self.clock = clock
+        self.total = None
+        self.processed = 0
+        self.nbytes = 0
+        self._times = {}
+
+    def start(self, total=None):
+        """Reset the counters and start timing a new run of ``total`` units."""
+        now = self.clock()
+        self.total = total
+        self.processed = 0
+        self.nbytes = 0
+        self._times = {'start': now, 'update': now, 'report': now, 'slowest': 0.0}
+
+    def update(self, count=1, nbytes=0):
+        """Count ``count`` processed units with ``nbytes`` bytes of signal values.
+
+        A report is sent if ``interval`` seconds have passed since the last one.
+        """
+        now = self.clock()
+        self.processed += count
+        self.nbytes += nbytes
+        self._times['slowest'] = max(self._times['slowest'], now - self._times['update'])
+        self._times['update'] = now
+        if now - self._times['report'] >= self.interval:
+            self._report(now)
+
+    def finish(self):
+        """Send the final report."""
+        self._report(self.clock(), finished=True)
+
+    def get_report(self, now=None, finished=False):
+        """Build a report with the current throughput.
+
+        Args:
+            now (float or None):
+                Current time, as returned by ``clock``. If ``None``, ``clock`` is called.
+            finished (bool):
+                Whether the processing has finished. Defaults to ``False``.
+
+        Returns:
+            dict:
+                The throughput report.
+        """
+        now = self.clock() if now is None else now
+        elapsed = now - self._times['start']
+        rows_per_second = self.processed / elapsed if elapsed > 0 else 0.0
+        eta = None
+        if finished:
+            eta = 0.0
+        elif self.total is not None and rows_per_second > 0:
+            eta = max(self.total - self.processed, 0) / rows_per_second
+
+        return {
+            'processed': self.processed,
+            'total': self.total,
+            'elapsed': elapsed,
+            'rows_per_second': rows_per_second,
+            'bytes_per_second': self.nbytes / elapsed if elapsed > 0 else 0.0,
+            'eta': eta,
+            'slowest_seconds': self._times['slowest'],
+            'finished': finished,
+        }
+
+    def _report(self, now, finished=False):
+        report = self.get_report(now, finished)
+        self._times['report'] = now
+        self._times['slowest'] = 0.0
+        for callback in self.callbacks:
+            callback(report)
+
+
+class LoggingReporter:  # pylint: disable=too-few-public-methods
+    """Log each throughput report.
+
+    Args:
+        logger (logging.Logger or None):
+            Logger used to write the reports. Defaults to the logger of this module.
+        level (int):
+            Level of the log messages. Defaults to ``logging.INFO``.
+    """
+
+    def __init__(self, logger=None, level=logging.INFO):
+        self.logger = logger or LOGGER
+        self.level = level
+
+    def __call__(self, report):
+        """Log a report."""
+        total = report['total'] if report['total'] is not None else '?'
+        eta = f"{report['eta']:.1f}s" if report['eta'] is not None else '?'
+        self.logger.log(
+            self.level,
+            'Processed %s/%s in %.1fs: %.1f rows/s, %.1f MB/s, ETA %s, slowest %.3fs',
+            report['processed'], total, report['elapsed'], report['rows_per_second'],
+            report['bytes_per_second'] / 1e6, eta, report['slowest_seconds']
+        )
+
+
+class JSONLinesExporter:  # pylint: disable=too-few-public-methods
+    """Append each throughput report to a JSON lines file, with its timestamp.
+
+    Args:
+        path (str):
+            Path of the JSON lines file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def __call__(self, report):
+        """Append a report to the file."""
+        with open(self.path, 'a') as jsonl_file:
+            jsonl_file.write(json.dumps(dict(report, timestamp=time.time())) + '\n')
+
+
+class PrometheusExporter:  # pylint: disable=too-few-public-methods
+    """Write the last throughput report in the Prometheus text format.
+
+    The file is replaced atomically on each report, so it can be collected by the
+    textfile collector of the Prometheus node exporter.
+
+    Args:
+        path (str):
+            Path of the ``.prom`` file.
+        prefix (str):
+            Prefix of the metric names. Defaults to ``sigpro``.
+    """
+
+    METRICS = (
+        ('processed', 'processed_total', 'counter',
+         'Number of rows, windows or frames processed.'),
+        ('rows_per_second', 'rows_per_second', 'gauge',
+         'Rows, windows or frames processed per second.'),
+        ('bytes_per_second', 'bytes_per_second', 'gauge',
+         'Bytes of signal values processed per second.'),
+        ('elapsed', 'elapsed_seconds', 'gauge', 'Seconds since the processing started.'),
+        ('eta', 'eta_seconds', 'gauge', 'Estimated seconds until the processing finishes.'),
+        ('slowest_seconds', 'slowest_seconds', 'gauge',
+         'Longest time spent on a single update.'),
+        ('finished', 'finished', 'gauge', 'Whether the processing has finished.'),
+    )
+
+    def __init__(self, path, prefix='sigpro'):
+        self.path = path
+        self.prefix = prefix
+
+    def __call__(self, report):
+        """Write a report to the file."""
+        lines = []
+        for key, name, metric_type, description in self.METRICS:
+            if report[key] is None:
+                continue
+
+            metric = f'{self.prefix}_{name}'
+            lines.append(f'# HELP {metric} {description}')
+            lines.append(f'# TYPE {metric} {metric_type}')
+            lines.append(f'{metric} {float(report[key])}')
+
+        temporary_path = f'{self.path}.tmp'
+        with open(temporary_path, 'w') as prom_file:
+            prom_file.write('\n'.join(lines) + '\n')
+
+        os.replace(temporary_path, self.path)
@@ -0,0 +1,169 @@
+"""SigPro Transformations Amplitude Filter module."""
+
+from functools import lru_cache
+
+import scipy.signal
+
+from sigpro.dtypes import as_float_array
+
+FILTER_CACHE_SIZE = 128
+
+
+def _get_cutoff(low, high):
+    """Get the cutoff frequencies and the type of filter that passes the given band."""
+    if low is None and high is None:
+        raise ValueError('At least one of low or high must be given')
+
+    if low is None:
+        return high, 'lowpass'
+
+    if high is None:
+        return low, 'highpass'
+
+    return (low, high), 'bandpass'
+
+
+@lru_cache(maxsize=FILTER_CACHE_SIZE)
+def _design_iir_filter(low, high, order, ftype, max_ripple, min_attenuation,
+                       sampling_frequency):
+    """Design an IIR filter as second-order sections, once per set of arguments."""
+    cutoff, btype = _get_cutoff(low, high)
+    return scipy.signal.iirfilter(order, cutoff, rp=max_ripple, rs=min_attenuation,
+                                  btype=btype, ftype=ftype, output='sos', fs=sampling_frequency)
+
+
+@lru_cache(maxsize=FILTER_CACHE_SIZE)
+def _design_fir_filter(low, high, numtaps, window, sampling_frequency):
+    """Design the taps of a FIR filter, once per set of arguments."""
+    cutoff, btype = _get_cutoff(low, high)
+    return scipy.signal.firwin(numtaps, cutoff, window=window, pass_zero=btype,
+                               fs=sampling_frequency)
+
+
+def iir_filter(amplitude_values, sampling_frequency, low=None, high=None, order=4,
+               ftype='butter', max_ripple=None, min_attenuation=None, zero_phase=False):
+    """Filter the amplitude values with an IIR filter.
+
+    The filter is designed with the `iirfilter` function from the `scipy.signal`
+    module as second-order sections, which are numerically stable even for high
+    orders, and applied with `sosfilt`, or `sosfiltfilt` for zero phase filtering.
+    The filter is designed once for each sampling frequency and set of arguments.
+
+    If only ``low`` is given the filter is a high-pass, if only ``high`` is given
+    the filter is a low-pass, and if both are given the filter is a band-pass.
+
+    The values are filtered along the last axis, so a 2D array with one signal
+    per row is processed at once.
+
+    Args:
+        amplitude_values (np.ndarray):
+            A numpy array with the signal values.
+        sampling_frequency (int or float):
+            Sampling frequency value passed in Hz.
+        low (int or float or None):
+            Lower cutoff frequency in Hz. Defaults to ``None``.
+        high (int or float or None):
+            Higher cutoff frequency in Hz. Defaults to ``None``.
+        order (int):
+            Order of the filter. Defaults to 4.
+        ftype (str):
+            Type of IIR filter, ``butter``, ``cheby1``, ``cheby2``, ``ellip`` or
+            ``bessel``. Defaults to ``butter``.
+        max_ripple (float or None):
+            Maximum ripple in the passband in dB, used by ``cheby1`` and ``ellip``.
+        min_attenuation (float or None):
+            Minimum attenuation in the stopband in dB, used by ``cheby2`` and ``ellip``.
+        zero_phase (bool):
+            Whether to filter the values forward and backward, which cancels the
+            phase shift of the filter. Defaults to ``False``.
+
+    Returns:
+        numpy.ndarray:
+            The filtered amplitude values.
+    """
+    amplitude_values = as_float_array(amplitude_values)
+    sos = _design_iir_filter(low, high, order, ftype, max_ripple, min_attenuation,
+                             sampling_frequency)
+    if zero_phase:
+        filtered = scipy.signal.sosfiltfilt(sos, amplitude_values, axis=-1)
+    else:
+        filtered = scipy.signal.sosfilt(sos, amplitude_values, axis=-1)
+
+    return filtered.astype(amplitude_values.dtype, copy=False)
+
+
+def fir_filter(amplitude_values, sampling_frequency, low=None, high=None, numtaps=101,
+               window='hamming', zero_phase=False):
+    """Filter the amplitude values with a FIR filter.
+
+    The taps of the filter are designed with the window method using the `firwin`
+    function from the `scipy.signal` module, once for each sampling frequency and
+    set of arguments, and applied with `lfilter`, or `filtfilt` for zero phase
+    filtering.
+
+    If only ``low`` is given the filter is a high-pass, if only ``high`` is given
+    the filter is a low-pass, and if both are given the filter is a band-pass.
+
+    The values are filtered along the last axis, so a 2D array with one signal
+    per row is processed at once.
+
+    Args:
+        amplitude_values (np.ndarray):
+            A numpy array with the signal values.
+        sampling_frequency (int or float):
+            Sampling frequency value passed in Hz.
+        low (int or float or None):
+            Lower cutoff frequency in Hz. Defaults to ``None``.
+        high (int or float or None):
+            Higher cutoff frequency in Hz. Defaults to ``None``.
+        numtaps (int):
+            Length of the filter. It must be odd for high-pass filters. Defaults to 101.
+        window (str):
+            Window function used to design the filter. Defaults to ``hamming``.
+        zero_phase (bool):
+            Whether to filter the values forward and backward, which cancels the
+            phase shift of the filter. Defaults to ``False``.
+
+    Returns:
+        numpy.ndarray:
+            The filtered amplitude values.
+    """
+    amplitude_values = as_float_array(amplitude_values)
+    taps = _design_fir_filter(low, high, numtaps, window, sampling_frequency)
+    if zero_phase:
+        filtered = scipy.signal.filtfilt(taps, 1.0, amplitude_values, axis=-1)
+    else:
+        filtered = scipy.signal.lfilter(taps, 1.0, amplitude_values, axis=-1)
+
+    return filtered.astype(amplitude_values.dtype, copy=False)
+
+
+def decimate(amplitude_values, sampling_frequency, factor):
+    """Reduce the sampling frequency of the amplitude values.
+
+    The values are resampled with the polyphase implementation of the
+    `resample_poly` function from the `scipy.signal` module, which applies an
+    anti-aliasing FIR filter and only computes the output samples that are kept.
+    Decimating early reduces the size of the values processed by the following
+    primitives.
+
+    The values are decimated along the last axis, so a 2D array with one signal
+    per row is processed at once.
+
+    Args:
+        amplitude_values (np.ndarray):
+            A numpy array with the signal values.
+        sampling_frequency (int or float):
+            Sampling frequency value passed in Hz.
+        factor (int):
+            Decimation factor. One of every ``factor`` samples is kept.
+
+    Returns:
+        tuple:
+            * `amplitude_values (numpy.ndarray)`
+            * `sampling_frequency (float)`: the sampling frequency of the decimated values.
+    """
+    amplitude_values = as_float_array(amplitude_values)
+    decimated = scipy.signal.resample_poly(amplitude_values, 1, factor, axis=-1)
+
+    return decimated.astype(amplitude_values.dtype, copy=False), sampling_frequency / factor
@@ -3,26 +3,47 @@
 
 import numpy as np
 
+from sigpro.dtypes import as_float_array
 
-def power_spectrum(amplitude_values, sampling_frequency):
+
+def power_spectrum(amplitude_values, sampling_frequency, out=None):
     """Apply an RFFT on the amplitude values and return the real components.
 
     This computes the discrete Fourier Transform using the `rfft` function
     from `numpy.fft` module and compute the frequency values using the
     `rfftfreq` from the same module.
 
+    The floating point precision of the amplitude values is preserved, so
+    ``float32`` signals produce ``float32`` spectra.
+
+    The spectrum is computed along the last axis, so a 2D array with one
+    signal per row is processed at once.
+
+    The power is computed in place, in ``out`` if it is given, so the only
+    temporary array is the complex spectrum.
+
     Args:
         amplitude_values (np.ndarray):
             A numpy array with the signal values.
         sampling_frequency (int or float):
             Sampling frequency value passed in Hz.
+        out (np.ndarray or None):
+            Array in which the power spectrum is written. It must have the shape
+            of the spectrum. Defaults to ``None``.
 
     Returns:
         tuple:
             * `amplitude_values (numpy.ndarray)`
             * `frequency_values (numpy.ndarray)`
     """
-    frequency_values = np.fft.rfftfreq(len(amplitude_values), 1 / sampling_frequency)
-    amplitude_values = np.abs(np.fft.rfft(amplitude_values)) ** 2
+    amplitude_values = as_float_array(amplitude_values)
+    dtype = amplitude_values.real.dtype
+    frequency_values = np.fft.rfftfreq(amplitude_values.shape[-1], 1 / sampling_frequency)
+    spectrum = np.fft.rfft(amplitude_values)
+    if out is None:
+        out = np.empty(spectrum.shape, dtype=dtype)
+
+    np.abs(spectrum, out=out)
+    np.square(out, out=out)
 
-    return amplitude_values, frequency_values
+    return out, frequency_values
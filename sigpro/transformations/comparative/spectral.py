@@ -0,0 +1,126 @@
+"""SigPro Transformations Comparative Spectral module."""
+
+import numpy as np
+import scipy.signal
+
+from sigpro.channels import get_channel_pairs
+from sigpro.dtypes import as_float_array
+
+DEFAULT_NPERSEG = 256
+
+
+def _get_segment_spectra(amplitude_values, sampling_frequency, nperseg, noverlap, window):
+    """Compute the spectrum of each segment of each channel once."""
+    amplitude_values = as_float_array(amplitude_values)
+    if amplitude_values.ndim < 2:
+        raise ValueError('Comparative primitives need a 2D array with one channel per row')
+
+    if nperseg is None:
+        nperseg = min(DEFAULT_NPERSEG, amplitude_values.shape[-1])
+
+    frequency_values, _, spectra = scipy.signal.stft(
+        amplitude_values,
+        fs=sampling_frequency,
+        window=window,
+        nperseg=nperseg,
+        noverlap=noverlap,
+        detrend='constant',
+        boundary=None,
+        padded=False,
+        scaling='psd',
+        axis=-1
+    )
+
+    return spectra, frequency_values, nperseg
+
+
+def csd(amplitude_values, sampling_frequency, nperseg=None, noverlap=None, window='hann'):
+    """Estimate the cross power spectral density of each pair of channels.
+
+    The estimate follows Welch's method, like the `csd` function from the
+    `scipy.signal` module, but the spectrum of each segment is computed once per
+    channel and then combined for all the pairs, instead of once per pair.
+
+    The channels are expected along the second to last axis, so an array with
+    shape ``(..., channels, samples)`` returns an array with shape
+    ``(..., pairs, frequencies)``.
+
+    Args:
+        amplitude_values (np.ndarray):
+            A numpy array with the signal values of each channel.
+        sampling_frequency (int or float):
+            Sampling frequency value passed in Hz.
+        nperseg (int or None):
+            Length of each segment. If ``None``, segments of 256 samples, or the
+            signal length if it is shorter, are used. Defaults to ``None``.
+        noverlap (int or None):
+            Number of samples to overlap between segments. If ``None``, half of the
+            segment length is used. Defaults to ``None``.
+        window (str):
+            Window function applied to each segment. Defaults to ``hann``.
+
+    Returns:
+        tuple:
+            * `amplitude_values (numpy.ndarray)`: complex cross power spectral density
+              of each pair of channels.
+            * `frequency_values (numpy.ndarray)`
+    """
+    spectra, frequency_values, nperseg = _get_segment_spectra(
+        amplitude_values, sampling_frequency, nperseg, noverlap, window)
+    first, second = get_channel_pairs(spectra.shape[-3])
+    cross = np.mean(np.conj(spectra[..., first, :, :]) * spectra[..., second, :, :], axis=-1)
+
+    # One sided spectrum, the power of the negative frequencies is added to the positive ones.
+    if nperseg % 2:
+        cross[..., 1:] *= 2
+    else:
+        cross[..., 1:-1] *= 2
+
+    return cross, frequency_values
+
+
+def coherence(amplitude_values, sampling_frequency, nperseg=None, noverlap=None,
+              window='hann'):
+    """Estimate the magnitude squared coherence of each pair of channels.
+
+    The coherence is computed from the cross and auto power spectral densities
+    estimated with Welch's method, like the `coherence` function from the
+    `scipy.signal` module, but the spectrum of each segment is computed once per
+    channel and then combined for all the pairs, instead of once per pair.
+
+    The channels are expected along the second to last axis, so an array with
+    shape ``(..., channels, samples)`` returns an array with shape
+    ``(..., pairs, frequencies)``. The coherence is 0 at the frequencies where
+    either channel of the pair has no power, instead of ``NaN``.
+
+    Args:
+        amplitude_values (np.ndarray):
+            A numpy array with the signal values of each channel.
+        sampling_frequency (int or float):
+            Sampling frequency value passed in Hz.
+        nperseg (int or None):
+            Length of each segment. If ``None``, segments of 256 samples, or the
+            signal length if it is shorter, are used. Defaults to ``None``.
+        noverlap (int or None):
+            Number of samples to overlap between segments. If ``None``, half of the
+            segment length is used. Defaults to ``None``.
+        window (str):
+            Window function applied to each segment. Defaults to ``hann``.
+
+    Returns:
+        tuple:
+            * `amplitude_values (numpy.ndarray)`: coherence, between 0 and 1, of each
+              pair of channels.
+            * `frequency_values (numpy.ndarray)`
+    """
+    spectra, frequency_values, _ = _get_segment_spectra(
+        amplitude_values, sampling_frequency, nperseg, noverlap, window)
+    first, second = get_channel_pairs(spectra.shape[-3])
+    power = np.mean(np.abs(spectra) ** 2, axis=-1)
+    cross = np.mean(np.conj(spectra[..., first, :, :]) * spectra[..., second, :, :], axis=-1)
+    numerator = np.abs(cross) ** 2
+    denominator = power[..., first, :] * power[..., second, :]
+    coherence_values = np.divide(
+        numerator, denominator, out=np.zeros_like(numerator), where=denominator > 0)
+
+    return coherence_values, frequency_values
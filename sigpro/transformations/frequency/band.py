@@ -1,5 +1,7 @@
 """SigPro Frequency Band module."""
 
+import numpy as np
+
 
 def frequency_band(amplitude_values, frequency_values, low, high):
     """Extract a specific band.
@@ -17,5 +19,7 @@ def frequency_band(amplitude_values, frequency_values, low, high):
             * `amplitude_values (numpy.ndarray)` for the selected frequency values.
             * `frequency_values (numpy.ndarray)` for the selected frequency values.
     """
+    amplitude_values = np.asarray(amplitude_values)
+    frequency_values = np.asarray(frequency_values)
     mask = (frequency_values > low) & (frequency_values < high)
-    return amplitude_values[mask], frequency_values[mask]
+    return amplitude_values[..., mask], frequency_values[mask]
@@ -2,6 +2,8 @@
 
 import numpy as np
 
+from sigpro.dtypes import as_float_array, get_complex_dtype
+
 
 def fft(amplitude_values, sampling_frequency):
     """Apply an FFT on the amplitude values and return the real components.
@@ -10,6 +12,12 @@ def fft(amplitude_values, sampling_frequency):
     from `numpy.fft` module and compute the frequency values using the
     `fftfreq` from the same module.
 
+    The floating point precision of the amplitude values is preserved, so
+    ``float32`` signals produce ``complex64`` values.
+
+    The FFT is computed along the last axis, so a 2D array with one signal
+    per row is processed at once.
+
     Args:
         amplitude_values (np.ndarray):
             A numpy array with the signal values.
@@ -21,8 +29,10 @@ def fft(amplitude_values, sampling_frequency):
             * `amplitude_values (numpy.ndarray)`
             * `frequency_values (numpy.ndarray)`
     """
-    amplitude_values = np.fft.fft(amplitude_values)
-    frequency_values = np.fft.fftfreq(len(amplitude_values), 1 / sampling_frequency)
+    amplitude_values = as_float_array(amplitude_values)
+    dtype = get_complex_dtype(amplitude_values)
+    amplitude_values = np.fft.fft(amplitude_values).astype(dtype, copy=False)
+    frequency_values = np.fft.fftfreq(amplitude_values.shape[-1], 1 / sampling_frequency)
 
     return amplitude_values, frequency_values
 
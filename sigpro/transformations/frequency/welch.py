@@ -0,0 +1,57 @@
+"""SigPro Transformations Frequency Welch module."""
+
+import scipy.signal
+
+from sigpro.dtypes import as_float_array
+
+DEFAULT_NPERSEG = 256
+
+
+def welch(amplitude_values, sampling_frequency, nperseg=None, noverlap=None,
+          window='hann', average='mean'):
+    """Estimate the power spectral density using Welch's method.
+
+    This computes the power spectral density using the `welch` function from
+    the `scipy.signal` module, which splits the signal into overlapping segments,
+    computes a modified periodogram for each one of them and averages them.
+
+    The estimate is computed along the last axis, so a 2D array with one signal
+    per row is processed at once.
+
+    Args:
+        amplitude_values (np.ndarray):
+            A numpy array with the signal values.
+        sampling_frequency (int or float):
+            Sampling frequency value passed in Hz.
+        nperseg (int or None):
+            Length of each segment. If ``None``, segments of 256 samples, or the
+            signal length if it is shorter, are used. Defaults to ``None``.
+        noverlap (int or None):
+            Number of samples to overlap between segments. If ``None``, half of the
+            segment length is used. Defaults to ``None``.
+        window (str):
+            Window function applied to each segment. Defaults to ``hann``.
+        average (str):
+            Method used to average the periodograms, ``mean`` or ``median``.
+            Defaults to ``mean``.
+
+    Returns:
+        tuple:
+            * `amplitude_values (numpy.ndarray)`
+            * `frequency_values (numpy.ndarray)`
+    """
+    amplitude_values = as_float_array(amplitude_values)
+    if nperseg is None:
+        nperseg = min(DEFAULT_NPERSEG, amplitude_values.shape[-1])
+
+    frequency_values, amplitude_values = scipy.signal.welch(
+        amplitude_values,
+        fs=sampling_frequency,
+        window=window,
+        nperseg=nperseg,
+        noverlap=noverlap,
+        average=average,
+        axis=-1
+    )
+
+    return amplitude_values, frequency_values
@@ -0,0 +1,124 @@
+"""SigPro incremental processing watermarks."""
+
+import json
+
+import pandas as pd
+
+DEFAULT_ORIGIN = 'epoch'
+_WATERMARK_COLUMN = '__watermark__'
+
+
+def _to_builtin(value):
+    """Convert numpy scalars to python objects so they can be serialized to JSON."""
+    return value.item() if hasattr(value, 'item') else value
+
+
+class Watermarks:
+    """Per group watermarks used to recompute only the newest windows of a signal.
+
+    The watermark of a group is the start of its last window, which is the only one that
+    may still receive new readings. Windows that start before the watermark are closed,
+    so when ``Pipeline.process_signal`` runs again over the appended data only the rows
+    from the watermark onwards are processed: the last, possibly partial, window is
+    recomputed with the new readings and the following windows are computed for the
+    first time.
+
+    The window boundaries must not depend on the first row of the data, so the windows
+    are aligned to the ``epoch`` unless another ``origin`` is passed to ``resample``.
+
+    Args:
+        watermarks (dict or None):
+            Initial watermarks as a dict of group key tuples and timestamps.
+    """
+
+    def __init__(self, watermarks=None):
+        self._watermarks = {
+            tuple(group): pd.Timestamp(timestamp)
+            for group, timestamp in (watermarks or {}).items()
+        }
+
+    @staticmethod
+    def _get_groupby_columns(groupby_index):
+        return [groupby_index] if isinstance(groupby_index, str) else list(groupby_index)
+
+    def get(self, group):
+        """Return the watermark of a group or ``None`` if it has not been processed."""
+        if not isinstance(group, tuple):
+            group = (group, )
+
+        return self._watermarks.get(group)
+
+    def filter(self, data, time_index, groupby_index):
+        """Select the rows of each group that are not part of a closed window.
+
+        Args:
+            data (pandas.DataFrame):
+                Readings with the ``time_index`` and ``groupby_index`` columns.
+            time_index (str):
+                Column in ``data`` that represents the time index.
+            groupby_index (str or list[str]):
+                Column(s) that identify each group.
+
+        Returns:
+            pandas.DataFrame:
+                The rows of ``data`` at or after the watermark of their group, and all
+                the rows of the groups without watermark.
+        """
+        if not self._watermarks:
+            return data
+
+        columns = self._get_groupby_columns(groupby_index)
+        watermarks = pd.DataFrame(
+            [group + (timestamp, ) for group, timestamp in self._watermarks.items()],
+            columns=columns + [_WATERMARK_COLUMN]
+        )
+        watermarks = data[columns].merge(watermarks, how='left', on=columns)[_WATERMARK_COLUMN]
+        watermarks.index = data.index
+
+        mask = watermarks.isna() | (data[time_index] >= watermarks)
+        return data[mask]
+
+    def update(self, features, time_index, groupby_index):
+        """Advance the watermarks to the last window of each group.
+
+        Args:
+            features (pandas.DataFrame):
+                Features computed per window, with the ``time_index`` column set to the
+                start of each window and the ``groupby_index`` columns.
+            time_index (str):
+                Column in ``features`` that represents the start of each window.
+            groupby_index (str or list[str]):
+                Column(s) that identify each group.
+        """
+        columns = self._get_groupby_columns(groupby_index)
+        last_windows = features.groupby(columns)[time_index].max()
+        for group, timestamp in last_windows.items():
+            group = group if isinstance(group, tuple) else (group, )
+            previous = self._watermarks.get(group)
+            if previous is None or timestamp > previous:
+                self._watermarks[group] = pd.Timestamp(timestamp)
+
+    def to_dict(self):
+        """Return the watermarks as a dict of group key tuples and timestamps."""
+        return dict(self._watermarks)
+
+    def save(self, path):
+        """Store the watermarks in a JSON file."""
+        watermarks = [
+            [[_to_builtin(value) for value in group], timestamp.isoformat()]
+            for group, timestamp in self._watermarks.items()
+        ]
+        with open(path, 'w') as json_file:
+            json.dump(watermarks, json_file, indent=4)
+
+    @classmethod
+    def load(cls, path):
+        """Load the watermarks stored in a JSON file."""
+        with open(path, 'r') as json_file:
+            watermarks = json.load(json_file)
+
+        return cls({tuple(group): timestamp for group, timestamp in watermarks})
+
+    def __len__(self):
+        """Return the number of groups with a watermark."""
+        return len(self._watermarks)
@@ -0,0 +1,96 @@
+"""SigPro feature output writer."""
+
+import numpy as np
+import pandas as pd
+
+NUMERIC_KINDS = 'biufc'
+
+
+class FeatureWriter:
+    """Collect the features of each row into preallocated typed columns.
+
+    Each feature gets its own NumPy column of ``num_rows`` values, which is allocated the
+    first time that a value is written, with the type of that value. Scalar numeric
+    features are stored in typed columns, which are upcast if a later value needs a wider
+    type, while the rest of the features, such as arrays, are stored in ``object``
+    columns. The ``pandas.DataFrame`` is only built once, by ``to_frame``.
+
+    Args:
+        output_names (list):
+            Names of the features, in the order in which they are written.
+        num_rows (int):
+            Number of rows that will be written.
+    """
+
+    def __init__(self, output_names, num_rows):
+        self.output_names = list(output_names)
+        self.num_rows = num_rows
+        self._columns = [None] * len(self.output_names)
+        self._types = [None] * len(self.output_names)
+
+    @staticmethod
+    def _get_dtype(value):
+        """Get the type of the column that can store the value."""
+        if np.ndim(value) == 0:
+            dtype = np.asarray(value).dtype
+            if dtype.kind in NUMERIC_KINDS:
+                return dtype
+
+        return np.dtype(object)
+
+    def write(self, row, values):
+        """Write the features of a row.
+
+        Args:
+            row (int):
+                Position of the row, between ``0`` and ``num_rows - 1``.
+            values (tuple):
+                Values of the features, in the same order as ``output_names``.
+        """
+        for position, value in enumerate(values):
+            column = self._columns[position]
+            if type(value) is self._types[position]:  # pylint: disable=unidiomatic-typecheck
+                column[row] = value
+                continue
+
+            if column is None:
+                column = np.empty(self.num_rows, dtype=self._get_dtype(value))
+                self._columns[position] = column
+
+            elif column.dtype != object:
+                dtype = self._get_dtype(value)
+                if not np.can_cast(dtype, column.dtype, casting='safe'):
+                    column = column.astype(np.result_type(column.dtype, dtype))
+                    self._columns[position] = column
+
+            column[row] = value
+            if column.dtype != object:
+                # Values of the same type can be written without checking their dtype again.
+                self._types[position] = type(value)
+
+    def to_frame(self, index=None, common_dtype=False):
+        """Build a ``pandas.DataFrame`` with the written features.
+
+        Args:
+            index (pandas.Index or None):
+                Index of the rows. If ``None``, a default range index is used.
+            common_dtype (bool):
+                Whether to cast all the columns to their common type when all the features
+                are numeric scalars, as ``pandas.DataFrame.apply`` does when each row is
+                returned as a ``pandas.Series``. Defaults to ``False``.
+
+        Returns:
+            pandas.DataFrame:
+                A data frame with one column per feature.
+        """
+        columns = [
+            column if column is not None else np.empty(self.num_rows)
+            for column in self._columns
+        ]
+        dtypes = [column.dtype for column in columns]
+        if common_dtype and columns and object not in dtypes:
+            dtype = np.result_type(*dtypes)
+            columns = [column.astype(dtype, copy=False) for column in columns]
+
+        return pd.DataFrame(dict(zip(self.output_names, columns)), index=index,
+                            columns=self.output_names)
@@ -1,11 +1,17 @@
 """Test module for SigPro contributing module."""
+import importlib
+import inspect
 import json
 import os
 import tempfile
+from unittest.mock import Mock, patch
 
+import numpy as np
 import pytest
 
-from sigpro.contributing import make_primitive, run_primitive
+from sigpro.basic_primitives import Mean
+from sigpro.contributing import (
+    _import_primitive, benchmark_primitive, clear_primitive_cache, make_primitive, run_primitive)
 
 EXPECTED_PRIMITIVE_DICT = {
     "name": "sigpro.aggregations.amplitude.statistical.mean",
@@ -59,6 +65,46 @@ def test_make_primitive_missing_additional_hyperparameters():
         )
 
 
+def test_make_primitive_vectorization():
+    vectorization = {
+        'batched': True,
+        'axis': -1,
+        'pure': True,
+        'outputs': {'value': {'shape': ['...'], 'dtype': 'float64'}},
+    }
+    with tempfile.TemporaryDirectory('sigpro') as tmp_dir:
+        result = make_primitive(
+            'sigpro.aggregations.amplitude.statistical.mean',
+            'aggregation',
+            'amplitude',
+            primitives_path=tmp_dir,
+            vectorization=vectorization,
+        )
+        with open(result, 'rb') as created_primitive:
+            primitive_dict = json.load(created_primitive)
+
+    assert primitive_dict['vectorization'] == vectorization
+
+
+@pytest.mark.parametrize('vectorization', [
+    {'unknown': True},
+    {'batched': 'yes'},
+    {'axis': 1},
+    {'out_param': 'out'},
+    {'outputs': {'missing': {'dtype': 'float64'}}},
+    {'outputs': {'value': {'dtype': 'invalid'}}},
+    {'outputs': {'value': {'shape': 'n'}}},
+])
+def test_make_primitive_invalid_vectorization(vectorization):
+    with pytest.raises(ValueError):
+        make_primitive(
+            'sigpro.aggregations.amplitude.statistical.mean',
+            'aggregation',
+            'amplitude',
+            vectorization=vectorization,
+        )
+
+
 def test_make_primitive_primitives_subfolders_true():
     with tempfile.TemporaryDirectory('sigpro') as tmp_dir:
         expected_result = ['sigpro', 'aggregations', 'amplitude', 'statistical', 'mean.json']
@@ -118,3 +164,72 @@ def test_run_primitive_transformation():
     result = run_primitive('sigpro.transformations.amplitude.spectrum.power_spectrum')
     assert len(result[0]) == 201
     assert len(result[1]) == 201
+
+
+def test_benchmark_primitive_synthetic():
+    report = benchmark_primitive(
+        'sigpro.aggregations.frequency.band.band_mean',
+        signal_length=512,
+        num_signals=10,
+        batched=True,
+        min_frequency=100,
+        max_frequency=2000,
+    )
+
+    assert report['calls'] == 10
+    assert 0 < report['latency_p50'] <= report['latency_p99'] <= report['latency_max']
+    assert report['calls_per_second'] > 0
+    assert report['peak_bytes'] > 0
+    assert report['batched_calls_per_second'] > 0
+    assert report['batched_matches']
+
+
+def test_benchmark_primitive_not_batched():
+    report = benchmark_primitive('sigpro.transformations.frequency.fft.fft',
+                                 signal_length=64, num_signals=2, batched=False)
+
+    assert report['batched_calls_per_second'] is None
+    assert report['batched_matches'] is None
+
+
+def test_benchmark_primitive_context():
+    """Test that the context arguments also given by the signals can be passed."""
+    report = benchmark_primitive('sigpro.transformations.frequency.fft.fft',
+                                 signal_length=64, num_signals=2, batched=True,
+                                 sampling_frequency=1000)
+
+    assert report['calls'] == 2
+    assert report['batched_matches'] is True
+
+
+@patch('sigpro.contributing._get_primitive_instance')
+def test_benchmark_primitive_batched_mismatch(get_primitive_instance_mock):
+    """Test that a primitive that reduces the whole batch does not match the single calls."""
+    block = Mock()
+    block.produce.side_effect = lambda amplitude_values, **kwargs: np.sum(amplitude_values)
+    get_primitive_instance_mock.return_value = block
+
+    report = benchmark_primitive('sigpro.aggregations.amplitude.statistical.mean',
+                                 signal_length=128, num_signals=3, batched=True)
+
+    assert report['batched_matches'] is False
+
+
+@patch('sigpro.contributing.importlib.import_module', wraps=importlib.import_module)
+@patch('sigpro.contributing.inspect.getfullargspec', wraps=inspect.getfullargspec)
+def test_primitive_cache(getfullargspec_mock, import_module_mock):
+    clear_primitive_cache()
+
+    for _ in range(3):
+        Mean()._validate_primitive_spec()
+
+    function = _import_primitive('sigpro.aggregations.amplitude.statistical.mean')
+
+    assert Mean().primitive_function is function
+    import_module_mock.assert_called_once_with('sigpro.aggregations.amplitude.statistical')
+    getfullargspec_mock.assert_called_once_with(function)
+
+    clear_primitive_cache()
+    _import_primitive('sigpro.aggregations.amplitude.statistical.mean')
+
+    assert import_module_mock.call_count == 2
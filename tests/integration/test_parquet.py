@@ -0,0 +1,106 @@
+"""Test module for SigPro parquet module."""
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sigpro.basic_primitives import FFTReal, Mean, Std
+from sigpro.pipeline import build_linear_pipeline
+
+pyarrow = pytest.importorskip('pyarrow')
+pq = pytest.importorskip('pyarrow.parquet')
+
+
+@pytest.fixture
+def input_path(tmp_path):
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({
+        'turbine_id': ['T1'] * 5 + ['T2'] * 5,
+        'signal_id': list(range(10)),
+        'values': [rng.normal(size=64) for _ in range(10)],
+        'sampling_frequency': [1000] * 10,
+        'unused': ['x'] * 10,
+    })
+    path = tmp_path / 'input'
+    pq.write_to_dataset(pyarrow.Table.from_pandas(data), path, partition_cols=['turbine_id'])
+
+    return path
+
+
+def _get_pipeline():
+    return build_linear_pipeline([FFTReal()], [Mean(), Std()])
+
+
+def test_process_parquet(input_path, tmp_path):
+    # setup
+    output_path = tmp_path / 'output'
+    sample_pipeline = _get_pipeline()
+
+    # run
+    features = sample_pipeline.process_parquet(
+        input_path, output_path, keep_columns=['turbine_id', 'signal_id'],
+        partition_cols=['turbine_id'], batch_size=3)
+
+    # assert
+    input_data = pq.read_table(input_path).to_pandas().sort_values('signal_id')
+    expected, _ = sample_pipeline.process_signal(
+        input_data.reset_index(drop=True), keep_columns=['signal_id'])
+    output = pq.read_table(output_path).to_pandas().sort_values('signal_id')
+
+    assert features == ['fft_real.mean.mean_value', 'fft_real.std.std_value']
+    assert set(output.columns) == {'turbine_id', 'signal_id'} | set(features)
+    assert len(list(output_path.glob('turbine_id=*/*.parquet'))) >= 4
+    pd.testing.assert_frame_equal(
+        output[['signal_id'] + features].reset_index(drop=True), expected)
+    assert list(output['turbine_id'].astype(str)) == ['T1'] * 5 + ['T2'] * 5
+
+
+def test_process_parquet_second_run(input_path, tmp_path):
+    # setup
+    output_path = tmp_path / 'output'
+    sample_pipeline = _get_pipeline()
+    sample_pipeline.process_parquet(input_path, output_path, keep_columns=['signal_id'],
+                                    batch_size=3)
+
+    second_input = tmp_path / 'second_input.parquet'
+    data = pd.DataFrame({'signal_id': [100], 'values': [np.ones(64)],
+                         'sampling_frequency': [1000]})
+    pq.write_table(pyarrow.Table.from_pandas(data), second_input)
+
+    # run
+    sample_pipeline.process_parquet(second_input, output_path, keep_columns=['signal_id'])
+
+    # assert
+    output = pq.read_table(output_path).to_pandas()
+    assert sorted(output['signal_id']) == list(range(10)) + [100]
+
+
+def test_process_parquet_column_projection(input_path, tmp_path):
+    # setup
+    sample_pipeline = _get_pipeline()
+
+    # run
+    with patch.object(sample_pipeline, 'process_signal',
+                      wraps=sample_pipeline.process_signal) as process_signal_mock:
+        sample_pipeline.process_parquet(input_path, tmp_path / 'output', batch_size=4)
+
+    # assert
+    assert process_signal_mock.call_count == 4
+    for call in process_signal_mock.call_args_list:
+        data = call.args[0]
+        assert list(data.columns) == ['values', 'sampling_frequency']
+        assert len(data) <= 4
+
+
+def test_process_parquet_invalid_columns(input_path, tmp_path):
+    sample_pipeline = _get_pipeline()
+
+    with pytest.raises(ValueError):
+        sample_pipeline.process_parquet(input_path, tmp_path, keep_columns=['missing'])
+
+    with pytest.raises(ValueError):
+        sample_pipeline.process_parquet(input_path, tmp_path, partition_cols=['turbine_id'])
+
+    with pytest.raises(ValueError):
+        sample_pipeline.process_parquet(input_path, tmp_path, window='1h')
@@ -1,9 +1,23 @@
 """Test module for SigPro pipeline module."""
+import asyncio
+import json
+import pickle
+import threading
+from unittest.mock import patch
+
+import numpy as np
 import pandas as pd
 import pytest
 
 from sigpro import pipeline, primitive
-from sigpro.basic_primitives import FFT, BandMean, FFTReal, Identity, Kurtosis, Mean
+from sigpro.basic_primitives import (
+    FFT, RMS, STFT, BandEnergy, BandMean, BandStatistics, Coherence, CrossCorrelation, FFTReal,
+    Identity, Kurtosis, Mean, PowerSpectrum, SpectralFlux, Std)
+from sigpro.buffers import get_buffer_pool
+from sigpro.cache import FeatureCache
+from sigpro.contributing import _import_primitive
+from sigpro.telemetry import ProgressTracker
+from sigpro.watermarks import Watermarks
 
 TEST_INPUT = pd.DataFrame({'timestamp': pd.to_datetime(['2020-01-01 00:00:00']),
                            'values': [[1, 2, 3, 4, 5, 6]],
@@ -198,3 +212,631 @@ def test_invalid_layer_pipelines():
 
     with pytest.raises(ValueError):
         pipeline.build_layer_pipeline(all_primitives, features + [intermediate_agg])
+
+
+def test_pipeline_float32():
+    """Test that the float32 dtype policy stays close to the float64 results.
+
+    Single precision keeps around 7 significant digits and the aggregations accumulate
+    their moments in float64, so the features must agree within a relative tolerance
+    of ``1e-4``.
+    """
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({'values': [rng.normal(size=1000) for _ in range(3)],
+                         'sampling_frequency': [1000] * 3})
+
+    transformations = [FFTReal().set_tag('fftr')]
+    aggregations = [Mean(), Std(), RMS(), Kurtosis(), BandMean(100, 300).set_tag('bm')]
+    sample_pipeline = pipeline.build_linear_pipeline(transformations, aggregations)
+
+    expected, _ = sample_pipeline.process_signal(data)
+    result, _ = sample_pipeline.process_signal(data, dtype='float32')
+
+    pd.testing.assert_frame_equal(result, expected, rtol=1e-4)
+
+
+def test_pipeline_invalid_dtype():
+    """Test that only floating point dtype policies are accepted."""
+    sample_pipeline = pipeline.build_linear_pipeline([Identity()], [Mean()])
+
+    with pytest.raises(ValueError):
+        sample_pipeline.process_signal(TEST_INPUT, dtype='int32')
+
+
+def test_frequency_time_pipeline():
+    """Test the frequency_time aggregations on top of an STFT."""
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({'values': [rng.normal(size=1024) for _ in range(2)],
+                         'sampling_frequency': [1000] * 2})
+
+    aggregations = [BandEnergy(0, 100), BandStatistics(0, 100), SpectralFlux()]
+    sample_pipeline = pipeline.build_tree_pipeline([[STFT()]], aggregations)
+
+    processed_signal, feature_list = sample_pipeline.process_signal(data)
+
+    assert feature_list == sample_pipeline.get_output_features()
+    assert len(feature_list) == 6
+    np.testing.assert_array_almost_equal(processed_signal['stft.band_energy.value'],
+                                         processed_signal['stft.band_statistics.mean_value'])
+
+
+def test_pipeline_cache(tmp_path):
+    """Test that cached features are loaded instead of recomputed."""
+    sample_pipeline = pipeline.build_linear_pipeline([FFTReal().set_tag('fftr')], [Mean()])
+    feature_cache = FeatureCache(tmp_path)
+
+    expected, _ = sample_pipeline.process_signal(TEST_INPUT, cache=feature_cache)
+    with patch.object(sample_pipeline.pipeline, 'predict') as predict_mock:
+        result, _ = sample_pipeline.process_signal(TEST_INPUT, cache=feature_cache)
+
+    predict_mock.assert_not_called()
+    pd.testing.assert_frame_equal(result, expected)
+    assert feature_cache.hits == 1
+    assert len(feature_cache) == 1
+
+
+def test_pipeline_cache_context(tmp_path):
+    """Test that the columns that are not arguments of the primitives do not change the key."""
+    data = pd.DataFrame({
+        'timestamp': pd.date_range('2020-01-01', periods=3),
+        'values': [[1, 2, 3, 4, 5, 6]] * 3,
+        'sampling_frequency': 10000,
+    })
+    sample_pipeline = pipeline.build_linear_pipeline([FFTReal()], [Mean()])
+    feature_cache = FeatureCache(tmp_path)
+
+    sample_pipeline.process_signal(data, cache=feature_cache, batch=False)
+    sample_pipeline.process_signal(data, cache=feature_cache, batch=False, copy=False)
+
+    assert len(feature_cache) == 1
+    assert feature_cache.hits == 5
+
+
+def test_pipeline_cache_fingerprint(tmp_path):
+    """Test that pipelines with different features do not share cache entries."""
+    feature_cache = FeatureCache(tmp_path)
+    pipeline.build_linear_pipeline([Identity()], [Mean()]).process_signal(
+        TEST_INPUT, cache=feature_cache)
+
+    result, _ = pipeline.build_linear_pipeline([Identity()], [Std()]).process_signal(
+        TEST_INPUT, cache=feature_cache)
+
+    assert feature_cache.hits == 0
+    assert len(feature_cache) == 2
+    assert result['identity.std.std_value'][0] == np.std([1, 2, 3, 4, 5, 6])
+
+
+def test_pipeline_cache_impure(tmp_path):
+    """Test that the features are not cached if a primitive is not pure."""
+    mean = Mean()
+    mean.set_vectorization({'pure': False})
+    feature_cache = FeatureCache(tmp_path)
+
+    pipeline.build_linear_pipeline([Identity()], [mean]).process_signal(
+        TEST_INPUT, cache=feature_cache)
+
+    assert len(feature_cache) == 0
+
+
+def _build_tree_pipeline():
+    t_layer1 = [FFTReal().set_tag('fftr'), FFT()]
+    t_layer2 = [Identity().set_tag('id1'), Identity().set_tag('id2')]
+    a_layer = [BandMean(200, 50000).set_tag('bm'), Mean(), Kurtosis(fisher=False)]
+
+    return pipeline.build_tree_pipeline([t_layer1, t_layer2], a_layer)
+
+
+def test_process_signal_watermarks():
+    """Test that the incremental mode only recomputes the windows after the watermarks."""
+    timestamps = pd.date_range('2020-01-01', periods=18, freq='10min')
+    data = pd.DataFrame({'timestamp': list(timestamps) * 2,
+                         'device': ['a'] * 18 + ['b'] * 18,
+                         'values': np.arange(36.0)})
+    kwargs = {'window': '1h', 'time_index': 'timestamp', 'groupby_index': 'device'}
+
+    sample_pipeline = pipeline.build_linear_pipeline([Identity()], [Mean()])
+    expected, _ = sample_pipeline.process_signal(data, **kwargs)
+
+    watermarks = Watermarks()
+    sample_pipeline.process_signal(data[data['timestamp'] < '2020-01-01 01:30'],
+                                   watermarks=watermarks, **kwargs)
+    assert watermarks.get('a') == pd.Timestamp('2020-01-01 01:00')
+
+    with patch.object(sample_pipeline, '_predict', wraps=sample_pipeline._predict) as predict_mock:
+        result, _ = sample_pipeline.process_signal(data, watermarks=watermarks, **kwargs)
+
+    assert predict_mock.call_count == 4
+    assert watermarks.get('a') == pd.Timestamp('2020-01-01 02:00')
+    expected = expected[expected['timestamp'] >= '2020-01-01 01:00'].reset_index(drop=True)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_process_signal_window_arrays():
+    """Test that the rows of a window that hold arrays are processed as one signal."""
+    rng = np.random.default_rng(0)
+    values = [rng.normal(size=100), rng.normal(size=100) * 5, rng.normal(size=50)]
+    data = pd.DataFrame({'timestamp': pd.date_range('2020-01-01', periods=3, freq='10min'),
+                         'device': 'a',
+                         'values': values})
+    sample_pipeline = pipeline.build_linear_pipeline([Identity()], [Mean(), Std()])
+
+    result, _ = sample_pipeline.process_signal(
+        data, window='1h', time_index='timestamp', groupby_index='device')
+
+    signal = np.concatenate(values)
+    assert len(result) == 1
+    assert result['identity.mean.mean_value'][0] == pytest.approx(np.mean(signal))
+    assert result['identity.std.std_value'][0] == pytest.approx(np.std(signal))
+
+
+def test_process_signal_no_copy():
+    """Test that the kept columns are not copied and the input is not modified."""
+    data = pd.DataFrame({'values': [np.arange(10.0), np.arange(20.0)],
+                         'sampling_frequency': [10, 20],
+                         'site': ['x', 'y'],
+                         'unused': [1, 2]})
+    original = data.copy()
+    keep_columns = ['values', 'sampling_frequency']
+    sample_pipeline = pipeline.build_linear_pipeline([Identity()], [Mean()])
+    expected, expected_features = sample_pipeline.process_signal(
+        data, keep_columns=keep_columns)
+
+    result, feature_list = sample_pipeline.process_signal(
+        data, keep_columns=keep_columns, copy=False)
+
+    pd.testing.assert_frame_equal(result, expected)
+    assert feature_list == expected_features
+    assert not np.shares_memory(
+        expected['sampling_frequency'].to_numpy(), data['sampling_frequency'].to_numpy())
+    assert np.shares_memory(
+        result['sampling_frequency'].to_numpy(), data['sampling_frequency'].to_numpy())
+    pd.testing.assert_frame_equal(data, original)
+
+
+def test_process_signal_batch():
+    """Test that the rows processed in buckets match the rows processed one by one."""
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({
+        'values': [rng.normal(size=size) for size in [100, 256, 100, 256, 100]],
+        'sampling_frequency': [1000, 1000, 1000, 25600, 10000],
+    })
+    sample_pipeline = pipeline.build_tree_pipeline(
+        [[FFTReal()]], [Mean(), Std(), Kurtosis(), BandMean(10, 100).set_tag('bm')])
+    expected, expected_features = sample_pipeline.process_signal(data)
+
+    with patch.object(sample_pipeline, '_predict', wraps=sample_pipeline._predict) as predict_mock:
+        result, feature_list = sample_pipeline.process_signal(data, batch=True)
+
+    assert predict_mock.call_count == 4
+    assert feature_list == expected_features
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_process_signal_batch_unique_columns():
+    """Test that the columns that are not arguments of the primitives do not split buckets."""
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({
+        'id': range(200),
+        'timestamp': pd.date_range('2020-01-01', periods=200, freq='s'),
+        'values': list(rng.normal(size=(200, 16))),
+        'sampling_frequency': 1000,
+    })
+    sample_pipeline = pipeline.build_linear_pipeline([FFTReal()], [Mean()])
+    expected, _ = sample_pipeline.process_signal(data, batch=False, keep_columns=True)
+
+    with patch.object(sample_pipeline, '_predict', wraps=sample_pipeline._predict) as predict_mock:
+        result, _ = sample_pipeline.process_signal(data, batch=True, keep_columns=True)
+
+    assert predict_mock.call_count == 1
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_process_signal_batch_auto():
+    """Test that the rows are processed in buckets when all the primitives are batched."""
+    sample_pipeline = pipeline.build_linear_pipeline([FFTReal()], [Mean()])
+    with patch.object(sample_pipeline, '_predict', wraps=sample_pipeline._predict) as predict_mock:
+        sample_pipeline.process_signal(TEST_INPUT)
+
+    assert predict_mock.call_count == 1
+
+    mean = Mean()
+    mean.set_vectorization({'batched': False})
+    sample_pipeline = pipeline.build_linear_pipeline([FFTReal()], [mean])
+    with patch.object(sample_pipeline, '_predict', wraps=sample_pipeline._predict) as predict_mock:
+        sample_pipeline.process_signal(pd.concat([TEST_INPUT] * 2, ignore_index=True))
+
+    assert predict_mock.call_count == 2
+
+
+def test_process_signal_output_buffers():
+    """Test that the output buffers of the transformations are reused across rows."""
+    values = np.random.default_rng(0).normal(size=(6, 32))
+    data = pd.DataFrame({'values': list(values), 'sampling_frequency': 100})
+    sample_pipeline = pipeline.build_linear_pipeline([PowerSpectrum()], [Mean()])
+    pool = get_buffer_pool()
+
+    for batch in (False, True):
+        pool.clear()
+        features, _ = sample_pipeline.process_signal(data, batch=batch)
+
+        expected = np.mean(np.abs(np.fft.rfft(values)) ** 2, axis=1)
+        mean_values = features['power_spectrum.mean.mean_value'].astype(float)
+        np.testing.assert_allclose(mean_values, expected)
+        assert pool.get_stats()['allocations'] == 1
+        assert pool.get_stats()['requests'] == (1 if batch else len(data))
+
+
+def test_process_signal_batch_invalid():
+    """Test that the primitives must support 2D inputs to process the rows in buckets."""
+    sample_pipeline = pipeline.build_linear_pipeline([Identity()], [Kurtosis()])
+
+    with patch.object(sample_pipeline, '_predict', return_value=(0.0, )):
+        with pytest.raises(ValueError):
+            sample_pipeline.process_signal(TEST_INPUT, batch=True)
+
+
+def test_process_signal_channels():
+    """Test that each channel gets the features that it would get on its own."""
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({'values': [rng.normal(size=(3, 100)) for _ in range(4)],
+                         'sampling_frequency': 1000})
+    sample_pipeline = pipeline.build_tree_pipeline([[FFTReal()]], [Mean(), Kurtosis()])
+
+    result, feature_list = sample_pipeline.process_signal(data)
+
+    assert feature_list == [
+        f'{feature}.ch{channel}'
+        for feature in sample_pipeline.get_output_features() for channel in range(3)
+    ]
+    for channel in range(3):
+        channel_data = data.assign(values=[values[channel] for values in data['values']])
+        expected, _ = sample_pipeline.process_signal(channel_data)
+        expected.columns = [f'{column}.ch{channel}' for column in expected.columns]
+        pd.testing.assert_frame_equal(result[expected.columns], expected)
+
+    batch_result, _ = sample_pipeline.process_signal(data, batch=True)
+    pd.testing.assert_frame_equal(batch_result, result)
+
+
+def test_process_signal_channels_mixed_lengths():
+    """Test that multi-channel rows of different lengths are not batched together."""
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({'values': [rng.normal(size=(3, length)) for length in (100, 200, 100)],
+                         'sampling_frequency': 1000})
+    sample_pipeline = pipeline.build_tree_pipeline([[FFTReal()]], [Mean(), Kurtosis()])
+
+    expected, _ = sample_pipeline.process_signal(data, batch=False)
+    result, _ = sample_pipeline.process_signal(data, batch=True)
+
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_process_signal_max_workers():
+    """Test that the rows processed in worker processes match the rows processed here."""
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({
+        'values': [rng.normal(size=size) for size in [100, 256, 100, 256, 100]],
+        'sampling_frequency': [1000, 1000, 1000, 25600, 10000],
+        'dummy': 1,
+    })
+    sample_pipeline = pipeline.build_tree_pipeline(
+        [[FFTReal()]], [Mean(), Std(), Kurtosis(), BandMean(10, 100).set_tag('bm')])
+    expected, expected_features = sample_pipeline.process_signal(data, keep_columns=['dummy'])
+
+    result, feature_list = sample_pipeline.process_signal(data, keep_columns=['dummy'],
+                                                          max_workers=2)
+
+    assert feature_list == expected_features
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_process_signal_max_workers_invalid():
+    """Test that the worker processes can not be combined with the batches."""
+    sample_pipeline = pipeline.build_linear_pipeline([Identity()], [Mean()])
+
+    with pytest.raises(ValueError):
+        sample_pipeline.process_signal(TEST_INPUT, max_workers=2, batch=True)
+
+
+def test_explain():
+    """Test that the cost of the shared prefixes is only estimated once."""
+    sample_pipeline = pipeline.build_tree_pipeline(
+        [[Identity(), FFTReal()]], [Mean(), Std()])
+
+    explanation = sample_pipeline.explain(1024, 1000, n_rows=10)
+
+    primitives = explanation['primitives'].set_index('primitive')
+    assert list(primitives.index) == [
+        'identity', 'identity.mean', 'identity.std', 'fft_real', 'fft_real.mean', 'fft_real.std']
+    assert primitives.loc['fft_real', 'output_shape'] == (1024, )
+    assert primitives.loc['fft_real.mean', 'output_shape'] == ()
+
+    features = explanation['features'].set_index('feature')
+    assert list(features.index) == sample_pipeline.get_output_features()
+    assert features.loc['fft_real.std.std_value', 'flops'] == (
+        primitives.loc['fft_real', 'flops'] + primitives.loc['fft_real.std', 'flops'])
+
+    assert explanation['flops'] == primitives['flops'].sum() * 10
+    assert explanation['peak_bytes'] == explanation['row_peak_bytes'] * 10
+    assert explanation['output_bytes'] == 4 * 8 * 10
+
+
+def test_explain_channels():
+    """Test that the comparative primitives estimate one output per pair of channels."""
+    coherence = Coherence()
+    mean = Mean()
+    sample_pipeline = pipeline.build_layer_pipeline([coherence, mean], [(coherence, mean)])
+
+    primitives = sample_pipeline.explain(1024, 1000, num_channels=4)['primitives']
+
+    assert list(primitives['output_shape']) == [(6, 129), (6, )]
+
+
+def test_process_signal_progress():
+    """Test that the progress of the rows is reported while they are processed."""
+    reports = []
+    progress = ProgressTracker([reports.append], interval=0)
+    sample_pipeline = pipeline.build_linear_pipeline([Identity()], [Mean()])
+
+    sample_pipeline.process_signal(TEST_INPUT, progress=progress)
+
+    assert len(reports) == len(TEST_INPUT) + 1
+    assert reports[-1]['processed'] == len(TEST_INPUT)
+    assert reports[-1]['total'] == len(TEST_INPUT)
+    assert reports[-1]['finished']
+
+
+def test_process_signal_comparative():
+    """Test that the comparative features get one column per pair of channels."""
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({'values': [rng.normal(size=(3, 512)) for _ in range(2)],
+                         'sampling_frequency': 1000})
+    identity, coherence, band_mean = Identity(), Coherence(nperseg=64), BandMean(10, 100)
+    mean, cross_correlation = Mean(), CrossCorrelation()
+    sample_pipeline = pipeline.build_layer_pipeline(
+        [identity, coherence, band_mean, mean, cross_correlation],
+        [(coherence, band_mean), (identity, mean), (cross_correlation, )]
+    )
+
+    result, feature_list = sample_pipeline.process_signal(data)
+
+    pairs = ['ch0_ch1', 'ch0_ch2', 'ch1_ch2']
+    expected_features = [f'coherence.band_mean.value.{pair}' for pair in pairs]
+    expected_features += [f'identity.mean.mean_value.ch{channel}' for channel in range(3)]
+    expected_features += [f'cross_correlation.lag_value.{pair}' for pair in pairs]
+    expected_features += [f'cross_correlation.correlation_value.{pair}' for pair in pairs]
+    assert sorted(feature_list) == sorted(expected_features)
+    coherence_values = result[expected_features[:3]].to_numpy()
+    assert ((coherence_values >= 0) & (coherence_values <= 1)).all()
+
+
+def test_process_signal_channels_invalid():
+    """Test that all the signals must have the same number of channels."""
+    data = pd.DataFrame({'values': [np.zeros((3, 10)), np.zeros((2, 10))],
+                         'sampling_frequency': 1000})
+    sample_pipeline = pipeline.build_linear_pipeline([Identity()], [Mean()])
+
+    with pytest.raises(ValueError):
+        sample_pipeline.process_signal(data)
+
+
+def test_process_signal_frames():
+    """Test that the frames of each group match the features of each frame on its own."""
+    rng = np.random.default_rng(0)
+    timestamps = pd.date_range('2020-01-01', periods=500, freq='1ms')
+    data = pd.DataFrame({'timestamp': list(timestamps) * 2,
+                         'device': ['a'] * 500 + ['b'] * 500,
+                         'values': rng.normal(size=1000),
+                         'sampling_frequency': 1000})
+
+    sample_pipeline = pipeline.build_tree_pipeline(
+        [[FFTReal()]], [Mean(), Std(), Kurtosis(), BandMean(10, 100).set_tag('bm')])
+    result, feature_list = sample_pipeline.process_signal(
+        data, frame_size=100, frame_hop=50, time_index='timestamp', groupby_index='device')
+
+    assert len(result) == 18
+    assert list(result['timestamp'][:2]) == list(timestamps[[0, 50]])
+    assert feature_list == ['device', 'timestamp'] + sample_pipeline.get_output_features()
+
+    frames = pd.DataFrame({
+        'values': [data['values'].to_numpy()[start:start + 100] for start in range(500, 901, 50)],
+        'sampling_frequency': 1000
+    })
+    expected, _ = sample_pipeline.process_signal(frames)
+    result = result[result['device'] == 'b'].reset_index(drop=True)
+    pd.testing.assert_frame_equal(result[expected.columns], expected, check_dtype=False)
+
+
+def test_process_signal_frames_invalid():
+    """Test that the frame size and hop must be positive."""
+    sample_pipeline = pipeline.build_linear_pipeline([Identity()], [Mean()])
+
+    with pytest.raises(ValueError):
+        sample_pipeline.process_signal(TEST_INPUT, frame_size=0)
+
+
+def test_pipeline_fingerprint():
+    """Test that equivalent pipelines share the same fingerprint."""
+    fingerprint = _build_tree_pipeline().fingerprint()
+
+    assert fingerprint == _build_tree_pipeline().fingerprint()
+    assert fingerprint != pipeline.build_tree_pipeline(
+        [[FFT()]], [BandMean(100, 50000).set_tag('bm')]).fingerprint()
+    assert fingerprint != pipeline.build_linear_pipeline([FFT()], [Mean()]).fingerprint()
+
+
+def test_pipeline_to_dict_from_dict():
+    """Test that a pipeline rebuilt from its dict produces the same features."""
+    for sample_pipeline in (_build_tree_pipeline(),
+                            pipeline.build_linear_pipeline([Identity(), FFTReal()], [Mean()])):
+        pipeline_dict = json.loads(json.dumps(sample_pipeline.to_dict()))
+
+        rebuilt = pipeline.Pipeline.from_dict(pipeline_dict)
+
+        assert type(rebuilt) is type(sample_pipeline)
+        assert rebuilt.fingerprint() == sample_pipeline.fingerprint()
+        assert rebuilt.get_output_features() == sample_pipeline.get_output_features()
+        _verify_pipeline_outputs(rebuilt, TEST_INPUT, TEST_OUTPUT)
+
+
+def test_pipeline_from_dict_trusted():
+    """Test that trusted pipelines are rebuilt without validating the primitives."""
+    pipeline_dict = pipeline.build_linear_pipeline([Identity()], [Mean()]).to_dict()
+    pipeline.TRUSTED_FINGERPRINTS.clear()
+
+    with patch('sigpro.primitive._import_primitive', wraps=_import_primitive) as import_mock:
+        pipeline.Pipeline.from_dict(pipeline_dict)
+        assert import_mock.call_count == 2
+
+        import_mock.reset_mock()
+        pipeline.Pipeline.from_dict(pipeline_dict)
+        import_mock.assert_not_called()
+
+
+def test_pipeline_from_dict_trusted_layer():
+    """Test that trusted layer pipelines are rebuilt without validating the primitives."""
+    pipeline_dict = _build_tree_pipeline().to_dict()
+    pipeline.TRUSTED_FINGERPRINTS.clear()
+
+    with patch.object(primitive.Primitive, '_validate_primitive_spec',
+                      autospec=True) as validate_mock:
+        pipeline.Pipeline.from_dict(pipeline_dict)
+        assert validate_mock.call_count == len(pipeline_dict['primitives'])
+
+        validate_mock.reset_mock()
+        pipeline.Pipeline.from_dict(pipeline_dict)
+        validate_mock.assert_not_called()
+
+
+def test_pipeline_fingerprint_trust():
+    """Test that only validated pipelines are trusted, when they are built."""
+    pipeline.TRUSTED_FINGERPRINTS.clear()
+    sample_pipeline = pipeline.build_linear_pipeline([Identity()], [Mean()])
+    assert pipeline.TRUSTED_FINGERPRINTS == {sample_pipeline.fingerprint()}
+
+    pipeline.TRUSTED_FINGERPRINTS.clear()
+    sample_pipeline.fingerprint()
+    assert not pipeline.TRUSTED_FINGERPRINTS
+
+    pipeline.LinearPipeline([Identity()], [Std()], validate=False).fingerprint()
+    assert not pipeline.TRUSTED_FINGERPRINTS
+
+
+def test_pipeline_from_dict_invalid():
+    """Test that an untrusted invalid pipeline dict is rejected."""
+    pipeline_dict = pipeline.build_linear_pipeline([Identity()], [Mean()]).to_dict()
+    pipeline_dict['aggregations'][0]['fixed_hyperparameters'] = {'invalid': {'type': 'int'}}
+
+    with pytest.raises(ValueError):
+        pipeline.Pipeline.from_dict(pipeline_dict)
+
+    with pytest.raises(ValueError):
+        pipeline.Pipeline.from_dict({'type': 'invalid'})
+
+
+def test_pipeline_pickle():
+    """Test that pipelines are pickled through their dict specification."""
+    sample_pipeline = _build_tree_pipeline()
+
+    rebuilt = pickle.loads(pickle.dumps(sample_pipeline))
+
+    assert rebuilt.fingerprint() == sample_pipeline.fingerprint()
+    _verify_pipeline_outputs(rebuilt, TEST_INPUT, TEST_OUTPUT)
+
+
+def test_pipeline_pickle_annotations():
+    """Test that the cost and vectorization set on the primitives survive pickling."""
+    mean = Mean()
+    mean.set_cost({'flops': 'n'})
+    mean.set_vectorization({'batched': False, 'pure': False})
+    sample_pipeline = pipeline.build_linear_pipeline([Identity()], [mean])
+
+    rebuilt = pickle.loads(pickle.dumps(sample_pipeline))
+    rebuilt_mean = rebuilt.get_primitives()[-1]
+
+    assert rebuilt_mean.get_cost() == {'flops': 'n'}
+    assert rebuilt_mean.get_vectorization() == {'batched': False, 'pure': False}
+    assert not rebuilt._get_vectorization_flag('pure', True)
+
+
+def test_aprocess_signal():
+    """Test that aprocess_signal matches process_signal for concurrent calls."""
+    sample_pipeline = pipeline.build_linear_pipeline([FFTReal().set_tag('fftr')], [Mean()])
+    expected, expected_columns = sample_pipeline.process_signal(TEST_INPUT)
+
+    async def run():
+        return await asyncio.gather(
+            sample_pipeline.aprocess_signal(TEST_INPUT),
+            sample_pipeline.aprocess_signal(TEST_INPUT, keep_columns=['dummy']),
+        )
+
+    (result, columns), (kept, _) = asyncio.run(run())
+
+    assert columns == expected_columns
+    pd.testing.assert_frame_equal(result, expected)
+    assert list(kept.columns) == ['dummy'] + expected_columns
+
+
+def test_aprocess_stream():
+    """Test that aprocess_stream processes the chunks in order with backpressure."""
+    sample_pipeline = pipeline.build_linear_pipeline([Identity()], [Mean()])
+    chunks = [TEST_INPUT.assign(values=[[value] * 4]) for value in range(6)]
+    pending = []
+
+    async def stream():
+        for chunk in chunks:
+            pending.append(chunk)
+            yield chunk
+
+    async def run():
+        results = []
+        async for result, _ in sample_pipeline.aprocess_stream(stream(), max_queue_size=2):
+            pending.pop(0)
+            # The reader never gets more than max_queue_size chunks ahead of the consumer.
+            assert len(pending) <= 3
+            results.append(result['identity.mean.mean_value'][0])
+
+        return results
+
+    assert asyncio.run(run()) == [0, 1, 2, 3, 4, 5]
+
+
+def test_aprocess_stream_sync_iterable():
+    """Test that the chunks of a synchronous iterable are not read in the event loop."""
+    sample_pipeline = pipeline.build_linear_pipeline([Identity()], [Mean()])
+    chunks = [TEST_INPUT.assign(values=[[value] * 4]) for value in range(3)]
+    reader_threads = set()
+
+    def stream():
+        for chunk in chunks:
+            reader_threads.add(threading.get_ident())
+            yield chunk
+
+    async def run():
+        results = []
+        async for result, _ in sample_pipeline.aprocess_stream(stream()):
+            results.append(result['identity.mean.mean_value'][0])
+
+        return results
+
+    assert asyncio.run(run()) == [0, 1, 2]
+    assert threading.get_ident() not in reader_threads
+
+
+def test_aprocess_stream_error():
+    """Test that the errors raised by the stream are propagated."""
+    sample_pipeline = pipeline.build_linear_pipeline([Identity()], [Mean()])
+
+    def stream():
+        yield TEST_INPUT
+        raise RuntimeError('stream error')
+
+    async def run():
+        results = []
+        async for result, _ in sample_pipeline.aprocess_stream(stream()):
+            results.append(result)
+
+        return results
+
+    with pytest.raises(RuntimeError, match='stream error'):
+        asyncio.run(run())
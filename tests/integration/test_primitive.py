@@ -1,6 +1,7 @@
 """Test module for SigPro primitive and basic_primitives modules."""
 
 from sigpro import basic_primitives, primitive
+from sigpro.cache import FeatureCache
 
 
 def test_basic_primitives():
@@ -15,6 +16,14 @@ def test_basic_primitives():
     identity.make_primitive_json()
     power_spectrum.make_primitive_json()
 
+    iir_filter = basic_primitives.IIRFilter(low=10, high=20)
+    fir_filter = basic_primitives.FIRFilter(high=20)
+    decimate = basic_primitives.Decimate(4)
+    for filter_primitive in (iir_filter, fir_filter, decimate):
+        assert isinstance(filter_primitive, primitive.Primitive)
+        assert filter_primitive.get_type_subtype() == ('transformation', 'amplitude')
+        filter_primitive.make_primitive_json()
+
     fft = basic_primitives.FFT()
     fft_real = basic_primitives.FFTReal()
 
@@ -30,6 +39,11 @@ def test_basic_primitives():
     assert frequency_band.get_type_subtype() == ('transformation', 'frequency')
     frequency_band.make_primitive_json()
 
+    welch = basic_primitives.Welch(nperseg=128)
+    assert isinstance(welch, primitive.Primitive)
+    assert welch.get_type_subtype() == ('transformation', 'frequency')
+    welch.make_primitive_json()
+
     stft = basic_primitives.STFT()
     stft_real = basic_primitives.STFTReal()
     assert isinstance(stft, primitive.Primitive)
@@ -65,6 +79,26 @@ def test_basic_primitives():
     assert band_mean.get_type_subtype() == ('aggregation', 'frequency')
     band_mean.make_primitive_json()
 
+    band_energy = basic_primitives.BandEnergy(min_frequency=0, max_frequency=100)
+    band_statistics = basic_primitives.BandStatistics(min_frequency=0, max_frequency=100)
+    mean_spectrum = basic_primitives.MeanSpectrum()
+    spectral_flux = basic_primitives.SpectralFlux()
+    for frequency_time_aggregation in (band_energy, band_statistics, mean_spectrum,
+                                       spectral_flux):
+        assert isinstance(frequency_time_aggregation, primitive.Primitive)
+        assert frequency_time_aggregation.get_type_subtype() == ('aggregation', 'frequency_time')
+        frequency_time_aggregation.make_primitive_json()
+
+    csd = basic_primitives.CSD(nperseg=128)
+    coherence = basic_primitives.Coherence()
+    cross_correlation = basic_primitives.CrossCorrelation()
+    assert csd.get_type_subtype() == ('transformation', 'comparative')
+    assert coherence.get_type_subtype() == ('transformation', 'comparative')
+    assert cross_correlation.get_type_subtype() == ('aggregation', 'comparative')
+    for comparative_primitive in (csd, coherence, cross_correlation):
+        assert isinstance(comparative_primitive, primitive.Primitive)
+        comparative_primitive.make_primitive_json()
+
 
 def test_primitives():
     """Test primitives module."""
@@ -84,3 +118,66 @@ def test_primitives():
     assert frequency_band.get_hyperparam_dict() == {'name': 'frequency_band_test',
                                                     'primitive': primitive_str,
                                                     'init_params': init_params}
+
+
+def test_primitive_to_dict_from_dict():
+    """Test that a primitive can be rebuilt from its dict."""
+
+    kurtosis = basic_primitives.Kurtosis(bias=False).set_tag('kurtosis_test')
+    primitive_dict = kurtosis.to_dict()
+
+    rebuilt = primitive.Primitive.from_dict(primitive_dict)
+
+    assert rebuilt.to_dict() == primitive_dict
+    assert rebuilt.get_hyperparam_dict() == kurtosis.get_hyperparam_dict()
+    assert rebuilt.make_primitive_json() == kurtosis.make_primitive_json()
+
+
+def test_primitive_from_dict_without_validation():
+    """Test that the primitive function is only imported when needed."""
+
+    primitive_dict = basic_primitives.Mean().to_dict()
+
+    rebuilt = primitive.Primitive.from_dict(primitive_dict, validate=False)
+
+    assert rebuilt.primitive_function is None
+    rebuilt.make_primitive_json()
+    assert rebuilt.primitive_function is not None
+
+
+def test_primitive_cost():
+    """Test that the cost annotation is loaded from the primitive JSON and written back."""
+
+    fft = basic_primitives.FFT()
+
+    assert fft.get_cost()['complex']
+    assert fft.make_primitive_json()['cost'] == fft.get_cost()
+
+    fft.set_cost({'flops': 'n'})
+    assert fft.make_primitive_json()['cost'] == {'flops': 'n'}
+
+
+def test_primitive_to_dict_annotations():
+    """Test that the cost and vectorization set on a primitive survive a round trip."""
+
+    mean = basic_primitives.Mean()
+    mean.get_cost()
+    mean.get_vectorization()
+    assert 'cost' not in mean.to_dict()
+    assert 'vectorization' not in mean.to_dict()
+
+    mean.set_cost({'flops': 'n'})
+    mean.set_vectorization({'batched': False, 'pure': False})
+    rebuilt = primitive.Primitive.from_dict(mean.to_dict())
+
+    assert rebuilt.get_cost() == {'flops': 'n'}
+    assert rebuilt.get_vectorization() == {'batched': False, 'pure': False}
+    assert rebuilt.to_dict() == mean.to_dict()
+
+
+def test_primitive_class_attribute():
+    """Test that primitives can be attributes of classes, as MLBlocks resolves them."""
+    class_primitive = primitive.Primitive(
+        'sigpro.cache.FeatureCache.get_key', 'transformation', 'amplitude')
+
+    assert class_primitive.primitive_function is FeatureCache.get_key
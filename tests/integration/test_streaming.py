@@ -0,0 +1,80 @@
+"""Test module for SigPro streaming module."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sigpro import pipeline
+from sigpro.basic_primitives import FFTReal, Identity, Mean, Std
+from sigpro.streaming import RingBuffer, StreamProcessor
+
+
+def test_ring_buffer():
+    """Test that the ring buffer keeps the last samples in a contiguous view."""
+    buffer = RingBuffer(4)
+    data = buffer._data
+
+    buffer.extend([1, 2, 3])
+    buffer.extend([4, 5])
+    np.testing.assert_array_equal(buffer.view(), [2, 3, 4, 5])
+
+    buffer.extend(np.arange(6, 16))
+    window = buffer.view()
+
+    np.testing.assert_array_equal(window, [12, 13, 14, 15])
+    assert buffer.count == 15
+    assert buffer._data is data
+    assert np.shares_memory(window, data)
+    assert not window.flags.writeable
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 50, 1000])
+def test_stream_processor(chunk_size):
+    """Test that the features emitted every hop match the ones of each window."""
+    sample_pipeline = pipeline.build_linear_pipeline([Identity()], [Mean(), Std()])
+    processor = StreamProcessor(sample_pipeline, window_size=100, hop_size=30)
+
+    signal = np.random.default_rng(0).normal(size=500)
+    emitted = []
+    for start in range(0, len(signal), chunk_size):
+        emitted.extend(processor.push(signal[start:start + chunk_size]))
+
+    starts = [start for start, _ in emitted]
+    assert starts == list(range(0, 401, 30))
+    assert processor.get_sample_count() == 500
+    for start, features in emitted:
+        window = signal[start:start + 100]
+        np.testing.assert_allclose(features['identity.mean.mean_value'], np.mean(window))
+        np.testing.assert_allclose(features['identity.std.std_value'], np.std(window))
+
+
+def test_stream_processor_sensors():
+    """Test that each sensor keeps its own buffer and context is passed to the pipeline."""
+    sample_pipeline = pipeline.build_linear_pipeline([FFTReal()], [Mean()])
+    processor = StreamProcessor(sample_pipeline, window_size=8,
+                                context={'sampling_frequency': 100})
+
+    assert processor.push(np.ones(6), sensor='a') == []
+    assert processor.push(np.ones(8), sensor='b')[0][0] == 0
+
+    emitted = processor.push(np.ones(4), sensor='a')
+    expected, _ = sample_pipeline.process_signal(
+        pd.DataFrame({'values': [np.ones(8)], 'sampling_frequency': [100]}))
+
+    assert len(emitted) == 1
+    assert emitted[0][1]['fft_real.mean.mean_value'] == expected['fft_real.mean.mean_value'][0]
+    assert processor.get_sample_count('a') == 10
+
+    processor.reset('a')
+    assert processor.get_sample_count('a') == 0
+
+
+def test_stream_processor_invalid():
+    """Test that the window and hop sizes must be positive."""
+    sample_pipeline = pipeline.build_linear_pipeline([Identity()], [Mean()])
+
+    with pytest.raises(ValueError):
+        StreamProcessor(sample_pipeline, window_size=0)
+
+    with pytest.raises(ValueError):
+        StreamProcessor(sample_pipeline, window_size=10, hop_size=-1)
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for sigpro.aggregations.amplitude.online package."""
+
+import numpy as np
+import pytest
+import scipy.stats
+
+from sigpro.aggregations.amplitude.online import MomentAccumulator
+from sigpro.aggregations.amplitude.statistical import (
+    crest_factor, kurtosis, mean, rms, skew, std, var)
+
+VALUES = np.random.default_rng(0).gamma(2.0, size=1000) + 5
+
+
+def _assert_statistics(result, values):
+    np.testing.assert_allclose(result['mean'], mean(values))
+    np.testing.assert_allclose(result['var'], var(values))
+    np.testing.assert_allclose(result['std'], std(values))
+    np.testing.assert_allclose(result['rms'], rms(values))
+    np.testing.assert_allclose(result['crest_factor'], crest_factor(values))
+    np.testing.assert_allclose(result['skew'], skew(values))
+    np.testing.assert_allclose(result['kurtosis'], kurtosis(values))
+
+
+def test_update():
+    accumulator = MomentAccumulator()
+    for chunk in np.array_split(VALUES, 7):
+        accumulator.update(chunk)
+
+    assert accumulator.count == 1000
+    _assert_statistics(accumulator.finalize(), VALUES)
+
+
+def test_merge():
+    shards = [MomentAccumulator.from_values(chunk) for chunk in np.array_split(VALUES, [3, 400])]
+    accumulator = MomentAccumulator().merge(shards[2]).merge(shards[0]).merge(shards[1])
+
+    _assert_statistics(accumulator.finalize(), VALUES)
+
+
+def test_update_2d():
+    values = VALUES.reshape(4, 250)
+    accumulator = MomentAccumulator().update(values[:, :100]).update(values[:, 100:])
+
+    np.testing.assert_allclose(accumulator.skew(), scipy.stats.skew(values, axis=-1))
+    np.testing.assert_allclose(accumulator.kurtosis(fisher=False, bias=False),
+                               scipy.stats.kurtosis(values, axis=-1, fisher=False, bias=False))
+
+
+def test_constant():
+    accumulator = MomentAccumulator.from_values(np.ones(10))
+
+    assert accumulator.skew() == 0
+    assert accumulator.kurtosis() == -3
+    assert accumulator.kurtosis(fisher=False) == 0
+
+
+def test_empty():
+    accumulator = MomentAccumulator().update([])
+
+    with pytest.raises(ValueError):
+        accumulator.finalize()
@@ -2,6 +2,9 @@
 
 """Tests for sigpro.aggregations.amplitude.statistical package."""
 
+import numpy as np
+import scipy.stats
+
 from sigpro.aggregations.amplitude.statistical import (
     crest_factor, kurtosis, mean, rms, skew, std, var)
 
@@ -57,3 +60,44 @@ def test_kurtosis_pearson():
 def test_kurtosis_pearson_bias_false():
     result = kurtosis(VALUES, fisher=False, bias=False)
     assert result == 1.8
+
+
+def test_mean_float32_accumulates_in_float64():
+    values = np.full(10 ** 6, 0.1, dtype=np.float32)
+    result = mean(values)
+    assert result.dtype == np.float64
+    np.testing.assert_allclose(result, np.float32(0.1), rtol=1e-12)
+
+
+def test_std_float32():
+    values = np.array(VALUES, dtype=np.float32)
+    result = std(values)
+    assert round(result, 6) == 5.766281
+
+
+def test_skew_bias_false():
+    values = np.random.default_rng(0).gamma(2.0, size=50)
+    result = skew(values, bias=False)
+    np.testing.assert_allclose(result, scipy.stats.skew(values, bias=False))
+
+
+def test_skew_kurtosis_constant():
+    values = np.full(10, 0.1)
+    assert skew(values) == 0
+    assert kurtosis(values) == -3
+    assert kurtosis(values, fisher=False) == 0
+
+
+def test_skew_kurtosis_2d():
+    values = np.random.default_rng(0).normal(size=(4, 100))
+    values[2] = 1.0
+    varying = [0, 1, 3]
+
+    skew_values = skew(values)
+    kurtosis_values = kurtosis(values, bias=False)
+
+    np.testing.assert_allclose(skew_values[varying], scipy.stats.skew(values[varying], axis=-1))
+    np.testing.assert_allclose(kurtosis_values[varying],
+                               scipy.stats.kurtosis(values[varying], axis=-1, bias=False))
+    assert skew_values[2] == 0
+    assert kurtosis_values[2] == -3
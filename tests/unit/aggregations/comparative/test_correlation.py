@@ -0,0 +1,49 @@
+"""Tests for sigpro.aggregations.comparative.correlation module."""
+import numpy as np
+import pytest
+
+from sigpro.aggregations.comparative.correlation import cross_correlation
+
+
+def test_cross_correlation():
+    # setup
+    rng = np.random.default_rng(0)
+    signal = rng.normal(size=520)
+    values = np.stack([signal[10:510], signal[7:507], -signal[15:515]])
+
+    # run
+    lag_value, correlation_value = cross_correlation(values, 100)
+
+    # assert
+    np.testing.assert_allclose(lag_value, [0.03, -0.05, -0.08])
+    np.testing.assert_allclose(np.abs(correlation_value), [1, 1, 1], atol=0.05)
+    assert correlation_value[0] > 0
+    assert correlation_value[1] < 0
+
+
+def test_cross_correlation_direct():
+    # setup
+    rng = np.random.default_rng(1)
+    values = rng.normal(size=(2, 2, 64))
+
+    # run
+    lag_value, _ = cross_correlation(values, 1)
+
+    # assert
+    for row in range(2):
+        first, second = values[row] - values[row].mean(axis=-1, keepdims=True)
+        direct = np.correlate(second, first, mode='full')
+        assert lag_value[row, 0] == np.argmax(np.abs(direct)) - 63
+
+
+def test_cross_correlation_constant():
+    # run
+    _, correlation_value = cross_correlation(np.ones((2, 10)), 1)
+
+    # assert
+    np.testing.assert_array_equal(correlation_value, [0])
+
+
+def test_cross_correlation_single_channel():
+    with pytest.raises(ValueError):
+        cross_correlation(np.zeros(100), 100)
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for sigpro.aggregations.frequency_time.band module."""
+
+import numpy as np
+
+from sigpro.aggregations.frequency_time.band import band_energy, band_statistics
+
+AMPLITUDE_VALUES = np.array([
+    [1, 2, 3],
+    [2, 2, 2],
+    [0, 1, 4],
+])
+FREQUENCY_VALUES = np.array([0, 10, 20])
+TIME_VALUES = np.array([0, 1, 2])
+
+
+def test_band_energy():
+    # run
+    result = band_energy(AMPLITUDE_VALUES, FREQUENCY_VALUES, TIME_VALUES,
+                         min_frequency=10, max_frequency=20)
+
+    # assert
+    expected = np.mean([4, 5, 20])
+    assert result == expected
+
+
+def test_band_energy_batched():
+    # setup
+    batch = np.stack([AMPLITUDE_VALUES, 2 * AMPLITUDE_VALUES])
+
+    # run
+    result = band_energy(batch, FREQUENCY_VALUES, TIME_VALUES,
+                         min_frequency=10, max_frequency=20)
+
+    # assert
+    expected = np.array([np.mean([4, 5, 20]), 4 * np.mean([4, 5, 20])])
+    np.testing.assert_array_almost_equal(result, expected)
+
+
+def test_band_statistics():
+    # run
+    mean_value, std_value, min_value, max_value = band_statistics(
+        AMPLITUDE_VALUES, FREQUENCY_VALUES, TIME_VALUES, min_frequency=0, max_frequency=10)
+
+    # assert
+    energy = np.array([5, 8, 13])
+    assert mean_value == np.mean(energy)
+    assert std_value == np.std(energy)
+    assert min_value == 5
+    assert max_value == 13
+
+
+def test_band_statistics_complex():
+    # setup
+    amplitude_values = AMPLITUDE_VALUES * 1j
+
+    # run
+    mean_value, _, _, _ = band_statistics(
+        amplitude_values, FREQUENCY_VALUES, TIME_VALUES, min_frequency=0, max_frequency=10)
+
+    # assert
+    assert mean_value == np.mean([5, 8, 13])
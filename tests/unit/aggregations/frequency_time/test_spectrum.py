@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for sigpro.aggregations.frequency_time.spectrum module."""
+
+import numpy as np
+
+from sigpro.aggregations.frequency_time.spectrum import mean_spectrum, spectral_flux
+
+AMPLITUDE_VALUES = np.array([
+    [1, 2, 3],
+    [2, 2, 2],
+    [0, -1, 4],
+])
+FREQUENCY_VALUES = np.array([0, 10, 20])
+TIME_VALUES = np.array([0, 1, 2])
+
+
+def test_mean_spectrum():
+    # run
+    result = mean_spectrum(AMPLITUDE_VALUES, FREQUENCY_VALUES, TIME_VALUES)
+
+    # assert
+    expected = np.array([2, 2, 5 / 3])
+    np.testing.assert_array_almost_equal(result, expected)
+
+
+def test_mean_spectrum_batched():
+    # setup
+    batch = np.stack([AMPLITUDE_VALUES, AMPLITUDE_VALUES])
+
+    # run
+    result = mean_spectrum(batch, FREQUENCY_VALUES, TIME_VALUES)
+
+    # assert
+    assert result.shape == (2, 3)
+
+
+def test_spectral_flux():
+    # run
+    result = spectral_flux(AMPLITUDE_VALUES, FREQUENCY_VALUES, TIME_VALUES)
+
+    # assert
+    expected = np.mean([np.sqrt(1 + 0 + 1), np.sqrt(1 + 0 + 9)])
+    assert round(result, 6) == round(expected, 6)
+
+
+def test_spectral_flux_batched():
+    # setup
+    batch = np.stack([AMPLITUDE_VALUES, np.ones((3, 3))])
+
+    # run
+    result = spectral_flux(batch, FREQUENCY_VALUES, TIME_VALUES)
+
+    # assert
+    expected = np.mean([np.sqrt(1 + 0 + 1), np.sqrt(1 + 0 + 9)])
+    np.testing.assert_array_almost_equal(result, [expected, 0])
@@ -0,0 +1,56 @@
+"""Tests for sigpro.buckets module."""
+
+import numpy as np
+import pandas as pd
+
+from sigpro.buckets import get_buckets
+
+
+def test_get_buckets():
+    data = pd.DataFrame({
+        'values': [np.zeros(4), np.ones(2), np.ones(4), np.zeros(4)],
+        'sampling_frequency': [10, 10, 20, 10],
+    })
+    buckets = get_buckets(data, 'values')
+
+    assert [positions for positions, _, _ in buckets] == [[0, 3], [1], [2]]
+    assert [context for _, _, context in buckets] == [
+        {'sampling_frequency': 10}, {'sampling_frequency': 10}, {'sampling_frequency': 20}]
+
+    _, signals, _ = buckets[0]
+    assert signals[0] is data['values'][0]
+
+
+def test_get_buckets_multichannel():
+    data = pd.DataFrame({
+        'values': [np.zeros((3, 100)), np.zeros((3, 200)), np.ones((3, 100)), np.ones(3)],
+        'sampling_frequency': [10, 10, 10, 10],
+    })
+    buckets = get_buckets(data, 'values')
+
+    assert [positions for positions, _, _ in buckets] == [[0, 2], [1], [3]]
+    for _, signals, _ in buckets:
+        assert np.stack(signals).shape[1:] == signals[0].shape
+
+
+def test_get_buckets_unhashable_context():
+    data = pd.DataFrame({
+        'values': [np.zeros(4), np.zeros(4)],
+        'freqs': [np.arange(3), np.arange(3)],
+    })
+    buckets = get_buckets(data, 'values')
+
+    assert [positions for positions, _, _ in buckets] == [[0], [1]]
+
+
+def test_get_buckets_context_columns():
+    data = pd.DataFrame({
+        'values': [np.zeros(4), np.ones(4), np.ones(4)],
+        'timestamp': pd.date_range('2020-01-01', periods=3),
+        'sampling_frequency': [10, 10, 20],
+    })
+    buckets = get_buckets(data, 'values', ['sampling_frequency'])
+
+    assert [positions for positions, _, _ in buckets] == [[0, 1], [2]]
+    assert [context for _, _, context in buckets] == [
+        {'sampling_frequency': 10}, {'sampling_frequency': 20}]
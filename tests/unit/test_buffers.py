@@ -0,0 +1,81 @@
+"""Tests for sigpro.buffers module."""
+
+import threading
+
+import numpy as np
+
+from sigpro.buffers import (
+    BufferedPrimitive, BufferPool, get_buffer_pool, get_output_dtype, get_output_shape)
+from sigpro.transformations.amplitude.spectrum import power_spectrum
+
+POWER_SPECTRUM_OUTPUT = {'shape': ['...', 'n // 2 + 1'], 'dtype': 'same'}
+
+
+class Owner:
+    """Object that owns a buffer."""
+
+
+def test_buffer_pool():
+    pool = BufferPool()
+    owner = Owner()
+
+    first = pool.get(owner, (2, 3), np.float64)
+    second = pool.get(owner, (2, 3), np.float64)
+    third = pool.get(owner, (4, ), np.float32)
+
+    assert second is first
+    assert third.shape == (4, ) and third.dtype == np.float32
+    assert pool.get_stats() == {'allocations': 2, 'requests': 3, 'nbytes': 16}
+
+    del owner
+    assert pool.get_stats()['nbytes'] == 0
+
+    pool.clear()
+    assert pool.get_stats() == {'allocations': 0, 'requests': 0, 'nbytes': 0}
+
+
+def test_get_buffer_pool_thread_local():
+    pools = []
+    thread = threading.Thread(target=lambda: pools.append(get_buffer_pool()))
+    thread.start()
+    thread.join()
+
+    assert get_buffer_pool() is get_buffer_pool()
+    assert pools[0] is not get_buffer_pool()
+
+
+def test_get_output_shape():
+    values = np.zeros((5, 3, 8))
+
+    assert get_output_shape(['...', 'n // 2 + 1'], values, -1, {}) == (5, 3, 5)
+    assert get_output_shape(['...', 'nperseg'], values, -2, {'nperseg': 4}) == (5, 4)
+    assert get_output_shape(['m', 2], values, -1, {}) == (15, 2)
+
+
+def test_get_output_dtype():
+    assert get_output_dtype('same', np.zeros(2, dtype=np.float32)) == np.float32
+    assert get_output_dtype('same', np.zeros(2, dtype=np.complex64)) == np.float32
+    assert get_output_dtype('same', np.zeros(2, dtype=np.int64)) == np.float64
+    assert get_output_dtype('complex', np.zeros(2, dtype=np.float32)) == np.complex64
+    assert get_output_dtype('int32', np.zeros(2)) == np.int32
+
+
+def test_buffered_primitive():
+    primitive = BufferedPrimitive(power_spectrum, 'out', POWER_SPECTRUM_OUTPUT)
+    values = np.random.default_rng(0).normal(size=(4, 16))
+    pool = get_buffer_pool()
+    pool.clear()
+
+    first, _ = primitive(amplitude_values=values[0], sampling_frequency=10)
+    first_values = np.array(first)
+    second, _ = primitive(amplitude_values=values[1], sampling_frequency=10)
+
+    np.testing.assert_allclose(first, power_spectrum(values[1], 10)[0])
+    assert second is first
+    assert not np.allclose(second, first_values)
+
+    batch, _ = primitive(amplitude_values=values, sampling_frequency=10)
+
+    np.testing.assert_allclose(batch, power_spectrum(values, 10)[0])
+    assert pool.get_stats()['allocations'] == 2
+    assert pool.get_stats()['requests'] == 3
@@ -0,0 +1,103 @@
+"""Tests for sigpro.cache module."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import numpy as np
+
+from sigpro.cache import FeatureCache
+
+
+def test_get_key():
+    key = FeatureCache.get_key('fingerprint', np.arange(5), {'sampling_frequency': 10})
+
+    assert key == FeatureCache.get_key('fingerprint', [0, 1, 2, 3, 4],
+                                       {'sampling_frequency': 10})
+    assert key != FeatureCache.get_key('other', np.arange(5), {'sampling_frequency': 10})
+    assert key != FeatureCache.get_key('fingerprint', np.arange(5), {'sampling_frequency': 20})
+    assert key != FeatureCache.get_key('fingerprint', np.arange(5, dtype=np.float32),
+                                       {'sampling_frequency': 10})
+
+
+def test_get_set(tmp_path):
+    cache = FeatureCache(tmp_path)
+
+    assert cache.get('missing') is None
+    cache.set('key', (1.0, np.arange(3)))
+    value = cache.get('key')
+
+    assert value[0] == 1.0
+    np.testing.assert_array_equal(value[1], np.arange(3))
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_persistence(tmp_path):
+    FeatureCache(tmp_path).set('key', (1.0, ))
+
+    cache = FeatureCache(tmp_path)
+
+    assert len(cache) == 1
+    assert cache.get('key') == (1.0, )
+
+
+def test_lru_eviction(tmp_path):
+    value = (np.zeros(100), )
+    cache = FeatureCache(tmp_path)
+    cache.set('first', value)
+    entry_size = cache.get_size()
+
+    cache = FeatureCache(tmp_path, max_size=2 * entry_size)
+    cache.set('second', value)
+    cache.get('first')
+    cache.set('third', value)
+
+    assert len(cache) == 2
+    assert cache.get('second') is None
+    assert cache.get('first') is not None
+    assert cache.get('third') is not None
+    assert cache.get_size() == 2 * entry_size
+
+
+@patch('sigpro.cache.os.utime', side_effect=FileNotFoundError)
+def test_get_evicted_after_read(utime_mock, tmp_path):
+    cache = FeatureCache(tmp_path)
+    cache.set('key', (1.0, ))
+
+    assert cache.get('key') is None
+    assert cache.hits == 0
+    assert cache.misses == 1
+
+
+def test_concurrent_access(tmp_path):
+    value = (np.zeros(100), )
+    cache = FeatureCache(tmp_path)
+    cache.set('first', value)
+    entry_size = cache.get_size()
+    cache = FeatureCache(tmp_path, max_size=3 * entry_size)
+
+    def set_get(index):
+        key = str(index % 10)
+        cache.set(key, value)
+        output = cache.get(key)
+        assert output is None or np.array_equal(output[0], value[0])
+
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(set_get, range(500)))
+
+    file_sizes = [os.path.getsize(path) for path in tmp_path.iterdir()]
+    assert len(cache) == len(file_sizes) <= 3
+    assert cache.get_size() == sum(file_sizes)
+    assert cache.hits + cache.misses == 500
+
+
+def test_clear(tmp_path):
+    cache = FeatureCache(tmp_path)
+    cache.set('key', (1.0, ))
+
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.get_size() == 0
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,52 @@
+"""Tests for sigpro.cost module."""
+
+import pytest
+
+from sigpro.basic_primitives import FFT, Mean, Welch
+from sigpro.cost import estimate_primitive_cost, evaluate_cost
+
+
+def test_evaluate_cost():
+    variables = {'n': 1024, 'm': 2, 'nperseg': None}
+
+    assert evaluate_cost(3, variables) == 3
+    assert evaluate_cost('5 * m * n * log2(n)', variables) == 102400
+    assert evaluate_cost('min(256, n) if nperseg is None else nperseg', variables) == 256
+    assert evaluate_cost('ceil(n / 3) // 2 + -1', variables) == 170
+
+
+@pytest.mark.parametrize('expression', [
+    'x + 1',
+    'open(n)',
+    'n.__class__',
+    '[n for n in m]',
+    'n +',
+])
+def test_evaluate_cost_invalid(expression):
+    with pytest.raises(ValueError):
+        evaluate_cost(expression, {'n': 1, 'm': 1})
+
+
+def test_estimate_primitive_cost():
+    estimate = estimate_primitive_cost(FFT(), (3, 1024), 1000, 4)
+
+    assert estimate['flops'] == 5 * 3 * 1024 * 10
+    assert estimate['output_shape'] == (3, 1024)
+    assert estimate['output_bytes'] == 3 * 1024 * 8
+    assert estimate['sampling_frequency'] == 1000
+
+
+def test_estimate_primitive_cost_hyperparameters():
+    estimate = estimate_primitive_cost(Welch(nperseg=128), (1000, ), 1000, 8)
+
+    assert estimate['output_shape'] == (65, )
+
+
+def test_estimate_primitive_cost_missing():
+    mean = Mean()
+    mean.set_cost({})
+
+    estimate = estimate_primitive_cost(mean, (2, 1000), 1000, 8)
+
+    assert estimate['flops'] != estimate['flops']
+    assert estimate['output_shape'] == (2, )
@@ -0,0 +1,37 @@
+"""Tests for sigpro.dtypes module."""
+
+import numpy as np
+import pytest
+
+from sigpro.dtypes import as_float_array, get_accumulator_dtype, get_complex_dtype, validate_dtype
+
+
+def test_validate_dtype():
+    assert validate_dtype(None) is None
+    assert validate_dtype('float32') == np.float32
+    assert validate_dtype(np.float64) == np.float64
+
+
+def test_validate_dtype_invalid():
+    with pytest.raises(ValueError):
+        validate_dtype('int16')
+
+    with pytest.raises(ValueError):
+        validate_dtype('not_a_dtype')
+
+
+def test_as_float_array():
+    assert as_float_array([1, 2, 3]).dtype == np.float64
+    assert as_float_array(np.ones(3, dtype=np.float32)).dtype == np.float32
+    assert as_float_array(np.ones(3, dtype=np.complex64)).dtype == np.complex64
+
+
+def test_get_complex_dtype():
+    assert get_complex_dtype(np.ones(3, dtype=np.float32)) == np.complex64
+    assert get_complex_dtype(np.ones(3)) == np.complex128
+
+
+def test_get_accumulator_dtype():
+    assert get_accumulator_dtype(np.ones(3, dtype=np.float32)) == np.float64
+    assert get_accumulator_dtype(np.ones(3, dtype=np.complex64)) == np.complex128
+    assert get_accumulator_dtype([1, 2, 3]) == np.float64
@@ -0,0 +1,44 @@
+"""Tests for sigpro.framing module."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sigpro.framing import get_frames, iter_group_frames
+
+
+def test_get_frames():
+    values = np.arange(10)
+    frames = get_frames(values, 4, 3)
+
+    np.testing.assert_array_equal(frames, [[0, 1, 2, 3], [3, 4, 5, 6], [6, 7, 8, 9]])
+    assert np.shares_memory(frames, values)
+
+
+def test_get_frames_short():
+    frames = get_frames(np.arange(3), 4)
+
+    assert frames.shape == (0, 4)
+
+
+def test_get_frames_invalid():
+    with pytest.raises(ValueError):
+        get_frames(np.arange(10), 4, 0)
+
+
+def test_iter_group_frames():
+    data = pd.DataFrame({
+        'timestamp': [3, 2, 1, 0, 0, 1],
+        'device': ['a', 'a', 'a', 'a', 'b', 'b'],
+        'values': [3.0, 2.0, 1.0, 0.0, 5.0, 6.0],
+        'sampling_frequency': 10,
+    })
+    groups = list(iter_group_frames(data, 'values', 2, time_index='timestamp',
+                                    groupby_index='device'))
+
+    assert len(groups) == 2
+    group, frames, frame_index, context = groups[0]
+    assert group == {'device': 'a'}
+    np.testing.assert_array_equal(frames, [[0, 1], [2, 3]])
+    np.testing.assert_array_equal(frame_index, [0, 2])
+    assert context == {'sampling_frequency': 10}
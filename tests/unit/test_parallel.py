@@ -0,0 +1,45 @@
+"""Tests for sigpro.parallel module."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sigpro import pipeline
+from sigpro.basic_primitives import STFT, FFTReal, Identity, Mean, MeanSpectrum
+from sigpro.parallel import apply_pipeline_shared
+
+
+def test_apply_pipeline_shared():
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({
+        'values': [rng.normal(size=(2, size)) for size in [100, 200, 100, 300, 50]],
+        'sampling_frequency': [100, 200, 100, 300, 50],
+    }, index=[5, 4, 3, 2, 1])
+    sample_pipeline = pipeline.build_linear_pipeline([FFTReal()], [Mean()])
+
+    features = apply_pipeline_shared(sample_pipeline, data, 'values', max_workers=2,
+                                     chunk_size=1)
+
+    assert list(features.index) == [5, 4, 3, 2, 1]
+    assert list(features.columns) == sample_pipeline.get_output_features()
+    for values, feature in zip(data['values'], features.iloc[:, 0]):
+        np.testing.assert_allclose(feature, np.mean(np.fft.fft(values).real, axis=-1))
+
+
+def test_apply_pipeline_shared_empty():
+    data = pd.DataFrame({'values': []})
+    sample_pipeline = pipeline.build_linear_pipeline([Identity()], [Mean()])
+
+    features = apply_pipeline_shared(sample_pipeline, data, 'values')
+
+    assert features.empty
+    assert list(features.columns) == sample_pipeline.get_output_features()
+
+
+@pytest.mark.filterwarnings('ignore:nperseg')
+def test_apply_pipeline_shared_shape_mismatch():
+    data = pd.DataFrame({'values': [np.zeros(100), np.zeros(200)], 'sampling_frequency': 100})
+    sample_pipeline = pipeline.build_linear_pipeline([STFT()], [MeanSpectrum()])
+
+    with pytest.raises(ValueError):
+        apply_pipeline_shared(sample_pipeline, data, 'values', max_workers=1)
@@ -0,0 +1,103 @@
+"""Tests for sigpro.telemetry module."""
+
+import json
+import logging
+
+import numpy as np
+
+from sigpro.telemetry import (
+    JSONLinesExporter, LoggingReporter, ProgressTracker, PrometheusExporter, get_nbytes)
+
+
+class FakeClock:
+
+    def __init__(self, times):
+        self.times = iter(times)
+
+    def __call__(self):
+        return next(self.times)
+
+
+def test_get_nbytes():
+    assert get_nbytes(np.zeros(4)) == 32
+    assert get_nbytes([1.0, 2.0]) == 16
+
+
+def test_progress_tracker():
+    reports = []
+    tracker = ProgressTracker([reports.append], interval=5, clock=FakeClock([0, 1, 6, 7, 10]))
+
+    tracker.start(total=4)
+    tracker.update(1, 100)
+    tracker.update(2, 200)
+    tracker.update(1, 100)
+    tracker.finish()
+
+    assert len(reports) == 2
+    assert reports[0] == {
+        'processed': 3,
+        'total': 4,
+        'elapsed': 6,
+        'rows_per_second': 0.5,
+        'bytes_per_second': 50.0,
+        'eta': 2.0,
+        'slowest_seconds': 5,
+        'finished': False,
+    }
+    assert reports[1]['processed'] == 4
+    assert reports[1]['rows_per_second'] == 0.4
+    assert reports[1]['eta'] == 0.0
+    assert reports[1]['slowest_seconds'] == 1
+    assert reports[1]['finished']
+
+
+def test_progress_tracker_unknown_total():
+    reports = []
+    tracker = ProgressTracker([reports.append], interval=0, clock=FakeClock([0, 2]))
+
+    tracker.start()
+    tracker.update(4)
+
+    assert reports[0]['total'] is None
+    assert reports[0]['eta'] is None
+    assert reports[0]['rows_per_second'] == 2
+
+
+def test_logging_reporter(caplog):
+    tracker = ProgressTracker([LoggingReporter()], clock=FakeClock([0, 2]))
+    tracker.start()
+
+    with caplog.at_level(logging.INFO, logger='sigpro.telemetry'):
+        tracker.finish()
+
+    assert 'Processed 0/? in 2.0s' in caplog.text
+
+
+def test_json_lines_exporter(tmp_path):
+    path = tmp_path / 'progress.jsonl'
+    tracker = ProgressTracker([JSONLinesExporter(path)], interval=0, clock=FakeClock([0, 1, 2]))
+
+    tracker.start(total=2)
+    tracker.update(1)
+    tracker.finish()
+
+    reports = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [report['processed'] for report in reports] == [1, 1]
+    assert [report['finished'] for report in reports] == [False, True]
+    assert 'timestamp' in reports[0]
+
+
+def test_prometheus_exporter(tmp_path):
+    path = tmp_path / 'sigpro.prom'
+    tracker = ProgressTracker([PrometheusExporter(path)], clock=FakeClock([0, 1, 4]))
+
+    tracker.start()
+    tracker.update(2)
+    tracker.finish()
+
+    lines = path.read_text().splitlines()
+    assert '# TYPE sigpro_processed_total counter' in lines
+    assert 'sigpro_processed_total 2.0' in lines
+    assert 'sigpro_rows_per_second 0.5' in lines
+    assert 'sigpro_finished 1.0' in lines
+    assert not (tmp_path / 'sigpro.prom.tmp').exists()
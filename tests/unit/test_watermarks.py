@@ -0,0 +1,39 @@
+"""Tests for sigpro.watermarks module."""
+
+import pandas as pd
+
+from sigpro.watermarks import Watermarks
+
+DATA = pd.DataFrame({
+    'timestamp': pd.to_datetime(['2020-01-01 00:00', '2020-01-01 01:00', '2020-01-01 02:00'] * 2),
+    'device': ['a'] * 3 + ['b'] * 3,
+    'values': range(6),
+})
+
+
+def test_filter():
+    watermarks = Watermarks({('a', ): '2020-01-01 01:00'})
+    result = watermarks.filter(DATA, 'timestamp', 'device')
+
+    assert list(result['values']) == [1, 2, 3, 4, 5]
+    assert list(result.index) == [1, 2, 3, 4, 5]
+
+
+def test_update():
+    watermarks = Watermarks({('a', ): '2020-01-01 05:00'})
+    watermarks.update(DATA, 'timestamp', ['device'])
+
+    assert watermarks.get('a') == pd.Timestamp('2020-01-01 05:00')
+    assert watermarks.get('b') == pd.Timestamp('2020-01-01 02:00')
+    assert watermarks.get('c') is None
+    assert len(watermarks) == 2
+
+
+def test_save_load(tmp_path):
+    watermarks = Watermarks()
+    watermarks.update(DATA, 'timestamp', 'device')
+    watermarks.save(tmp_path / 'watermarks.json')
+
+    loaded = Watermarks.load(tmp_path / 'watermarks.json')
+
+    assert loaded.to_dict() == watermarks.to_dict()
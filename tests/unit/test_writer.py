@@ -0,0 +1,42 @@
+"""Tests for sigpro.writer module."""
+
+import numpy as np
+import pandas as pd
+
+from sigpro.writer import FeatureWriter
+
+
+def test_write_typed_columns():
+    writer = FeatureWriter(['mean', 'count', 'spectrum'], 2)
+    writer.write(0, (1.5, 3, np.arange(3)))
+    writer.write(1, (np.float64(2.5), 4, np.arange(2)))
+
+    result = writer.to_frame(index=pd.Index([10, 20]))
+
+    assert list(result.columns) == ['mean', 'count', 'spectrum']
+    assert list(result.index) == [10, 20]
+    assert result['mean'].dtype == np.float64
+    assert result['count'].dtype == np.int64
+    assert result['spectrum'].dtype == object
+    np.testing.assert_array_equal(result['spectrum'][20], [0, 1])
+
+
+def test_write_upcast():
+    writer = FeatureWriter(['value'], 3)
+    writer.write(0, (np.float32(1.5), ))
+    writer.write(1, (2, ))
+    writer.write(2, (1 + 1j, ))
+
+    result = writer.to_frame()
+
+    assert result['value'].dtype == np.complex128
+    assert list(result['value']) == [1.5, 2, 1 + 1j]
+
+
+def test_to_frame_common_dtype():
+    writer = FeatureWriter(['real', 'complex'], 1)
+    writer.write(0, (1.0, 1 + 1j))
+
+    result = writer.to_frame(common_dtype=True)
+
+    assert list(result.dtypes) == [np.complex128, np.complex128]
@@ -0,0 +1,74 @@
+"""Tests for sigpro.transformations.amplitude.filter module."""
+import numpy as np
+import pytest
+
+from sigpro.transformations.amplitude.filter import (
+    _design_iir_filter, decimate, fir_filter, iir_filter)
+
+SAMPLING_FREQUENCY = 1000
+TIME = np.arange(2000) / SAMPLING_FREQUENCY
+LOW_TONE = np.sin(2 * np.pi * 20 * TIME)
+HIGH_TONE = np.sin(2 * np.pi * 300 * TIME)
+
+
+def _rms(values):
+    return np.sqrt(np.mean(np.square(values[..., 200:-200]), axis=-1))
+
+
+def test_iir_filter_lowpass():
+    # run
+    result = iir_filter(LOW_TONE + HIGH_TONE, SAMPLING_FREQUENCY, high=100, zero_phase=True)
+
+    # assert
+    np.testing.assert_allclose(result[200:-200], LOW_TONE[200:-200], atol=1e-2)
+
+
+def test_iir_filter_cached():
+    # setup
+    _design_iir_filter.cache_clear()
+
+    # run
+    iir_filter(LOW_TONE, SAMPLING_FREQUENCY, low=10, high=100)
+    iir_filter(HIGH_TONE, SAMPLING_FREQUENCY, low=10, high=100)
+
+    # assert
+    assert _design_iir_filter.cache_info().misses == 1
+    assert _design_iir_filter.cache_info().hits == 1
+
+
+def test_iir_filter_batched():
+    # setup
+    values = np.stack([LOW_TONE, HIGH_TONE]).astype(np.float32)
+
+    # run
+    result = iir_filter(values, SAMPLING_FREQUENCY, low=200)
+
+    # assert
+    assert result.dtype == np.float32
+    np.testing.assert_allclose(result[1], iir_filter(HIGH_TONE, SAMPLING_FREQUENCY, low=200),
+                               rtol=1e-4, atol=1e-5)
+    np.testing.assert_allclose(_rms(result), [0, np.sqrt(0.5)], atol=2e-2)
+
+
+def test_iir_filter_no_cutoff():
+    with pytest.raises(ValueError):
+        iir_filter(LOW_TONE, SAMPLING_FREQUENCY)
+
+
+def test_fir_filter_bandpass():
+    # run
+    result = fir_filter(np.stack([LOW_TONE, HIGH_TONE]), SAMPLING_FREQUENCY, low=200, high=400,
+                        zero_phase=True)
+
+    # assert
+    np.testing.assert_allclose(_rms(result), [0, np.sqrt(0.5)], atol=2e-2)
+
+
+def test_decimate():
+    # run
+    result, sampling_frequency = decimate(np.stack([LOW_TONE, LOW_TONE]), SAMPLING_FREQUENCY, 4)
+
+    # assert
+    assert result.shape == (2, 500)
+    assert sampling_frequency == 250
+    np.testing.assert_allclose(result[0, 50:-50], LOW_TONE[::4][50:-50], atol=1e-2)
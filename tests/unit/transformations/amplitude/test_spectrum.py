@@ -0,0 +1,30 @@
+"""Tests for sigpro.transformations.amplitude.spectrum module."""
+import numpy as np
+
+from sigpro.transformations.amplitude.spectrum import power_spectrum
+
+
+def test_power_spectrum():
+    # setup
+    values = [1, 2, 0, 1, 1, 0]
+
+    # run
+    amplitude_values, frequency_values = power_spectrum(values, 10)
+
+    # assert
+    expected_amplitude_values = np.abs(np.fft.rfft(values)) ** 2
+    np.testing.assert_array_almost_equal(amplitude_values, expected_amplitude_values)
+    np.testing.assert_array_almost_equal(frequency_values, [0., 1.66666667, 3.33333333, 5.])
+
+
+def test_power_spectrum_out():
+    # setup
+    values = np.random.default_rng(0).normal(size=(3, 8)).astype(np.float32)
+    out = np.empty((3, 5), dtype=np.float32)
+
+    # run
+    amplitude_values, _ = power_spectrum(values, 10, out=out)
+
+    # assert
+    assert amplitude_values is out
+    np.testing.assert_allclose(amplitude_values, power_spectrum(values, 10)[0])
@@ -0,0 +1 @@
+"""SigPro Transformations Comparative Test module."""
@@ -0,0 +1,76 @@
+"""Tests for sigpro.transformations.comparative.spectral module."""
+import numpy as np
+import pytest
+import scipy.signal
+
+from sigpro.transformations.comparative.spectral import coherence, csd
+
+
+def test_csd():
+    # setup
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=(3, 1000))
+
+    # run
+    amplitude_values, frequency_values = csd(values, 100, nperseg=128)
+
+    # assert
+    assert amplitude_values.shape == (3, 65)
+    for position, (first, second) in enumerate([(0, 1), (0, 2), (1, 2)]):
+        expected_frequencies, expected = scipy.signal.csd(
+            values[first], values[second], fs=100, nperseg=128)
+        np.testing.assert_allclose(amplitude_values[position], expected)
+        np.testing.assert_allclose(frequency_values, expected_frequencies)
+
+
+def test_csd_batched():
+    # setup
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=(2, 3, 255))
+
+    # run
+    amplitude_values, _ = csd(values, 100, nperseg=63)
+
+    # assert
+    assert amplitude_values.shape == (2, 3, 32)
+    _, expected = scipy.signal.csd(values[1, 1], values[1, 2], fs=100, nperseg=63)
+    np.testing.assert_allclose(amplitude_values[1, 2], expected)
+
+
+def test_csd_single_channel():
+    with pytest.raises(ValueError):
+        csd(np.zeros(100), 100)
+
+
+def test_coherence():
+    # setup
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=(3, 1000))
+
+    # run
+    amplitude_values, frequency_values = coherence(values, 100, nperseg=128)
+
+    # assert
+    assert amplitude_values.shape == (3, 65)
+    for position, (first, second) in enumerate([(0, 1), (0, 2), (1, 2)]):
+        expected_frequencies, expected = scipy.signal.coherence(
+            values[first], values[second], fs=100, nperseg=128)
+        np.testing.assert_allclose(amplitude_values[position], expected)
+        np.testing.assert_allclose(frequency_values, expected_frequencies)
+
+
+def test_coherence_zero_channel():
+    # setup
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=(3, 1000))
+    values[1] = 0
+
+    # run
+    with np.errstate(all='raise'):
+        amplitude_values, _ = coherence(values, 100, nperseg=128)
+
+    # assert
+    np.testing.assert_array_equal(amplitude_values[0], 0)
+    np.testing.assert_array_equal(amplitude_values[2], 0)
+    expected = scipy.signal.coherence(values[0], values[2], fs=100, nperseg=128)[1]
+    np.testing.assert_allclose(amplitude_values[1], expected)
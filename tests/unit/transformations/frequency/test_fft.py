@@ -30,3 +30,28 @@ def test_fft_real():
     expected_frequency_values = [0., 2., 4., -4., -2.]
     np.testing.assert_array_almost_equal(amplitude_values, expected_amplitude_values)
     np.testing.assert_array_almost_equal(frequency_values, expected_frequency_values)
+
+
+def test_fft_float32():
+    # setup
+    values = np.array([1, 1, 0, 1, 1], dtype=np.float32)
+
+    # run
+    amplitude_values, _ = fft(values, 10)
+
+    # assert
+    assert amplitude_values.dtype == np.complex64
+    np.testing.assert_array_almost_equal(amplitude_values, np.fft.fft([1, 1, 0, 1, 1]))
+
+
+def test_fft_real_float32():
+    # setup
+    values = np.array([1, 1, 0, 1, 1], dtype=np.float32)
+
+    # run
+    amplitude_values, _ = fft_real(values, 10)
+
+    # assert
+    expected_amplitude_values = [4.0, 0.80901699, -0.309017, -0.309017, 0.809017]
+    assert amplitude_values.dtype == np.float32
+    np.testing.assert_array_almost_equal(amplitude_values, expected_amplitude_values)
@@ -0,0 +1,45 @@
+"""Tests for sigpro.transformations.frequency.welch module."""
+import numpy as np
+
+from sigpro.transformations.frequency.welch import welch
+
+
+def test_welch():
+    # setup
+    sampling_frequency = 100
+    time = np.arange(1000) / sampling_frequency
+    values = np.sin(2 * np.pi * 10 * time)
+
+    # run
+    amplitude_values, frequency_values = welch(values, sampling_frequency, nperseg=100)
+
+    # assert
+    assert amplitude_values.shape == (51, )
+    assert frequency_values.shape == (51, )
+    assert frequency_values[np.argmax(amplitude_values)] == 10
+
+
+def test_welch_short_signal():
+    # run
+    amplitude_values, frequency_values = welch(list(range(100)), 10)
+
+    # assert
+    assert amplitude_values.shape == (51, )
+    assert frequency_values.shape == (51, )
+
+
+def test_welch_batched():
+    # setup
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=(3, 512)).astype(np.float32)
+
+    # run
+    amplitude_values, frequency_values = welch(values, 100, nperseg=64, noverlap=16)
+
+    # assert
+    assert amplitude_values.shape == (3, 33)
+    assert amplitude_values.dtype == np.float32
+    assert frequency_values.shape == (33, )
+    for row, expected_row in zip(values, amplitude_values):
+        result, _ = welch(row, 100, nperseg=64, noverlap=16)
+        np.testing.assert_array_almost_equal(result, expected_row)